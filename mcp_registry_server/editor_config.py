@@ -16,6 +16,12 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Editor name -> (config path getter, key holding the MCP server table)
+_EDITOR_CONFIG_SPECS: dict[str, tuple[str, str]] = {
+    "zed": ("get_zed_config_path", "context_servers"),
+    "claude": ("get_claude_config_path", "mcpServers"),
+}
+
 
 class EditorConfigManager:
     """Manages MCP server configuration for various editors."""
@@ -306,15 +312,12 @@ Restart Claude Desktop for changes to take effect.
         Returns:
             Dictionary of configured servers
         """
-        if editor.lower() == "zed":
-            config_path = self.get_zed_config_path()
-            key = "context_servers"
-        elif editor.lower() == "claude":
-            config_path = self.get_claude_config_path()
-            key = "mcpServers"
-        else:
+        spec = _EDITOR_CONFIG_SPECS.get(editor.lower())
+        if spec is None:
             raise ValueError(f"Unsupported editor: {editor}")
 
+        path_getter, key = spec
+        config_path = getattr(self, path_getter)()
         if not config_path.exists():
             return {}
 
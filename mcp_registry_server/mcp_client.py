@@ -7,6 +7,9 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Default cap on concurrent tools/call requests in flight to one server
+DEFAULT_MAX_CONCURRENT_CALLS = 8
+
 
 class MCPClient:
     """Simplified MCP protocol client for tool execution.
@@ -22,26 +25,78 @@ class MCPClient:
     resource management, prompts, etc.
     """
 
-    def __init__(self, process: asyncio.subprocess.Process):
+    def __init__(
+        self,
+        process: asyncio.subprocess.Process,
+        max_concurrent_calls: int = DEFAULT_MAX_CONCURRENT_CALLS,
+    ):
         """Initialize MCP client with a process.
 
         Args:
             process: subprocess with stdin/stdout for MCP communication
+            max_concurrent_calls: Maximum tool calls in flight to the server at once
         """
         self.process = process
         self._request_id = 0
         self._initialized = False
+        # Responses are matched to requests by JSON-RPC id so several requests can be
+        # in flight at once; whichever caller holds the read lock reads stdout and
+        # resolves the futures of the others.
+        self._pending: dict[int, asyncio.Future[dict[str, Any]]] = {}
+        self._read_lock = asyncio.Lock()
+        # Bounds tool calls so bursts queue here instead of overloading the server
+        self._call_slots = asyncio.Semaphore(max_concurrent_calls)
 
     def _next_id(self) -> int:
         """Get next request ID."""
         self._request_id += 1
         return self._request_id
 
+    async def _read_one(self) -> None:
+        """Read one message from stdout and resolve the matching pending request.
+
+        If the server closed its stdout, every pending request fails instead.
+        """
+        response_line = await self.process.stdout.readline()
+        if not response_line:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(RuntimeError("MCP server closed connection"))
+            return
+
+        try:
+            message = json.loads(response_line)
+        except json.JSONDecodeError as e:
+            logger.warning(f"Ignoring non-JSON line from MCP server: {e}")
+            return
+
+        message_id = message.get("id") if isinstance(message, dict) else None
+        future = self._pending.get(message_id) if isinstance(message_id, int) else None
+        if future is None or "method" in message:
+            # Notification or server-initiated request; nothing is waiting for it
+            logger.debug(f"Ignoring unsolicited MCP message: {message}")
+            return
+
+        logger.debug(f"Received MCP response: {message}")
+        if not future.done():
+            future.set_result(message)
+
+    async def _await_response(self, future: asyncio.Future[dict[str, Any]]) -> dict[str, Any]:
+        """Read stdout until ``future`` is resolved, sharing the reader with other callers."""
+        while not future.done():
+            async with self._read_lock:
+                if future.done():
+                    break
+                await self._read_one()
+        return future.result()
+
     async def _send_request(
         self, method: str, params: dict[str, Any] | None = None
     ) -> dict[str, Any]:
         """Send a JSON-RPC request and wait for response.
 
+        Safe to call concurrently; responses are matched to requests by id.
+
         Args:
             method: JSON-RPC method name
             params: Optional parameters dict
@@ -68,39 +123,34 @@ class MCPClient:
         request_json = json.dumps(request) + "\n"
         logger.debug(f"Sending MCP request: {request_json.strip()}")
 
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
         try:
-            self.process.stdin.write(request_json.encode())
-            await self.process.stdin.drain()
-        except Exception as e:
-            logger.error(f"Failed to send MCP request: {e}")
-            raise RuntimeError(f"Failed to send request: {e}")
-
-        # Read response
-        try:
-            response_line = await asyncio.wait_for(
-                self.process.stdout.readline(), timeout=30.0
-            )
-            if not response_line:
-                raise RuntimeError("MCP server closed connection")
-
-            response = json.loads(response_line.decode())
-            logger.debug(f"Received MCP response: {response}")
-
-            # Check for error
-            if "error" in response:
-                error = response["error"]
-                raise RuntimeError(
-                    f"MCP error: {error.get('message', 'Unknown error')}"
-                )
-
-            return response.get("result", {})
+            try:
+                self.process.stdin.write(request_json.encode())
+                await self.process.stdin.drain()
+            except Exception as e:
+                logger.error(f"Failed to send MCP request: {e}")
+                raise RuntimeError(f"Failed to send request: {e}")
 
-        except asyncio.TimeoutError:
-            logger.error("MCP request timed out")
-            raise RuntimeError("Request timed out")
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse MCP response: {e}")
-            raise RuntimeError(f"Invalid JSON response: {e}")
+            # Read response
+            try:
+                response = await asyncio.wait_for(self._await_response(future), timeout=30.0)
+            except asyncio.TimeoutError:
+                logger.error("MCP request timed out")
+                raise RuntimeError("Request timed out")
+        finally:
+            self._pending.pop(request_id, None)
+            if future.done() and not future.cancelled():
+                # Consume the outcome so a cancelled caller doesn't leave it unretrieved
+                future.exception()
+
+        # Check for error
+        if "error" in response:
+            error = response["error"]
+            raise RuntimeError(f"MCP error: {error.get('message', 'Unknown error')}")
+
+        return response.get("result", {})
 
     async def initialize(self) -> dict[str, Any]:
         """Initialize the MCP connection.
@@ -177,6 +227,10 @@ class MCPClient:
     async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
         """Call a tool on the MCP server.
 
+        At most ``max_concurrent_calls`` calls are in flight at once; further callers
+        wait for a slot. Each request still times out after 30 seconds, so a stuck
+        call cannot hold its slot indefinitely.
+
         Args:
             tool_name: Name of the tool to call
             arguments: Tool arguments as a dict
@@ -187,9 +241,10 @@ class MCPClient:
         if not self._initialized:
             await self.initialize()
 
-        result = await self._send_request(
-            "tools/call", {"name": tool_name, "arguments": arguments}
-        )
+        async with self._call_slots:
+            result = await self._send_request(
+                "tools/call", {"name": tool_name, "arguments": arguments}
+            )
 
         # Extract content from result
         content = result.get("content", [])
@@ -231,15 +286,28 @@ class MCPClientManager:
     def get_client(self, container_id: str) -> MCPClient | None:
         """Get MCP client for a container.
 
+        Clients whose server process has exited are dropped here, so callers fail
+        fast instead of writing to a dead pipe and waiting for a timeout.
+
         Args:
             container_id: Container identifier
 
         Returns:
-            MCP client if found, None otherwise
+            MCP client if found and its process is alive, None otherwise
         """
-        if container_id in self._clients:
-            return self._clients[container_id][0]
-        return None
+        registered = self._clients.get(container_id)
+        if registered is None:
+            return None
+
+        client, process = registered
+        if process.returncode is not None:
+            logger.warning(
+                f"MCP server for {container_id} exited with code {process.returncode}; "
+                f"dropping its client"
+            )
+            del self._clients[container_id]
+            return None
+        return client
 
     async def remove_client(self, container_id: str):
         """Remove and close MCP client for a container.
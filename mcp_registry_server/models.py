@@ -1,11 +1,32 @@
 """Pydantic models for MCP registry entries and configuration."""
 
+import re
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
 from pydantic import BaseModel, Field, field_validator
 
+# Allowlist of environment variable prefixes for active servers (can be expanded)
+_ALLOWED_ENV_PREFIXES: tuple[str, ...] = (
+    "API_KEY",
+    "API_TOKEN",
+    "AUTH_",
+    "DATABASE_",
+    "DB_",
+    "GITHUB_",
+    "OPENAI_",
+    "ANTHROPIC_",
+    "AWS_",
+    "AZURE_",
+    "GCP_",
+    "SLACK_",
+    "DISCORD_",
+    "NOTION_",
+    "MCP_",
+)
+_ENV_PREFIX_RE = re.compile("|".join(map(re.escape, _ALLOWED_ENV_PREFIXES)))
+
 
 class ServerCommand(BaseModel):
     """Command configuration for running an MCP server via stdio."""
@@ -239,30 +260,11 @@ class ConfigSetRequest(BaseModel):
     @classmethod
     def validate_env_keys(cls, v: dict[str, str]) -> dict[str, str]:
         """Validate environment variable names."""
-        # Allowlist common patterns (can be expanded)
-        allowed_prefixes = [
-            "API_KEY",
-            "API_TOKEN",
-            "AUTH_",
-            "DATABASE_",
-            "DB_",
-            "GITHUB_",
-            "OPENAI_",
-            "ANTHROPIC_",
-            "AWS_",
-            "AZURE_",
-            "GCP_",
-            "SLACK_",
-            "DISCORD_",
-            "NOTION_",
-            "MCP_",
-        ]
-
-        for key in v.keys():
-            if not any(key.upper().startswith(prefix) for prefix in allowed_prefixes):
+        for key in v:
+            if _ENV_PREFIX_RE.match(key.upper()) is None:
                 raise ValueError(
                     f"Environment variable '{key}' not in allowlist. "
-                    f"Allowed prefixes: {', '.join(allowed_prefixes)}"
+                    f"Allowed prefixes: {', '.join(_ALLOWED_ENV_PREFIXES)}"
                 )
         return v
 
@@ -11,6 +11,9 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on podman CLI processes spawned at once when tearing containers down
+_CLEANUP_CONCURRENCY = 8
+
 
 @dataclass
 class ContainerInfo:
@@ -55,12 +58,20 @@ class PodmanRunner:
     async def pull_image(self, image: str) -> bool:
         """Pull a container image if not present.
 
+        Digest-pinned references that are already in local storage are not pulled
+        again, since their content cannot change. Tags such as ``:latest`` are always
+        pulled so they pick up updates.
+
         Args:
             image: Image reference (e.g., docker.io/mcp/postgres)
 
         Returns:
             True if successful
         """
+        if "@" in image and await self._image_exists(image):
+            logger.debug(f"Digest-pinned image already present: {image}")
+            return True
+
         logger.info(f"Pulling image: {image}")
         try:
             proc = await asyncio.create_subprocess_exec(
@@ -82,6 +93,29 @@ class PodmanRunner:
             logger.error(f"Exception pulling image {image}: {e}")
             return False
 
+    async def _image_exists(self, image: str) -> bool:
+        """Check whether an image is present in local storage.
+
+        Args:
+            image: Image reference
+
+        Returns:
+            True if ``podman image exists`` finds the image
+        """
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "podman",
+                "image",
+                "exists",
+                image,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            return await proc.wait() == 0
+        except Exception as e:
+            logger.debug(f"Could not check for image {image}: {e}")
+            return False
+
     async def run_container(
         self,
         image: str,
@@ -491,15 +525,17 @@ class PodmanRunner:
             Number of containers cleaned up
         """
         container_ids = list(self._running_containers.keys())
-        cleaned = 0
+        semaphore = asyncio.Semaphore(_CLEANUP_CONCURRENCY)
 
-        for container_id in container_ids:
-            if await self.stop_container(container_id):
-                cleaned += 1
-            else:
+        async def _cleanup(container_id: str) -> bool:
+            async with semaphore:
+                if await self.stop_container(container_id):
+                    return True
                 # Try force kill if graceful stop fails
-                if await self.kill_container(container_id):
-                    cleaned += 1
+                return await self.kill_container(container_id)
+
+        results = await asyncio.gather(*(_cleanup(cid) for cid in container_ids))
+        cleaned = sum(results)
 
         logger.info(f"Cleaned up {cleaned} containers")
         return cleaned
@@ -4,10 +4,12 @@ import asyncio
 import json
 import logging
 from datetime import datetime, timedelta
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
-from pydantic import ValidationError
+import orjson
+from pydantic import BaseModel, Field, ValidationError
 from rapidfuzz import fuzz, process
 
 from .models import (
@@ -23,6 +25,12 @@ from .models import (
 logger = logging.getLogger(__name__)
 
 
+class _EntriesCache(BaseModel):
+    """On-disk layout of registry_entries.json (extra keys are ignored)."""
+
+    entries: list[RegistryEntry] = Field(default_factory=list)
+
+
 class Registry:
     """Central registry for MCP servers with search and management."""
 
@@ -50,6 +58,7 @@ class Registry:
         # In-memory storage
         self._entries: dict[str, RegistryEntry] = {}
         self._active_mounts: dict[str, ActiveMount] = {}
+        self._mounts_by_prefix: dict[str, ActiveMount] = {}  # tool prefix -> mount
         self._source_status: dict[SourceType, SourceRefreshStatus] = {}
 
         # Search index (for fuzzy matching)
@@ -58,9 +67,6 @@ class Registry:
         # Locks for thread safety
         self._entries_lock = asyncio.Lock()
         self._mounts_lock = asyncio.Lock()
-        self._refresh_locks: dict[SourceType, asyncio.Lock] = {
-            source: asyncio.Lock() for source in SourceType
-        }
 
         # Load persisted data
         self._load_entries_from_cache()
@@ -74,15 +80,19 @@ class Registry:
             return
 
         try:
-            with open(cache_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            for entry_data in data.get("entries", []):
-                try:
-                    entry = RegistryEntry(**entry_data)
-                    self._entries[entry.id] = entry
-                except ValidationError as e:
-                    logger.warning(f"Failed to load entry {entry_data.get('id')}: {e}")
+            raw = cache_file.read_bytes()
+            try:
+                # Fast path: parse and build every entry in pydantic-core in one pass
+                entries = _EntriesCache.model_validate_json(raw).entries
+                self._entries.update((entry.id, entry) for entry in entries)
+            except ValidationError:
+                # Some entry is invalid; fall back to per-entry loading to skip just those
+                for entry_data in json.loads(raw).get("entries", []):
+                    try:
+                        entry = RegistryEntry(**entry_data)
+                        self._entries[entry.id] = entry
+                    except ValidationError as e:
+                        logger.warning(f"Failed to load entry {entry_data.get('id')}: {e}")
 
             logger.info(f"Loaded {len(self._entries)} entries from cache")
             self._rebuild_search_index()
@@ -90,15 +100,18 @@ class Registry:
             logger.error(f"Failed to load cached entries: {e}")
 
     def _save_entries_to_cache(self) -> None:
-        """Persist registry entries to disk."""
+        """Persist registry entries to disk.
+
+        Serializing thousands of entries takes long enough to stall the event loop,
+        so async callers run this in a worker thread while holding ``_entries_lock``.
+        """
         cache_file = self.cache_dir / "registry_entries.json"
         try:
             data = {
                 "entries": [entry.model_dump(mode="json") for entry in self._entries.values()],
                 "updated_at": datetime.utcnow().isoformat(),
             }
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            cache_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
             logger.debug(f"Saved {len(self._entries)} entries to cache")
         except Exception as e:
             logger.error(f"Failed to save entries to cache: {e}")
@@ -111,13 +124,13 @@ class Registry:
             return
 
         try:
-            with open(mounts_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = orjson.loads(mounts_file.read_bytes())
 
             for mount_data in data.get("mounts", []):
                 try:
                     mount = ActiveMount(**mount_data)
                     self._active_mounts[mount.entry_id] = mount
+                    self._mounts_by_prefix[mount.prefix] = mount
                 except ValidationError as e:
                     logger.warning(f"Failed to load active mount {mount_data.get('entry_id')}: {e}")
 
@@ -133,8 +146,8 @@ class Registry:
                 "mounts": [mount.model_dump(mode="json") for mount in self._active_mounts.values()],
                 "updated_at": datetime.utcnow().isoformat(),
             }
-            with open(mounts_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Rewritten on every add/remove/config change; orjson keeps that cheap
+            mounts_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
             logger.debug(f"Saved {len(self._active_mounts)} active mounts")
         except Exception as e:
             logger.error(f"Failed to save active mounts: {e}")
@@ -161,7 +174,7 @@ class Registry:
         async with self._entries_lock:
             self._entries[entry.id] = entry
             self._rebuild_search_index()
-            self._save_entries_to_cache()
+            await asyncio.to_thread(self._save_entries_to_cache)
             logger.info(f"Added/updated entry: {entry.id} ({entry.name})")
 
     async def bulk_add_entries(self, entries: list[RegistryEntry]) -> int:
@@ -177,7 +190,7 @@ class Registry:
             for entry in entries:
                 self._entries[entry.id] = entry
             self._rebuild_search_index()
-            self._save_entries_to_cache()
+            await asyncio.to_thread(self._save_entries_to_cache)
             logger.info(f"Bulk added {len(entries)} entries")
             return len(entries)
 
@@ -257,12 +270,12 @@ class Registry:
             candidates = [e for e in candidates if e.source in query.sources]
 
         if query.categories:
-            candidates = [
-                e for e in candidates if any(cat in e.categories for cat in query.categories)
-            ]
+            wanted_categories = set(query.categories)
+            candidates = [e for e in candidates if not wanted_categories.isdisjoint(e.categories)]
 
         if query.tags:
-            candidates = [e for e in candidates if any(tag in e.tags for tag in query.tags)]
+            wanted_tags = set(query.tags)
+            candidates = [e for e in candidates if not wanted_tags.isdisjoint(e.tags)]
 
         if query.official_only:
             candidates = [e for e in candidates if e.official]
@@ -273,10 +286,18 @@ class Registry:
         if query.requires_api_key is not None:
             candidates = [e for e in candidates if e.requires_api_key == query.requires_api_key]
 
+        text = query.query.strip()
+
+        # An exact entry ID needs no fuzzy matching
+        exact = self._entries.get(text)
+        if exact is not None and any(e is exact for e in candidates):
+            return [exact]
+
         # Fuzzy text search with popularity ranking
-        if query.query.strip():
+        if text:
             scored_results: list[tuple[RegistryEntry, float]] = []
             seen_ids = set()
+            candidate_ids = {e.id for e in candidates}
 
             # Search in indexed fields
             search_texts = [item[0] for item in self._search_index]
@@ -293,7 +314,7 @@ class Registry:
                 _, field_type, entry = self._search_index[idx]
                 if entry.id in seen_ids:
                     continue
-                if entry in candidates:  # Must pass filters
+                if entry.id in candidate_ids:  # Must pass filters
                     # Combine fuzzy match score with popularity score
                     # Fuzzy score is 0-100, popularity is 0-40+
                     # Weight fuzzy match more heavily (60%) vs popularity (40%)
@@ -320,12 +341,37 @@ class Registry:
         """List all registry entries.
 
         Args:
-            limit: Maximum number of entries to return
+            limit: Maximum number of entries to return (negative values return none)
 
         Returns:
             List of registry entries
         """
-        return list(self._entries.values())[:limit]
+        return list(islice(self._entries.values(), max(limit, 0)))
+
+    async def list_page(
+        self, limit: int, source_type: SourceType | None = None
+    ) -> tuple[list[RegistryEntry], int]:
+        """List up to ``limit`` entries together with the unpaginated total.
+
+        Args:
+            limit: Maximum number of entries to return (negative values return none)
+            source_type: Optional source to filter by
+
+        Returns:
+            Tuple of (entries, total matching entries)
+        """
+        limit = max(limit, 0)
+        if source_type is None:
+            return list(islice(self._entries.values(), limit)), len(self._entries)
+
+        page: list[RegistryEntry] = []
+        total = 0
+        for entry in self._entries.values():
+            if entry.source == source_type:
+                if total < limit:
+                    page.append(entry)
+                total += 1
+        return page, total
 
     async def add_active_mount(self, mount: ActiveMount) -> None:
         """Add an active mount.
@@ -335,6 +381,7 @@ class Registry:
         """
         async with self._mounts_lock:
             self._active_mounts[mount.entry_id] = mount
+            self._mounts_by_prefix[mount.prefix] = mount
             self._save_active_mounts()
             logger.info(f"Mounted server: {mount.name} (prefix: {mount.prefix})")
 
@@ -350,6 +397,13 @@ class Registry:
         async with self._mounts_lock:
             mount = self._active_mounts.pop(entry_id, None)
             if mount:
+                if self._mounts_by_prefix.get(mount.prefix) is mount:
+                    del self._mounts_by_prefix[mount.prefix]
+                    # Re-point the prefix at any other mount still using it
+                    for other in self._active_mounts.values():
+                        if other.prefix == mount.prefix:
+                            self._mounts_by_prefix[other.prefix] = other
+                            break
                 self._save_active_mounts()
                 logger.info(f"Unmounted server: {mount.name}")
             return mount
@@ -365,6 +419,30 @@ class Registry:
         """
         return self._active_mounts.get(entry_id)
 
+    async def get_mount_by_prefix(self, prefix: str) -> ActiveMount | None:
+        """Get an active mount by its tool prefix.
+
+        Args:
+            prefix: Tool prefix the mount was activated with
+
+        Returns:
+            Active mount or None if no mount uses the prefix
+        """
+        return self._mounts_by_prefix.get(prefix)
+
+    async def get_entry_and_mount(
+        self, entry_id: str
+    ) -> tuple[RegistryEntry | None, ActiveMount | None]:
+        """Get a registry entry and its active mount in a single call.
+
+        Args:
+            entry_id: Entry identifier
+
+        Returns:
+            Tuple of (entry or None, active mount or None)
+        """
+        return self._entries.get(entry_id), self._active_mounts.get(entry_id)
+
     async def list_active_mounts(self) -> list[ActiveMount]:
         """List all active mounts.
 
@@ -390,7 +468,7 @@ class Registry:
             if mount:
                 mount.environment.update(environment)
                 self._save_active_mounts()
-                logger.info(f"Updated environment for {mount.name}: {list(environment.keys())}")
+                logger.info(f"Updated environment for {mount.name}: {', '.join(environment)}")
             return mount
 
     async def get_status(self) -> RegistryStatus:
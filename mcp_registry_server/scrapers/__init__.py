@@ -1,7 +1,12 @@
 """Scrapers for external MCP registry sources."""
 
 from .docker_registry import scrape_docker_registry
-from .github_utils import fetch_github_metadata, fetch_github_stars
+from .github_utils import (
+    GitHubStarsStore,
+    fetch_github_metadata,
+    fetch_github_stars,
+    populate_github_stars,
+)
 from .mcp_official_registry import scrape_mcp_official_registry
 from .mcpservers_scraper import scrape_mcpservers_org
 
@@ -11,4 +16,6 @@ __all__ = [
     "scrape_mcp_official_registry",
     "fetch_github_stars",
     "fetch_github_metadata",
+    "populate_github_stars",
+    "GitHubStarsStore",
 ]
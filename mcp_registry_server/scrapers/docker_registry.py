@@ -10,7 +10,7 @@ from git import Repo
 from git.exc import GitCommandError
 
 from ..models import LaunchMethod, RegistryEntry, SourceType
-from .github_utils import fetch_github_stars
+from .github_utils import populate_github_stars
 
 logger = logging.getLogger(__name__)
 
@@ -216,11 +216,7 @@ async def scrape_docker_registry(
     if fetch_github_stars_flag and entries:
         logger.info(f"Fetching GitHub stars for {len(entries)} Docker registry entries")
         async with httpx.AsyncClient(timeout=5.0) as client:
-            for entry in entries:
-                if entry.repo_url:
-                    stars = await fetch_github_stars(entry.repo_url, client)
-                    if stars is not None:
-                        entry.raw_metadata["github_stars"] = stars
+            await populate_github_stars(entries, client)
 
     logger.info(
         f"Scraped {len(entries)} entries from Docker MCP registry "
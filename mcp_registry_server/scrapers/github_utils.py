@@ -1,16 +1,85 @@
 """Shared utilities for fetching GitHub metadata."""
 
+import asyncio
 import logging
+import os
 import re
+import sqlite3
+import time
+import weakref
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
 from typing import Any
 
 import httpx
+from aiolimiter import AsyncLimiter
+
+from ..models import RegistryEntry
 
 logger = logging.getLogger(__name__)
 
 # GitHub API endpoint for repository info
 GITHUB_API_URL = "https://api.github.com/repos/{owner}/{repo}"
 
+# Persistent stars snapshot shared by all scrapers
+DEFAULT_STARS_DB = Path.home() / ".cache" / "mcp-registry" / "stars.sqlite"
+DEFAULT_STARS_TTL_SECONDS = 24 * 3600
+
+# Pace GitHub API calls to the quota of the credentials in use: anonymous requests get
+# 60/hour, while a GITHUB_TOKEN is paced below the 5000/hour authenticated quota so
+# bursts from several scrapers never trip secondary rate limits. AsyncLimiter is
+# bound to the loop it first runs on, so keep one per event loop.
+_GH_ANON_RATE = 60
+_GH_TOKEN_RATE = 4500
+_GH_RATE_PERIOD_SECONDS = 3600
+_gh_limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncLimiter]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Epoch seconds until which the quota is known to be exhausted (from X-RateLimit-* headers)
+_rate_limit_reset_at = 0.0
+
+
+async def _github_get(
+    client: httpx.AsyncClient, url: str, **kwargs: Any
+) -> httpx.Response | None:
+    """GET a GitHub API URL through the shared rate limiter.
+
+    Sends ``GITHUB_TOKEN`` as a bearer token when it is set in the environment.
+    Returns None without making a request while the quota reported by GitHub's
+    ``X-RateLimit-Remaining``/``X-RateLimit-Reset`` headers is exhausted.
+    """
+    global _rate_limit_reset_at
+
+    if time.time() < _rate_limit_reset_at:
+        return None
+
+    token = os.environ.get("GITHUB_TOKEN")
+    if token:
+        kwargs["headers"] = {**(kwargs.get("headers") or {}), "Authorization": f"Bearer {token}"}
+
+    loop = asyncio.get_running_loop()
+    limiter = _gh_limiters.get(loop)
+    if limiter is None:
+        limiter = _gh_limiters[loop] = AsyncLimiter(
+            max_rate=_GH_TOKEN_RATE if token else _GH_ANON_RATE,
+            time_period=_GH_RATE_PERIOD_SECONDS,
+        )
+
+    async with limiter:
+        response = await client.get(url, **kwargs)
+
+    remaining = response.headers.get("X-RateLimit-Remaining")
+    reset = response.headers.get("X-RateLimit-Reset")
+    if remaining == "0" and reset and reset.isdigit():
+        _rate_limit_reset_at = float(reset)
+        logger.warning(
+            f"GitHub API quota exhausted; skipping GitHub calls until "
+            f"{time.strftime('%H:%M:%S', time.localtime(_rate_limit_reset_at))}"
+        )
+    return response
+
 
 def extract_github_owner_repo(url: str) -> tuple[str, str] | None:
     """
@@ -42,6 +111,185 @@ def extract_github_owner_repo(url: str) -> tuple[str, str] | None:
     return None
 
 
+class GitHubStarsStore:
+    """On-disk snapshot of GitHub star counts.
+
+    Rows are keyed by ``owner/repo`` and carry the ETag returned by GitHub so
+    expired rows can be revalidated with a conditional request (a 304 does not
+    count against the rate limit).
+    """
+
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        ttl_seconds: float = DEFAULT_STARS_TTL_SECONDS,
+    ):
+        """Initialize the store.
+
+        Args:
+            db_path: SQLite database file (default: ~/.cache/mcp-registry/stars.sqlite)
+            ttl_seconds: Age after which a row must be revalidated against GitHub
+        """
+        self.db_path = db_path or DEFAULT_STARS_DB
+        self.ttl_seconds = ttl_seconds
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS stars ("
+                "repo TEXT PRIMARY KEY, stars INT, etag TEXT, fetched_at REAL)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, committing on success and always closing it."""
+        conn = sqlite3.connect(self.db_path, timeout=5.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def load_fresh(self) -> dict[str, int]:
+        """Load star counts that are still within the TTL.
+
+        Returns:
+            Mapping of ``owner/repo`` to star count
+        """
+        cutoff = time.time() - self.ttl_seconds
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT repo, stars FROM stars WHERE fetched_at > ?", (cutoff,)
+            ).fetchall()
+        return dict(rows)
+
+    def load_etags(self) -> dict[str, tuple[int, str]]:
+        """Load cached star counts and ETags for conditional revalidation.
+
+        Returns:
+            Mapping of ``owner/repo`` to ``(stars, etag)``
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT repo, stars, etag FROM stars WHERE etag IS NOT NULL"
+            ).fetchall()
+        return {repo: (stars, etag) for repo, stars, etag in rows}
+
+    def save(self, rows: Iterable[tuple[str, int, str | None, float]]) -> None:
+        """Upsert ``(repo, stars, etag, fetched_at)`` rows.
+
+        Args:
+            rows: Rows to insert or replace
+        """
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT INTO stars (repo, stars, etag, fetched_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(repo) DO UPDATE SET "
+                "stars=excluded.stars, etag=excluded.etag, fetched_at=excluded.fetched_at",
+                rows,
+            )
+
+
+async def _fetch_stars_conditional(
+    owner: str,
+    repo: str,
+    client: httpx.AsyncClient,
+    etag: str | None = None,
+    timeout: float = 5.0,
+) -> tuple[int | None, str | None, bool]:
+    """Fetch stars, sending ``If-None-Match`` when an ETag is known.
+
+    Returns:
+        Tuple of (stars, etag, not_modified)
+    """
+    headers = {"If-None-Match": etag} if etag else None
+    try:
+        url = GITHUB_API_URL.format(owner=owner, repo=repo)
+        response = await _github_get(client, url, headers=headers, timeout=timeout)
+
+        if response is None:
+            logger.debug(f"GitHub API quota exhausted, skipping {owner}/{repo}")
+        elif response.status_code == 304:
+            logger.debug(f"Stars unchanged for {owner}/{repo}")
+            return None, etag, True
+        elif response.status_code == 200:
+            stars = response.json().get("stargazers_count", 0)
+            logger.debug(f"Fetched {stars} stars for {owner}/{repo}")
+            return stars, response.headers.get("ETag"), False
+        elif response.status_code == 403:
+            logger.warning(f"GitHub API rate limit hit for {owner}/{repo}")
+        else:
+            logger.debug(f"GitHub API returned {response.status_code} for {owner}/{repo}")
+    except httpx.TimeoutException:
+        logger.debug(f"Timeout fetching GitHub stars for {owner}/{repo}")
+    except Exception as e:
+        logger.debug(f"Failed to fetch GitHub stars for {owner}/{repo}: {e}")
+    return None, None, False
+
+
+def _load_stars_snapshot(
+    store: GitHubStarsStore | None,
+) -> tuple[GitHubStarsStore, dict[str, int], dict[str, tuple[int, str]]]:
+    """Open the stars store (creating it if needed) and load its fresh rows and ETags."""
+    store = store or GitHubStarsStore()
+    return store, store.load_fresh(), store.load_etags()
+
+
+async def populate_github_stars(
+    entries: list[RegistryEntry],
+    client: httpx.AsyncClient,
+    store: GitHubStarsStore | None = None,
+) -> None:
+    """Set ``raw_metadata["github_stars"]`` on entries, reusing the on-disk snapshot.
+
+    Fresh rows are served from the store without any HTTP call; expired rows are
+    revalidated with their ETag; the rest are fetched and written back in one batch.
+
+    Args:
+        entries: Entries to annotate in place
+        client: HTTP client to use for cache misses
+        store: Stars snapshot (default: shared store in the user cache dir)
+    """
+    # SQLite calls can block for up to the connection timeout on a locked database,
+    # so the store is opened, read and written in a worker thread
+    try:
+        store, fresh, etags = await asyncio.to_thread(_load_stars_snapshot, store)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"GitHub stars cache unavailable, fetching all: {e}")
+        store, fresh, etags = None, {}, {}
+
+    rows: dict[str, tuple[str, int, str | None, float]] = {}
+    for entry in entries:
+        if not entry.repo_url:
+            continue
+        parsed = extract_github_owner_repo(entry.repo_url)
+        if not parsed:
+            continue
+        key = "/".join(parsed).lower()
+
+        if key in fresh:
+            entry.raw_metadata["github_stars"] = fresh[key]
+            continue
+
+        cached_stars, etag = etags.get(key, (None, None))
+        stars, new_etag, not_modified = await _fetch_stars_conditional(*parsed, client, etag)
+        if not_modified:
+            stars = cached_stars
+        if stars is None:
+            continue
+
+        entry.raw_metadata["github_stars"] = stars
+        fresh[key] = stars
+        rows[key] = (key, stars, new_etag, time.time())
+
+    if store and rows:
+        try:
+            await asyncio.to_thread(store.save, list(rows.values()))
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Failed to persist GitHub stars: {e}")
+
+
 async def fetch_github_stars(
     repo_url: str,
     client: httpx.AsyncClient,
@@ -66,9 +314,12 @@ async def fetch_github_stars(
 
     try:
         url = GITHUB_API_URL.format(owner=owner, repo=repo)
-        response = await client.get(url, timeout=timeout)
+        response = await _github_get(client, url, timeout=timeout)
 
-        if response.status_code == 200:
+        if response is None:
+            logger.debug(f"GitHub API quota exhausted, skipping {owner}/{repo}")
+            return None
+        elif response.status_code == 200:
             data = response.json()
             stars = data.get("stargazers_count", 0)
             logger.debug(f"Fetched {stars} stars for {owner}/{repo}")
@@ -122,9 +373,12 @@ async def fetch_github_metadata(
 
     try:
         url = GITHUB_API_URL.format(owner=owner, repo=repo)
-        response = await client.get(url, timeout=timeout)
+        response = await _github_get(client, url, timeout=timeout)
 
-        if response.status_code == 200:
+        if response is None:
+            logger.debug(f"GitHub API quota exhausted, skipping {owner}/{repo}")
+            return None
+        elif response.status_code == 200:
             data = response.json()
             metadata = {
                 "stars": data.get("stargazers_count", 0),
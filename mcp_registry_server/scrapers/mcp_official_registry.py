@@ -5,19 +5,87 @@ Fetches server metadata from the official MCP Registry at registry.modelcontextp
 """
 
 import asyncio
+import functools
 import logging
+from operator import itemgetter
 from typing import Any
 
 import httpx
+import orjson
 
 from ..models import LaunchMethod, RegistryEntry, SourceType
-from .github_utils import fetch_github_stars
+from .github_utils import populate_github_stars
 
 logger = logging.getLogger(__name__)
 
 # Official MCP Registry API endpoint
 REGISTRY_API_URL = "https://registry.modelcontextprotocol.io/v0/servers"
 
+# Fields projected out of each server/meta record in one C-level call.
+# Defaults are only merged in when a record is missing one of the keys.
+_SERVER_DEFAULTS: dict[str, Any] = {
+    "name": "",
+    "description": "",
+    "version": "",
+    "repository": {},
+    "packages": [],
+    "remotes": [],
+    "$schema": None,
+}
+_META_DEFAULTS: dict[str, Any] = {
+    "status": None,
+    "isLatest": False,
+    "publishedAt": None,
+    "updatedAt": None,
+    "serverId": None,
+    "versionId": None,
+}
+_server_fields = itemgetter(*_SERVER_DEFAULTS)
+_meta_fields = itemgetter(*_META_DEFAULTS)
+
+# Namespaced key holding the registry's own metadata under "_meta"
+_OFFICIAL_META_KEY = "io.modelcontextprotocol.registry/official"
+
+# Maps "." and "/" to "-" in one pass when building entry IDs
+_ID_SEPARATORS = str.maketrans("./", "--")
+
+# Common technology keywords to look for in descriptions
+_TAG_KEYWORDS = (
+    "github",
+    "gitlab",
+    "database",
+    "sql",
+    "api",
+    "web",
+    "search",
+    "file",
+    "cloud",
+    "aws",
+    "azure",
+    "gcp",
+    "docker",
+    "kubernetes",
+    "ai",
+    "ml",
+    "data",
+    "analytics",
+    "security",
+    "auth",
+    "slack",
+    "discord",
+    "notion",
+    "openai",
+    "anthropic",
+)
+
+
+def _project(record: dict[str, Any], getter: itemgetter, defaults: dict[str, Any]) -> tuple:
+    """Extract fields with ``getter``, falling back to ``defaults`` for missing keys."""
+    try:
+        return getter(record)
+    except KeyError:
+        return getter({**defaults, **record})
+
 
 async def scrape_mcp_official_registry(
     limit: int | None = None,
@@ -52,27 +120,17 @@ async def scrape_mcp_official_registry(
             response = await client.get(url)
             response.raise_for_status()
 
-            data = response.json()
+            # Payload is several MB; orjson decodes it several times faster than stdlib json
+            data = orjson.loads(response.content)
             servers = data.get("servers", [])
 
             logger.info(f"Retrieved {len(servers)} servers from MCP Official Registry")
 
-            for server_data in servers:
-                try:
-                    entry = _normalize_server(server_data)
-                    if entry:
-                        # Fetch GitHub stars if enabled and repo URL exists
-                        if fetch_github_stars_flag and entry.repo_url:
-                            stars = await fetch_github_stars(entry.repo_url, client)
-                            if stars is not None:
-                                entry.raw_metadata["github_stars"] = stars
-                        entries.append(entry)
-                except Exception as e:
-                    server_name = server_data.get("server", {}).get("name", "unknown")
-                    logger.warning(
-                        f"Failed to normalize server {server_name}: {e}",
-                        exc_info=True,
-                    )
+            entries = [e for s in servers if (e := _safe_normalize_server(s)) is not None]
+
+            # Fetch GitHub stars if enabled (served from the on-disk snapshot when fresh)
+            if fetch_github_stars_flag and entries:
+                await populate_github_stars(entries, client)
 
     except httpx.HTTPError as e:
         logger.error(f"HTTP error fetching MCP Official Registry: {e}", exc_info=True)
@@ -85,6 +143,16 @@ async def scrape_mcp_official_registry(
     return entries
 
 
+def _safe_normalize_server(server_data: dict[str, Any]) -> RegistryEntry | None:
+    """Normalize a server entry, logging and skipping it on failure."""
+    try:
+        return _normalize_server(server_data)
+    except Exception as e:
+        server_name = server_data.get("server", {}).get("name", "unknown")
+        logger.warning(f"Failed to normalize server {server_name}: {e}", exc_info=True)
+        return None
+
+
 def _normalize_server(server_data: dict[str, Any]) -> RegistryEntry | None:
     """
     Normalize a server entry from the MCP Official Registry API.
@@ -113,27 +181,28 @@ def _normalize_server(server_data: dict[str, Any]) -> RegistryEntry | None:
     }
     """
     server = server_data.get("server", {})
-    meta = server_data.get("_meta", {}).get("io.modelcontextprotocol.registry/official", {})
+    meta = server_data.get("_meta", {}).get(_OFFICIAL_META_KEY, {})
+
+    status, is_latest, published_at, updated_at, server_id, version_id = _project(
+        meta, _meta_fields, _META_DEFAULTS
+    )
 
     # Skip inactive servers
-    if meta.get("status") != "active":
+    if status != "active":
         return None
 
     # Only include latest versions to avoid duplicates
-    if not meta.get("isLatest", False):
+    if not is_latest:
         return None
 
-    name = server.get("name", "")
+    name, description, version, repo_data, packages, remotes, schema = _project(
+        server, _server_fields, _SERVER_DEFAULTS
+    )
     if not name:
         logger.warning("Server missing name, skipping")
         return None
 
-    # Extract basic info
-    description = server.get("description", "")
-    version = server.get("version", "")
-
     # Repository info
-    repo_data = server.get("repository", {})
     repo_url = repo_data.get("url", "")
 
     # Determine launch method and container image
@@ -141,7 +210,6 @@ def _normalize_server(server_data: dict[str, Any]) -> RegistryEntry | None:
     container_image = None
 
     # Check for packages (OCI containers, NPM, PyPI)
-    packages = server.get("packages", [])
     if packages:
         for package in packages:
             registry_type = package.get("registryType", "")
@@ -157,7 +225,6 @@ def _normalize_server(server_data: dict[str, Any]) -> RegistryEntry | None:
                 break
 
     # Check for remote endpoints (HTTP/SSE)
-    remotes = server.get("remotes", [])
     if remotes and launch_method == LaunchMethod.UNKNOWN:
         for remote in remotes:
             remote_type = remote.get("type", "")
@@ -190,7 +257,7 @@ def _normalize_server(server_data: dict[str, Any]) -> RegistryEntry | None:
 
     # Create slug from name (use full name as ID for official registry)
     # Format: "io.github.user/server-name" -> "mcp-official-io-github-user-server-name"
-    entry_id = f"mcp-official-{name.replace('.', '-').replace('/', '-')}"
+    entry_id = f"mcp-official-{name.translate(_ID_SEPARATORS)}"
 
     # Track official and featured status
     official = True  # All entries from official registry are official
@@ -212,11 +279,11 @@ def _normalize_server(server_data: dict[str, Any]) -> RegistryEntry | None:
         server_command=None,  # Will be determined at launch time
         raw_metadata={
             "version": version,
-            "published_at": meta.get("publishedAt"),
-            "updated_at": meta.get("updatedAt"),
-            "server_id": meta.get("serverId"),
-            "version_id": meta.get("versionId"),
-            "schema": server.get("$schema"),
+            "published_at": published_at,
+            "updated_at": updated_at,
+            "server_id": server_id,
+            "version_id": version_id,
+            "schema": schema,
         },
     )
 
@@ -226,41 +293,15 @@ def _extract_tags_from_description(description: str) -> list[str]:
     Extract tags from description using simple keyword matching.
 
     This is a heuristic approach - we look for common technology keywords.
+    Results are memoized per description since the same text often appears
+    across sources and refreshes.
     """
-    tags = []
-
-    # Common technology keywords to look for
-    keywords = [
-        "github",
-        "gitlab",
-        "database",
-        "sql",
-        "api",
-        "web",
-        "search",
-        "file",
-        "cloud",
-        "aws",
-        "azure",
-        "gcp",
-        "docker",
-        "kubernetes",
-        "ai",
-        "ml",
-        "data",
-        "analytics",
-        "security",
-        "auth",
-        "slack",
-        "discord",
-        "notion",
-        "openai",
-        "anthropic",
-    ]
+    return list(_cached_description_tags(description))
 
-    description_lower = description.lower()
-    for keyword in keywords:
-        if keyword in description_lower:
-            tags.append(keyword)
 
+@functools.lru_cache(maxsize=4096)
+def _cached_description_tags(description: str) -> tuple[str, ...]:
+    """Cached keyword scan; returns an immutable tuple so callers can't mutate the cache."""
+    description_lower = description.lower()
+    tags = tuple(keyword for keyword in _TAG_KEYWORDS if keyword in description_lower)
     return tags[:10]  # Limit to 10 tags
@@ -1,22 +1,60 @@
 """Wrapper for mcpservers.org scraper with normalization to RegistryEntry format."""
 
+from __future__ import annotations
+
 import asyncio
+import importlib
 import logging
 import sys
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING
 
 import httpx
 
-# Add scripts directory to path to import existing scraper
+from ..models import LaunchMethod, RegistryEntry, ServerCommand, SourceType
+from .github_utils import populate_github_stars
+
+if TYPE_CHECKING:
+    from scrape_mcpservers import ServerInfo
+
+logger = logging.getLogger(__name__)
+
+# The existing scraper lives in scripts/ and pulls in lxml on import, so it is
+# only loaded the first time a scrape actually runs.
 scripts_dir = Path(__file__).parent.parent.parent / "scripts"
-sys.path.insert(0, str(scripts_dir))
+_scraper_module: ModuleType | None = None
 
-from scrape_mcpservers import ServerInfo, scrape_all_servers
 
-from ..models import LaunchMethod, RegistryEntry, ServerCommand, SourceType
-from .github_utils import fetch_github_stars
+def _load_scraper() -> ModuleType:
+    """Import (once) and return the scripts/scrape_mcpservers.py module."""
+    global _scraper_module
+    if _scraper_module is None:
+        if str(scripts_dir) not in sys.path:
+            sys.path.insert(0, str(scripts_dir))
+        _scraper_module = importlib.import_module("scrape_mcpservers")
+    return _scraper_module
 
-logger = logging.getLogger(__name__)
+
+# The blocking scrape opens up to `concurrency` sockets plus cache files; run it on a
+# dedicated single-thread executor and admit one scrape at a time so concurrent
+# refreshes can't multiply thread and file-descriptor usage. The semaphore is bound to
+# the loop it first blocks on, so keep one per event loop.
+_SCRAPE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mcpservers")
+_scrape_sems: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.BoundedSemaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _scrape_sem() -> asyncio.BoundedSemaphore:
+    """Get the scrape admission semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    sem = _scrape_sems.get(loop)
+    if sem is None:
+        sem = _scrape_sems[loop] = asyncio.BoundedSemaphore(1)
+    return sem
 
 
 def _normalize_server_info(server: ServerInfo) -> RegistryEntry:
@@ -64,19 +102,24 @@ def _normalize_server_info(server: ServerInfo) -> RegistryEntry:
         server_command=server_command,
         raw_metadata={
             "url": server.url,
-            "api_key_evidence": server.api_key_evidence
-            if hasattr(server, "api_key_evidence")
-            else [],
-            "api_env_vars": server.api_env_vars if hasattr(server, "api_env_vars") else [],
-            "install_instructions": server.install_instructions
-            if hasattr(server, "install_instructions")
-            else [],
-            "clients": server.clients if hasattr(server, "clients") else [],
-            "related_servers": server.related_servers if hasattr(server, "related_servers") else [],
+            "api_key_evidence": getattr(server, "api_key_evidence", []),
+            "api_env_vars": getattr(server, "api_env_vars", []),
+            "install_instructions": getattr(server, "install_instructions", []),
+            "clients": getattr(server, "clients", []),
+            "related_servers": getattr(server, "related_servers", []),
         },
     )
 
 
+def _safe_normalize(server: ServerInfo) -> RegistryEntry | None:
+    """Normalize a scraped server, logging and skipping it on failure."""
+    try:
+        return _normalize_server_info(server)
+    except Exception as e:
+        logger.warning(f"Failed to normalize server {server.name}: {e}", exc_info=True)
+        return None
+
+
 async def scrape_mcpservers_org(
     concurrency: int = 50,
     limit: int | None = None,
@@ -99,51 +142,46 @@ async def scrape_mcpservers_org(
     logger.info(f"Scraping mcpservers.org (concurrency={concurrency}, limit={limit})")
 
     # Call the existing scraper in executor to avoid blocking event loop
-    loop = asyncio.get_event_loop()
-    servers = await loop.run_in_executor(
-        None,
-        lambda: scrape_all_servers(
-            limit=limit,
-            concurrency=concurrency,
-            cache_dir=cache_dir or ".cache/html",
-            meta_cache_dir=cache_dir or ".cache/meta",
-            resume=use_cache,
-            force_refresh=not use_cache,
-            use_categories=True,  # Always use categories for rich metadata
-            use_sitemap=False,
-            http2=False,
-            max_connections=128,
-            max_keepalive=32,
-            strict_official=False,
-        ),
-    )
+    scrape_all_servers = _load_scraper().scrape_all_servers
+    loop = asyncio.get_running_loop()
+    async with _scrape_sem():
+        servers = await loop.run_in_executor(
+            _SCRAPE_EXECUTOR,
+            lambda: scrape_all_servers(
+                limit=limit,
+                concurrency=concurrency,
+                cache_dir=cache_dir or ".cache/html",
+                meta_cache_dir=cache_dir or ".cache/meta",
+                resume=use_cache,
+                force_refresh=not use_cache,
+                use_categories=True,  # Always use categories for rich metadata
+                use_sitemap=False,
+                http2=False,
+                max_connections=128,
+                max_keepalive=32,
+                strict_official=False,
+            ),
+        )
 
     logger.info(f"Scraped {len(servers)} servers from mcpservers.org")
 
     # Normalize to RegistryEntry format
-    entries = []
-    for server in servers:
-        try:
-            entry = _normalize_server_info(server)
-            entries.append(entry)
-        except Exception as e:
-            logger.warning(f"Failed to normalize server {server.name}: {e}", exc_info=True)
-            continue
+    entries = [e for s in servers if (e := _safe_normalize(s)) is not None]
+
+    official_n = featured_n = 0
+    for e in entries:
+        official_n += e.official
+        featured_n += e.featured
 
     logger.info(
         f"Normalized {len(entries)} entries from mcpservers.org "
-        f"(official={sum(1 for e in entries if e.official)}, "
-        f"featured={sum(1 for e in entries if e.featured)})"
+        f"(official={official_n}, featured={featured_n})"
     )
 
     # Fetch GitHub stars for all entries with repo URLs
     if fetch_github_stars_flag and entries:
         logger.info(f"Fetching GitHub stars for {len(entries)} mcpservers.org entries")
         async with httpx.AsyncClient(timeout=5.0) as client:
-            for entry in entries:
-                if entry.repo_url:
-                    stars = await fetch_github_stars(entry.repo_url, client)
-                    if stars is not None:
-                        entry.raw_metadata["github_stars"] = stars
+            await populate_github_stars(entries, client)
 
     return entries
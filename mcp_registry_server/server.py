@@ -1,12 +1,20 @@
 """Main FastMCP server with dynamic MCP registry tools."""
 
 import asyncio
+import functools
+import json
 import logging
+import re
 import sys
+import weakref
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
 from fastmcp import Context, FastMCP
+from fastmcp.exceptions import NotFoundError
+from fastmcp.tools import Tool
 from pydantic import Field
 
 from .mcp_client import MCPClient, MCPClientManager
@@ -15,31 +23,19 @@ from .models import (
     ConfigSetRequest,
     LaunchMethod,
     RegistryEntry,
+    RegistryStatus,
     SearchQuery,
     SourceType,
 )
 from .podman_runner import PodmanRunner
 from .registry import Registry
 from .schema_converter import convert_tool_to_function, validate_tool_schema
-from .stdio_runner import (
-    StdioServerRunner,
-    parse_server_command,
-    validate_command_available,
-)
+from .stdio_runner import StdioServerRunner, validate_command_available
 from .tasks import RefreshScheduler
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(sys.stderr)],
-)
 logger = logging.getLogger(__name__)
 
-# Initialize FastMCP server
-mcp = FastMCP(
-    name="mcp-registry",
-    instructions="""
+_INSTRUCTIONS = """
     This server provides a dynamic MCP registry that aggregates servers from multiple sources.
 
     Available sources:
@@ -50,8 +46,10 @@ mcp = FastMCP(
     and registry-exec to run tools from active servers.
 
     All servers run in isolated Podman containers for security.
-    """,
-)
+    """
+
+# Initialize FastMCP server
+mcp = FastMCP(name="mcp-registry", instructions=_INSTRUCTIONS)
 
 # Global instances
 registry: Registry | None = None
@@ -60,65 +58,158 @@ stdio_runner: StdioServerRunner | None = None
 refresh_scheduler: RefreshScheduler | None = None
 mcp_client_manager: MCPClientManager | None = None
 
+# Lower-cased source name -> SourceType, so user input is resolved without enum lookups
+_SOURCE_TYPE_MAP: dict[str, SourceType] = {m.value.lower(): m for m in SourceType}
+
+_DASH_TO_UNDERSCORE = str.maketrans("-", "_")
+
+# registry_exec tool names: mcp_<prefix>_<tool>, with a non-empty prefix and tool
+_EXEC_TOOL_NAME_RE = re.compile(r"mcp_([^_]+)_(.+)", re.DOTALL)
+
+# (official, featured, requires_api_key) -> comma-separated flag labels
+_FLAG_LABELS: dict[tuple[bool, bool, bool], str] = {
+    (official, featured, api_key): ", ".join(
+        label
+        for label, enabled in (
+            ("Official", official),
+            ("Featured", featured),
+            ("Requires API Key", api_key),
+        )
+        if enabled
+    )
+    for official in (False, True)
+    for featured in (False, True)
+    for api_key in (False, True)
+}
+
 # Track dynamically registered tools for cleanup
-_dynamic_tools: dict[str, list[str]] = {}  # container_id -> [tool_names]
+_dynamic_tools: dict[str, set[str]] = {}  # entry_id -> {tool_names}
+
+# Set once initialize_registry() has completed; checked synchronously by every tool
+_initialized = False
+_init_lock = asyncio.Lock()
+
+# Per-entry locks serializing registry_add for the same entry_id; an entry drops out
+# once no caller holds or waits on its lock
+_add_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
 
 
 async def initialize_registry() -> None:
-    """Initialize registry and start background tasks."""
+    """Initialize registry and start background tasks.
+
+    Tool entry points only call this while ``_initialized`` is False, so the warm
+    path costs a global read instead of a coroutine round-trip.
+    """
     global registry, podman_runner, stdio_runner, refresh_scheduler, mcp_client_manager
+    global _initialized
 
-    if registry is not None:
-        return  # Already initialized
+    async with _init_lock:
+        if _initialized:
+            return  # Initialized by a concurrent caller
 
-    logger.info("Initializing mcp-registry server")
+        logger.info("Initializing mcp-registry server")
 
-    # Create registry instance
-    registry = Registry(
-        cache_dir=Path.home() / ".cache" / "mcp-registry",
-        sources_dir=Path.home() / ".local" / "share" / "mcp-registry" / "sources",
-        refresh_interval_hours=24,
-    )
+        # Create registry instance
+        registry = Registry(
+            cache_dir=Path.home() / ".cache" / "mcp-registry",
+            sources_dir=Path.home() / ".local" / "share" / "mcp-registry" / "sources",
+            refresh_interval_hours=24,
+        )
 
-    # Create Podman runner
-    podman_runner = PodmanRunner()
+        # Create Podman runner
+        podman_runner = PodmanRunner()
 
-    # Create stdio runner
-    stdio_runner = StdioServerRunner()
+        # Create stdio runner
+        stdio_runner = StdioServerRunner()
 
-    # Create MCP client manager
-    mcp_client_manager = MCPClientManager()
+        # Create MCP client manager
+        mcp_client_manager = MCPClientManager()
 
-    # Create and start refresh scheduler
-    refresh_scheduler = RefreshScheduler(registry)
-    await refresh_scheduler.start()
+        # Create and start refresh scheduler
+        refresh_scheduler = RefreshScheduler(registry)
+        await refresh_scheduler.start()
 
-    logger.info("mcp-registry server initialized")
+        _initialized = True
+        logger.info("mcp-registry server initialized")
 
 
 async def shutdown_registry() -> None:
-    """Shutdown registry and cleanup resources."""
-    global podman_runner, stdio_runner, refresh_scheduler, mcp_client_manager
+    """Shutdown registry and cleanup resources.
+
+    Holds ``_init_lock`` for the whole teardown, so a tool call arriving meanwhile
+    cannot re-initialize and swap out the runners being cleaned up. The globals are
+    only cleared once cleanup has finished.
+    """
+    global registry, podman_runner, stdio_runner, refresh_scheduler, mcp_client_manager
+    global _initialized
+
+    async with _init_lock:
+        logger.info("Shutting down mcp-registry server")
+
+        # Snapshot the instances being torn down before the first await
+        scheduler, client_manager = refresh_scheduler, mcp_client_manager
+        podman, stdio = podman_runner, stdio_runner
+
+        # Stop refresh scheduler
+        if scheduler:
+            await scheduler.stop()
+
+        # Close all MCP clients
+        if client_manager:
+            await client_manager.close_all()
+
+        # Cleanup Podman containers
+        if podman:
+            await podman.cleanup_all()
+
+        # Cleanup stdio servers
+        if stdio:
+            await stdio.cleanup_all()
+
+        # Route the next tool call back through initialize_registry()
+        _initialized = False
+        registry = podman_runner = stdio_runner = None
+        refresh_scheduler = mcp_client_manager = None
+
+        logger.info("mcp-registry server shutdown complete")
 
-    logger.info("Shutting down mcp-registry server")
 
-    # Stop refresh scheduler
-    if refresh_scheduler:
-        await refresh_scheduler.stop()
+def _format_entry(index: int, entry: RegistryEntry) -> str:
+    """Format a single search result as a markdown block.
 
-    # Close all MCP clients
-    if mcp_client_manager:
-        await mcp_client_manager.close_all()
+    Args:
+        index: 1-based position in the result list
+        entry: Registry entry to format
+
+    Returns:
+        Markdown block terminated by a blank line
+    """
+    flags = _FLAG_LABELS[(entry.official, entry.featured, entry.requires_api_key)]
+    return (
+        f"## {index}. {entry.name}\n"
+        f"**ID:** `{entry.id}`\n"
+        f"**Source:** {entry.source.value}\n"
+        f"**Description:** {entry.description}\n"
+        + (f"**Categories:** {', '.join(entry.categories)}\n" if entry.categories else "")
+        + (f"**Tags:** {', '.join(islice(entry.tags, 5))}\n" if entry.tags else "")
+        + (f"**Flags:** {flags}\n" if flags else "")
+        + (f"**Repository:** {entry.repo_url}\n" if entry.repo_url else "")
+        + (f"**Image:** {entry.container_image}\n" if entry.container_image else "")
+    )
 
-    # Cleanup Podman containers
-    if podman_runner:
-        await podman_runner.cleanup_all()
 
-    # Cleanup stdio servers
-    if stdio_runner:
-        await stdio_runner.cleanup_all()
+def _iter_search_results(results: list[RegistryEntry]) -> Iterator[str]:
+    """Yield the markdown blocks of a search response one at a time.
 
-    logger.info("mcp-registry server shutdown complete")
+    Args:
+        results: Matching registry entries, best first
+
+    Yields:
+        The header followed by one formatted block per entry
+    """
+    yield f"# Found {len(results)} matching servers\n"
+    for i, entry in enumerate(results, 1):
+        yield _format_entry(i, entry)
 
 
 @mcp.tool(name="mcp_registry_find")
@@ -144,24 +235,31 @@ async def registry_find(
     Returns:
         Formatted list of matching servers with metadata
     """
-    await initialize_registry()
+    if not _initialized:
+        await initialize_registry()
 
     # Convert sources to SourceType enum
     source_types = []
+    invalid_sources = []
     for s in sources:
-        try:
-            source_types.append(SourceType(s.lower()))
-        except ValueError:
-            logger.warning(f"Invalid source type: {s}")
-
-    search_query = SearchQuery(
+        source_type = _SOURCE_TYPE_MAP.get(s.lower())
+        if source_type is None:
+            invalid_sources.append(s)
+        else:
+            source_types.append(source_type)
+    if invalid_sources:
+        logger.warning(f"Ignoring invalid source types: {', '.join(invalid_sources)}")
+
+    # Arguments were already validated by FastMCP and sources resolved above, so
+    # skip re-validation; limit is clamped here to honour SearchQuery's 1-100 bound.
+    search_query = SearchQuery.model_construct(
         query=query,
         categories=categories,
         tags=tags,
-        sources=source_types if source_types else [],
+        sources=source_types,
         official_only=official_only,
         featured_only=featured_only,
-        limit=min(limit, 100),
+        limit=max(1, min(limit, 100)),
     )
 
     results = await registry.search(search_query)
@@ -170,39 +268,37 @@ async def registry_find(
         return f"No servers found matching query: {query}"
 
     # Format results as markdown
-    output = [f"# Found {len(results)} matching servers\n"]
+    return "\n".join(_iter_search_results(results))
 
-    for i, entry in enumerate(results, 1):
-        output.append(f"## {i}. {entry.name}")
-        output.append(f"**ID:** `{entry.id}`")
-        output.append(f"**Source:** {entry.source.value}")
-        output.append(f"**Description:** {entry.description}")
 
-        if entry.categories:
-            output.append(f"**Categories:** {', '.join(entry.categories)}")
+def _format_list_line(entry: RegistryEntry) -> str:
+    """Format a registry entry as a single listing bullet.
 
-        if entry.tags:
-            output.append(f"**Tags:** {', '.join(entry.tags[:5])}")
+    Args:
+        entry: Registry entry to format
 
-        flags = []
-        if entry.official:
-            flags.append("Official")
-        if entry.featured:
-            flags.append("Featured")
-        if entry.requires_api_key:
-            flags.append("Requires API Key")
-        if flags:
-            output.append(f"**Flags:** {', '.join(flags)}")
+    Returns:
+        Markdown bullet with name, ID, flags and truncated description
+    """
+    flags = _FLAG_LABELS[(entry.official, entry.featured, False)]
+    flag_str = f" [{flags}]" if flags else ""
+    return f"- **{entry.name}** (`{entry.id}`){flag_str} - {entry.description[:100]}"
 
-        if entry.repo_url:
-            output.append(f"**Repository:** {entry.repo_url}")
 
-        if entry.container_image:
-            output.append(f"**Image:** {entry.container_image}")
+def _iter_listing(entries: list[RegistryEntry], total: int) -> Iterator[str]:
+    """Yield the lines of a registry listing one at a time.
 
-        output.append("")  # Blank line
+    Args:
+        entries: The page of entries being shown
+        total: Number of entries matching the listing filter
 
-    return "\n".join(output)
+    Yields:
+        The header, one bullet per entry and an optional "more" note
+    """
+    yield f"# Registry listing ({total} servers)\n"
+    yield from map(_format_list_line, entries)
+    if total > len(entries):
+        yield f"\n*({total - len(entries)} more servers available)*"
 
 
 @mcp.tool(name="mcp_registry_list")
@@ -215,33 +311,17 @@ async def registry_list(
     Returns:
         Formatted list of all servers
     """
-    await initialize_registry()
+    if not _initialized:
+        await initialize_registry()
 
+    source_type = None
     if source:
-        try:
-            source_type = SourceType(source.lower())
-            entries = registry.get_entries_by_source(source_type)
-        except ValueError:
+        source_type = _SOURCE_TYPE_MAP.get(source.lower())
+        if source_type is None:
             return f"Invalid source: {source}. Valid options: docker, mcpservers"
-    else:
-        entries = await registry.list_all(limit=min(limit, 200))
-
-    output = [f"# Registry listing ({len(entries)} servers)\n"]
 
-    for entry in entries[:limit]:
-        flags = []
-        if entry.official:
-            flags.append("Official")
-        if entry.featured:
-            flags.append("Featured")
-        flag_str = f" [{', '.join(flags)}]" if flags else ""
-
-        output.append(f"- **{entry.name}** (`{entry.id}`){flag_str} - {entry.description[:100]}")
-
-    if len(entries) > limit:
-        output.append(f"\n*({len(entries) - limit} more servers available)*")
-
-    return "\n".join(output)
+    entries, total = await registry.list_page(min(limit, 200), source_type)
+    return "\n".join(_iter_listing(entries, total))
 
 
 @mcp.tool(name="mcp_registry_get_docs")
@@ -254,7 +334,8 @@ async def registry_get_docs(
         Formatted documentation including setup instructions, usage examples,
         and configuration requirements
     """
-    await initialize_registry()
+    if not _initialized:
+        await initialize_registry()
 
     entry = await registry.get_entry(entry_id)
     if not entry:
@@ -263,6 +344,410 @@ async def registry_get_docs(
     return entry.get_documentation()
 
 
+# Shared encoder for structured tool results; compact and tolerant of non-JSON values
+_RESULT_ENCODER = json.JSONEncoder(separators=(",", ":"), default=str)
+
+
+def _format_tool_result(result: Any) -> str:
+    """Render an MCP tool call result as text.
+
+    Text content is passed through untouched; structured results are encoded as
+    compact JSON instead of their Python repr.
+
+    Args:
+        result: Value returned by ``MCPClient.call_tool``
+
+    Returns:
+        Result text
+    """
+    if isinstance(result, str):
+        return result
+    return _RESULT_ENCODER.encode(result)
+
+
+def _debug_tracebacks() -> bool:
+    """Whether expected per-tool failures should be logged with a traceback.
+
+    Tool call and schema conversion errors are routine (bad arguments, odd schemas),
+    so their tracebacks are only formatted when debug logging is enabled.
+    """
+    return logger.isEnabledFor(logging.DEBUG)
+
+
+class _ExecutorRef:
+    """Late-bound executor so a cached tool can be re-pointed at a new MCP client."""
+
+    __slots__ = ("executor",)
+
+    def __init__(self, executor: Callable[[str, dict[str, Any]], Awaitable[str]]):
+        self.executor = executor
+
+    async def __call__(self, tool_name: str, arguments: dict[str, Any]) -> str:
+        return await self.executor(tool_name, arguments)
+
+
+async def _unbound_executor(tool_name: str, arguments: dict[str, Any]) -> str:
+    """Placeholder executor for a cached tool that hasn't been bound yet."""
+    return f"Error: no MCP client bound for tool {tool_name}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _validate_cached(tool_json: str) -> tuple[bool, str]:
+    """Validate a serialized tool definition, memoized per schema.
+
+    Args:
+        tool_json: Tool definition serialized with sorted keys
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    return validate_tool_schema(json.loads(tool_json))
+
+
+@functools.lru_cache(maxsize=512)
+def _build_cached_tool(tool_json: str, prefix: str) -> tuple[Tool, _ExecutorRef]:
+    """Build a FastMCP tool for a serialized tool definition, memoized per schema.
+
+    Identical schemas produce identical signatures, so re-activating a server (or one
+    exposing the same tools) reuses the generated function and its pydantic schema.
+    The executor is bound afterwards through the returned ``_ExecutorRef``.
+
+    Args:
+        tool_json: Tool definition serialized with sorted keys
+        prefix: Namespace prefix for the generated tool name
+
+    Returns:
+        Tuple of (tool, executor reference)
+    """
+    executor_ref = _ExecutorRef(_unbound_executor)
+    full_tool_name, dynamic_function = convert_tool_to_function(
+        tool_definition=json.loads(tool_json),
+        prefix=prefix,
+        executor=executor_ref,
+    )
+    if logger.isEnabledFor(logging.INFO):
+        # Rendering the signature walks every parameter; skip it when INFO is off
+        logger.info(
+            f"Built dynamic tool: {full_tool_name} (signature: {dynamic_function.__signature__})"
+        )
+    return Tool.from_function(dynamic_function, name=full_tool_name), executor_ref
+
+
+def _build_dynamic_tools(
+    tools: list[dict[str, Any]],
+    prefix: str,
+    executor: Callable[[str, dict[str, Any]], Awaitable[str]],
+) -> list[Tool]:
+    """Convert discovered MCP tool definitions into FastMCP tools.
+
+    Tools with invalid schemas or that fail conversion are logged and skipped. This
+    is CPU-bound (a few ms per uncached tool), so callers run it in a worker thread.
+
+    Args:
+        tools: Tool definitions from ``tools/list``
+        prefix: Namespace prefix for the generated tool names
+        executor: Coroutine that forwards a call to the backing MCP server
+
+    Returns:
+        FastMCP tools ready for registration
+    """
+    built: list[Tool] = []
+    for tool in tools:
+        tool_name = tool.get("name", "")
+        tool_json = json.dumps(tool, sort_keys=True)
+
+        # Validate tool schema
+        is_valid, error_msg = _validate_cached(tool_json)
+        if not is_valid:
+            logger.warning(f"Skipping tool {tool_name} due to invalid schema: {error_msg}")
+            continue
+
+        try:
+            # Convert tool definition to a FastMCP tool with explicit parameters
+            dynamic_tool, executor_ref = _build_cached_tool(tool_json, prefix)
+            executor_ref.executor = executor
+            built.append(dynamic_tool)
+        except Exception as e:
+            logger.warning(f"Failed to build tool {tool_name}: {e}", exc_info=_debug_tracebacks())
+            # Continue with other tools even if one fails
+
+    return built
+
+
+def _register_tools(tools: list[Tool]) -> set[str]:
+    """Add a batch of tools to the FastMCP server.
+
+    Callers send a single tools/list_changed notification for the whole batch.
+
+    Args:
+        tools: Tools to register
+
+    Returns:
+        Names of the registered tools
+    """
+    for tool in tools:
+        mcp.add_tool(tool)
+    return {tool.name for tool in tools}
+
+
+def _unregister_tools(tool_names: Iterable[str]) -> None:
+    """Remove a batch of dynamically registered tools from the FastMCP server.
+
+    Callers send a single tools/list_changed notification for the whole batch.
+
+    Args:
+        tool_names: Names of the tools to remove
+    """
+    removed = 0
+    missing: list[str] = []
+    for tool_name in tool_names:
+        try:
+            mcp.remove_tool(tool_name)
+        except NotFoundError:
+            missing.append(tool_name)
+        else:
+            removed += 1
+
+    logger.info(f"Removed {removed} dynamic tools")
+    if missing:
+        logger.warning(f"{len(missing)} tools were not registered: {', '.join(missing)}")
+
+
+_STDIO_LAUNCHED_TEMPLATE = """Successfully launched stdio server!
+
+**Type:** Stdio server (direct process)
+**PID:** {pid}
+**Prefix:** {prefix}
+**Command:** {command_line}
+**Tools discovered:** {tool_count}
+**Resources discovered:** {resource_count}
+**Prompts discovered:** {prompt_count}
+
+Available tools (callable via MCP):
+{tool_list}
+{tool_more}
+
+{resource_list}
+{resource_more}
+
+{prompt_list}
+{prompt_more}
+
+These tools are now directly available through this MCP server!
+You can call them by name (e.g., mcp_{prefix}_{example_tool})
+
+Use `registry-config-set` to update environment variables if needed (requires restart).
+Use `registry-remove` with entry_id="{server_id}" to stop this server.
+"""
+
+_PODMAN_ACTIVATED_TEMPLATE = """Successfully activated: {name}
+
+**Type:** Podman container (interactive/stdio mode)
+**Container ID:** {container_id}
+**Prefix:** {prefix}
+**Image:** {image}
+**Tools discovered:** {tool_count}
+**Resources discovered:** {resource_count}
+**Prompts discovered:** {prompt_count}
+
+Available tools (callable via MCP):
+{tool_list}
+{tool_more}
+
+{resource_list}
+{resource_more}
+
+{prompt_list}
+{prompt_more}
+
+These tools are now directly available through this MCP server!
+You can call them by name (e.g., mcp_{prefix}_{example_tool})
+
+Use `registry-config-set` to configure environment variables (requires restart).
+"""
+
+_UNSUPPORTED_LAUNCH_TEMPLATE = """Unable to activate {name}: Only Podman container-based servers are currently supported for dynamic tool exposure.
+
+**Entry ID:** {entry_id}
+**Launch Method:** {launch_method}
+
+Supported launch methods:
+- PODMAN (with container image)
+
+Note: Stdio-based servers and source-based servers are not yet supported for automatic activation.
+You can manually configure them in your MCP client if needed.
+"""
+
+
+def _head_with_remainder(
+    items: list[str], head: int, sep: str, fmt: Callable[[str], str] | None = None
+) -> tuple[str, str]:
+    """Render the first ``head`` items and the "... and N more" line for the rest.
+
+    Args:
+        items: Items to list
+        head: Maximum number of items to render
+        sep: Separator placed between rendered items
+        fmt: Optional per-item formatter
+
+    Returns:
+        Tuple of (rendered items, "more" line or empty string)
+    """
+    shown = islice(items, head)
+    rendered = sep.join(map(fmt, shown) if fmt else shown)
+    remainder = len(items) - head
+    return rendered, f"  ... and {remainder} more" if remainder > 0 else ""
+
+
+def _discovery_fields(
+    prefix: str, tool_names: list[str], resource_uris: list[str], prompt_names: list[str]
+) -> dict[str, Any]:
+    """Build the discovery summary fields shared by the activation templates.
+
+    Args:
+        prefix: Tool prefix the discovered tools were registered under
+        tool_names: Names of the discovered tools
+        resource_uris: URIs of the discovered resources
+        prompt_names: Names of the discovered prompts
+
+    Returns:
+        Template fields for the tool, resource and prompt listings
+    """
+    tool_list, tool_more = _head_with_remainder(
+        tool_names, 10, "\n", lambda tool: f"  - mcp_{prefix}_{tool}"
+    )
+    resource_head, resource_more = _head_with_remainder(resource_uris, 5, ", ")
+    prompt_head, prompt_more = _head_with_remainder(prompt_names, 5, ", ")
+    return {
+        "prefix": prefix,
+        "tool_count": len(tool_names),
+        "resource_count": len(resource_uris),
+        "prompt_count": len(prompt_names),
+        "tool_list": tool_list,
+        "tool_more": tool_more,
+        "resource_list": f"Available resources: {resource_head}" if resource_uris else "",
+        "resource_more": resource_more,
+        "prompt_list": f"Available prompts: {prompt_head}" if prompt_names else "",
+        "prompt_more": prompt_more,
+        "example_tool": tool_names[0] if tool_names else "toolname",
+    }
+
+
+async def _discover_capabilities(
+    client: MCPClient, timeout: float = 30.0
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
+    """List a server's tools, resources and prompts concurrently under one deadline.
+
+    The three requests run in a TaskGroup, so a failure or the timeout cancels the
+    remaining ones instead of leaving them waiting on the client.
+
+    Args:
+        client: Initialized MCP client
+        timeout: Overall deadline in seconds for the three requests
+
+    Returns:
+        Tuple of (tools, resources, prompts)
+
+    Raises:
+        TimeoutError: If discovery does not finish within the deadline
+    """
+    try:
+        async with asyncio.timeout(timeout), asyncio.TaskGroup() as tg:
+            tools = tg.create_task(client.list_tools())
+            resources = tg.create_task(client.list_resources())
+            prompts = tg.create_task(client.list_prompts())
+    except ExceptionGroup as eg:
+        # Surface the first failure as-is, as asyncio.gather() would
+        raise eg.exceptions[0] from None
+    return tools.result(), resources.result(), prompts.result()
+
+
+async def _activate_client(
+    *,
+    client_id: str,
+    mount_id: str,
+    process: asyncio.subprocess.Process,
+    prefix: str,
+    display_name: str,
+    ctx: Context | None,
+) -> tuple[list[str], list[str], list[str]]:
+    """Connect to a freshly started MCP server and expose its tools.
+
+    Shared by the container and stdio activation paths: initializes an MCP client
+    over the process's stdio, discovers its capabilities, registers the client and
+    the prefixed dynamic tools, and notifies the caller that the tool list changed.
+
+    Args:
+        client_id: Key the MCP client is registered under
+        mount_id: Active mount ID the dynamic tools are tracked under
+        process: Server process speaking MCP over stdio
+        prefix: Tool prefix for namespacing
+        display_name: Server name used in log messages
+        ctx: FastMCP context of the calling tool, if any
+
+    Returns:
+        Tuple of (tool names, resource URIs, prompt names)
+
+    Raises:
+        TimeoutError: If initialization or discovery times out
+    """
+    client = MCPClient(process)
+
+    # Initialize the MCP connection
+    logger.info(f"Initializing MCP client for {display_name}...")
+    async with asyncio.timeout(30.0):
+        capabilities = await client.initialize()
+    logger.info(f"MCP client initialized: {capabilities}")
+
+    # Discover tools, resources and prompts concurrently
+    logger.debug(f"Discovering tools, resources and prompts for {display_name}...")
+    tools, resources, prompts = await _discover_capabilities(client)
+    tool_names = [tool.get("name", "unknown") for tool in tools]
+    resource_uris = [res.get("uri", "unknown") for res in resources]
+    prompt_names = [prompt.get("name", "unknown") for prompt in prompts]
+    logger.info(
+        f"Discovered {len(tool_names)} tools, {len(resource_uris)} resources, "
+        f"{len(prompt_names)} prompts: {tool_names}"
+    )
+
+    # Register client with manager
+    mcp_client_manager.register_client(client_id, client, process)
+
+    # Dynamically register discovered tools with FastMCP using schema converter
+    # Create executor function that forwards to the MCP client
+    async def tool_executor(tool_name: str, arguments: dict[str, Any]) -> str:
+        """Execute a tool via the MCP client."""
+        client = mcp_client_manager.get_client(client_id)
+        if not client:
+            return f"Error: MCP client not found for {client_id}"
+
+        try:
+            result = await client.call_tool(tool_name, arguments)
+            return _format_tool_result(result)
+        except Exception as e:
+            logger.warning(f"Error executing tool {tool_name}: {e}", exc_info=_debug_tracebacks())
+            return f"Error executing {tool_name}: {str(e)}"
+
+    # Build every tool off the event loop, then register them with FastMCP in one pass
+    built_tools = await asyncio.to_thread(_build_dynamic_tools, tools, prefix, tool_executor)
+    registered_tool_names = _register_tools(built_tools)
+
+    # Track registered tools for cleanup
+    _dynamic_tools[mount_id] = registered_tool_names
+
+    logger.info(
+        f"Successfully registered {len(registered_tool_names)} dynamic tools "
+        f"for {display_name}"
+    )
+
+    # Send notification to client that tools have changed
+    if ctx:
+        await ctx.send_tool_list_changed()
+        logger.info("Sent tools/list_changed notification to client")
+
+    return tool_names, resource_uris, prompt_names
+
+
 @mcp.tool(name="mcp_registry_launch_stdio")
 async def registry_launch_stdio(
     command: str = Field(..., description="Command to execute (e.g., 'npx', 'python', 'node')"),
@@ -296,7 +781,8 @@ async def registry_launch_stdio(
     Returns:
         Confirmation message with activation details
     """
-    await initialize_registry()
+    if not _initialized:
+        await initialize_registry()
 
     # Validate command is available
     is_available, message = await validate_command_available(command)
@@ -323,93 +809,15 @@ async def registry_launch_stdio(
             env=env,
         )
 
-        # Create MCP client for this process
-        client = MCPClient(process)
-
-        # Initialize the MCP connection
-        logger.info(f"Initializing MCP client for stdio server...")
-        capabilities = await asyncio.wait_for(client.initialize(), timeout=30.0)
-        logger.info(f"MCP client initialized: {capabilities}")
-
-        # Discover tools
-        logger.info(f"Discovering tools from stdio server...")
-        tools = await asyncio.wait_for(client.list_tools(), timeout=30.0)
-        tool_names = [tool.get("name", "unknown") for tool in tools]
-        logger.info(f"Discovered {len(tool_names)} tools: {tool_names}")
-
-        # Discover resources
-        logger.info(f"Discovering resources from stdio server...")
-        resources = await asyncio.wait_for(client.list_resources(), timeout=30.0)
-        resource_uris = [res.get("uri", "unknown") for res in resources]
-        logger.info(f"Discovered {len(resource_uris)} resources: {resource_uris}")
-
-        # Discover prompts
-        logger.info(f"Discovering prompts from stdio server...")
-        prompts = await asyncio.wait_for(client.list_prompts(), timeout=30.0)
-        prompt_names = [prompt.get("name", "unknown") for prompt in prompts]
-        logger.info(f"Discovered {len(prompt_names)} prompts: {prompt_names}")
-
-        # Register client with manager
-        mcp_client_manager.register_client(server_id, client, process)
-
-        # Dynamically register discovered tools with FastMCP using schema converter
-        registered_tool_names = []
-
-        # Create executor function that forwards to the MCP client
-        async def tool_executor(tool_name: str, arguments: dict[str, Any]) -> str:
-            """Execute a tool via the MCP client."""
-            client = mcp_client_manager.get_client(server_id)
-            if not client:
-                return f"Error: MCP client not found for server {server_id}"
-
-            try:
-                result = await client.call_tool(tool_name, arguments)
-                return str(result)
-            except Exception as e:
-                logger.error(f"Error executing tool {tool_name}: {e}", exc_info=True)
-                return f"Error executing {tool_name}: {str(e)}"
-
-        for tool in tools:
-            tool_name = tool.get("name", "")
-
-            # Validate tool schema
-            is_valid, error_msg = validate_tool_schema(tool)
-            if not is_valid:
-                logger.warning(f"Skipping tool {tool_name} due to invalid schema: {error_msg}")
-                continue
-
-            try:
-                # Convert tool definition to Python function with explicit parameters
-                full_tool_name, dynamic_function = convert_tool_to_function(
-                    tool_definition=tool,
-                    prefix=prefix,
-                    executor=tool_executor,
-                )
-
-                # Register with FastMCP
-                mcp.add_tool(dynamic_function)
-                registered_tool_names.append(full_tool_name)
-                logger.info(
-                    f"Registered dynamic tool: {full_tool_name} "
-                    f"(signature: {dynamic_function.__signature__})"
-                )
-
-            except Exception as e:
-                logger.error(f"Failed to register tool {tool_name}: {e}", exc_info=True)
-                # Continue with other tools even if one fails
-
-        # Track registered tools for cleanup
-        _dynamic_tools[server_id] = registered_tool_names
-
-        logger.info(
-            f"Successfully registered {len(registered_tool_names)} dynamic tools from stdio server"
+        tool_names, resource_uris, prompt_names = await _activate_client(
+            client_id=server_id,
+            mount_id=server_id,
+            process=process,
+            prefix=prefix,
+            display_name="stdio server",
+            ctx=ctx,
         )
 
-        # Send notification to client that tools have changed
-        if ctx:
-            await ctx.send_tool_list_changed()
-            logger.info("Sent tools/list_changed notification to client")
-
         # Create active mount record
         mount = ActiveMount(
             entry_id=server_id,
@@ -425,32 +833,14 @@ async def registry_launch_stdio(
 
         await registry.add_active_mount(mount)
 
-        return f"""Successfully launched stdio server!
-
-**Type:** Stdio server (direct process)
-**PID:** {process.pid}
-**Prefix:** {prefix}
-**Command:** {command} {" ".join(args)}
-**Tools discovered:** {len(tool_names)}
-**Resources discovered:** {len(resource_uris)}
-**Prompts discovered:** {len(prompt_names)}
-
-Available tools (callable via MCP):
-{chr(10).join(f"  - mcp_{prefix}_{tool}" for tool in tool_names[:10])}
-{f"  ... and {len(tool_names) - 10} more" if len(tool_names) > 10 else ""}
-
-{f"Available resources: {', '.join(resource_uris[:5])}" if resource_uris else ""}
-{f"  ... and {len(resource_uris) - 5} more" if len(resource_uris) > 5 else ""}
-
-{f"Available prompts: {', '.join(prompt_names[:5])}" if prompt_names else ""}
-{f"  ... and {len(prompt_names) - 5} more" if len(prompt_names) > 5 else ""}
-
-These tools are now directly available through this MCP server!
-You can call them by name (e.g., mcp_{prefix}_{tool_names[0] if tool_names else "toolname"})
-
-Use `registry-config-set` to update environment variables if needed (requires restart).
-Use `registry-remove` with entry_id="{server_id}" to stop this server.
-"""
+        return _STDIO_LAUNCHED_TEMPLATE.format_map(
+            {
+                "pid": process.pid,
+                "command_line": f"{command} {' '.join(args)}",
+                "server_id": server_id,
+                **_discovery_fields(prefix, tool_names, resource_uris, prompt_names),
+            }
+        )
 
     except FileNotFoundError as e:
         return f"Failed to launch stdio server: {e}"
@@ -490,22 +880,42 @@ async def registry_add(
     Returns:
         Confirmation message with activation details
     """
-    await initialize_registry()
+    if not _initialized:
+        await initialize_registry()
+
+    # Serialize activations of the same entry: a concurrent second caller waits and
+    # then finds the mount instead of starting a duplicate container
+    lock = _add_locks.get(entry_id)
+    if lock is None:
+        lock = _add_locks[entry_id] = asyncio.Lock()
+    async with lock:
+        return await _activate_entry(entry_id, prefix, ctx)
+
+
+async def _activate_entry(entry_id: str, prefix: str | None, ctx: Context | None) -> str:
+    """Activate a registry entry; callers hold the entry's activation lock.
+
+    Args:
+        entry_id: Registry entry ID to activate
+        prefix: Optional tool prefix for namespacing (default: auto-generated)
+        ctx: FastMCP context of the calling tool, if any
+
+    Returns:
+        Confirmation message with activation details
+    """
+    entry, existing = await registry.get_entry_and_mount(entry_id)
 
     # Check if already active (for Podman servers)
-    existing = await registry.get_active_mount(entry_id)
     if existing:
         return f"Server already active: {existing.name} (prefix: {existing.prefix})"
 
-    # Get entry from registry
-    entry = await registry.get_entry(entry_id)
     if not entry:
         return f"Entry not found: {entry_id}"
 
     # Generate prefix if not provided
     if not prefix:
         # Extract last component of ID as prefix
-        prefix = entry_id.split("/")[-1].replace("-", "_")
+        prefix = entry_id.rpartition("/")[2].translate(_DASH_TO_UNDERSCORE)
 
     # Check launch method
     if entry.launch_method == LaunchMethod.PODMAN and entry.container_image:
@@ -525,96 +935,16 @@ async def registry_add(
         if not container_id or not process:
             return f"Failed to start interactive container for {entry.name}"
 
-        # Create MCP client for this container
+        # Connect to the container and expose its tools
         try:
-            client = MCPClient(process)
-
-            # Initialize the MCP connection
-            logger.info(f"Initializing MCP client for {entry.name}...")
-            capabilities = await asyncio.wait_for(client.initialize(), timeout=30.0)
-            logger.info(f"MCP client initialized: {capabilities}")
-
-            # Discover tools
-            logger.info(f"Discovering tools for {entry.name}...")
-            tools = await asyncio.wait_for(client.list_tools(), timeout=30.0)
-            tool_names = [tool.get("name", "unknown") for tool in tools]
-            logger.info(f"Discovered {len(tool_names)} tools: {tool_names}")
-
-            # Discover resources
-            logger.info(f"Discovering resources for {entry.name}...")
-            resources = await asyncio.wait_for(client.list_resources(), timeout=30.0)
-            resource_uris = [res.get("uri", "unknown") for res in resources]
-            logger.info(f"Discovered {len(resource_uris)} resources: {resource_uris}")
-
-            # Discover prompts
-            logger.info(f"Discovering prompts for {entry.name}...")
-            prompts = await asyncio.wait_for(client.list_prompts(), timeout=30.0)
-            prompt_names = [prompt.get("name", "unknown") for prompt in prompts]
-            logger.info(f"Discovered {len(prompt_names)} prompts: {prompt_names}")
-
-            # Register client with manager
-            mcp_client_manager.register_client(container_id, client, process)
-
-            # Dynamically register discovered tools with FastMCP using schema converter
-            registered_tool_names = []
-
-            # Create executor function that forwards to registry_exec
-            async def tool_executor(tool_name: str, arguments: dict[str, Any]) -> str:
-                """Execute a tool via the MCP client."""
-                # Get the MCP client for this container
-                client = mcp_client_manager.get_client(container_id)
-                if not client:
-                    return f"Error: MCP client not found for container {container_id}"
-
-                try:
-                    result = await client.call_tool(tool_name, arguments)
-                    return str(result)
-                except Exception as e:
-                    logger.error(f"Error executing tool {tool_name}: {e}", exc_info=True)
-                    return f"Error executing {tool_name}: {str(e)}"
-
-            for tool in tools:
-                tool_name = tool.get("name", "")
-
-                # Validate tool schema
-                is_valid, error_msg = validate_tool_schema(tool)
-                if not is_valid:
-                    logger.warning(f"Skipping tool {tool_name} due to invalid schema: {error_msg}")
-                    continue
-
-                try:
-                    # Convert tool definition to Python function with explicit parameters
-                    full_tool_name, dynamic_function = convert_tool_to_function(
-                        tool_definition=tool,
-                        prefix=prefix,
-                        executor=tool_executor,
-                    )
-
-                    # Register with FastMCP
-                    mcp.add_tool(dynamic_function)
-                    registered_tool_names.append(full_tool_name)
-                    logger.info(
-                        f"Registered dynamic tool: {full_tool_name} "
-                        f"(signature: {dynamic_function.__signature__})"
-                    )
-
-                except Exception as e:
-                    logger.error(f"Failed to register tool {tool_name}: {e}", exc_info=True)
-                    # Continue with other tools even if one fails
-
-            # Track registered tools for cleanup
-            _dynamic_tools[container_id] = registered_tool_names
-
-            logger.info(
-                f"Successfully registered {len(registered_tool_names)} dynamic tools "
-                f"for {entry.name}"
+            tool_names, resource_uris, prompt_names = await _activate_client(
+                client_id=container_id,
+                mount_id=entry.id,
+                process=process,
+                prefix=prefix,
+                display_name=entry.name,
+                ctx=ctx,
             )
-
-            # Send notification to client that tools have changed
-            if ctx:
-                await ctx.send_tool_list_changed()
-                logger.info("Sent tools/list_changed notification to client")
-
         except asyncio.TimeoutError:
             logger.error(f"Timeout initializing MCP client for {entry.name}")
             # Clean up
@@ -650,44 +980,23 @@ async def registry_add(
 
         await registry.add_active_mount(mount)
 
-        return f"""Successfully activated: {entry.name}
-
-**Type:** Podman container (interactive/stdio mode)
-**Container ID:** {container_id}
-**Prefix:** {prefix}
-**Image:** {entry.container_image}
-**Tools discovered:** {len(tool_names)}
-**Resources discovered:** {len(resource_uris)}
-**Prompts discovered:** {len(prompt_names)}
-
-Available tools (callable via MCP):
-{chr(10).join(f"  - mcp_{prefix}_{tool}" for tool in tool_names[:10])}
-{f"  ... and {len(tool_names) - 10} more" if len(tool_names) > 10 else ""}
-
-{f"Available resources: {', '.join(resource_uris[:5])}" if resource_uris else ""}
-{f"  ... and {len(resource_uris) - 5} more" if len(resource_uris) > 5 else ""}
-
-{f"Available prompts: {', '.join(prompt_names[:5])}" if prompt_names else ""}
-{f"  ... and {len(prompt_names) - 5} more" if len(prompt_names) > 5 else ""}
-
-These tools are now directly available through this MCP server!
-You can call them by name (e.g., mcp_{prefix}_{tool_names[0] if tool_names else "toolname"})
-
-Use `registry-config-set` to configure environment variables (requires restart).
-"""
+        return _PODMAN_ACTIVATED_TEMPLATE.format_map(
+            {
+                "name": entry.name,
+                "container_id": container_id,
+                "image": entry.container_image,
+                **_discovery_fields(prefix, tool_names, resource_uris, prompt_names),
+            }
+        )
 
     else:
-        return f"""Unable to activate {entry.name}: Only Podman container-based servers are currently supported for dynamic tool exposure.
-
-**Entry ID:** {entry_id}
-**Launch Method:** {entry.launch_method.value if entry.launch_method else "unknown"}
-
-Supported launch methods:
-- PODMAN (with container image)
-
-Note: Stdio-based servers and source-based servers are not yet supported for automatic activation.
-You can manually configure them in your MCP client if needed.
-"""
+        return _UNSUPPORTED_LAUNCH_TEMPLATE.format_map(
+            {
+                "name": entry.name,
+                "entry_id": entry_id,
+                "launch_method": entry.launch_method.value if entry.launch_method else "unknown",
+            }
+        )
 
 
 @mcp.tool(name="mcp_registry_remove")
@@ -702,21 +1011,16 @@ async def registry_remove(
     Returns:
         Confirmation message
     """
-    await initialize_registry()
+    if not _initialized:
+        await initialize_registry()
 
     mount = await registry.get_active_mount(entry_id)
     if not mount:
         return f"Server not active: {entry_id}"
 
-    # Remove dynamically registered tools
-    if mount.container_id and mount.container_id in _dynamic_tools:
-        for tool_name in _dynamic_tools[mount.container_id]:
-            try:
-                mcp.remove_tool(tool_name)
-                logger.info(f"Removed dynamic tool: {tool_name}")
-            except Exception as e:
-                logger.warning(f"Failed to remove tool {tool_name}: {e}")
-        del _dynamic_tools[mount.container_id]
+    # Remove dynamically registered tools (container and stdio servers alike)
+    if mount.entry_id in _dynamic_tools:
+        _unregister_tools(_dynamic_tools.pop(mount.entry_id))
 
         # Send notification to client that tools have changed
         if ctx:
@@ -748,6 +1052,28 @@ async def registry_remove(
     return f"Successfully deactivated: {mount.name}"
 
 
+def _format_mount(mount: ActiveMount) -> str:
+    """Format an active mount as a markdown block.
+
+    Args:
+        mount: Active mount to format
+
+    Returns:
+        Markdown block terminated by a blank line
+    """
+    return (
+        f"## {mount.name}\n"
+        f"**ID:** `{mount.entry_id}`\n"
+        f"**Prefix:** `{mount.prefix}`\n"
+        + (f"**Container:** {mount.container_id[:12]}\n" if mount.container_id else "")
+        + (f"**Environment:** {', '.join(mount.environment)}\n" if mount.environment else "")
+        + (f"**Tools:** {len(mount.tools)} available\n" if mount.tools else "")
+        + (f"**Resources:** {len(mount.resources)} available\n" if mount.resources else "")
+        + (f"**Prompts:** {len(mount.prompts)} available\n" if mount.prompts else "")
+        + f"**Mounted at:** {mount.mounted_at.isoformat(sep=' ', timespec='seconds')}\n"
+    )
+
+
 @mcp.tool(name="mcp_registry_active")
 async def registry_active() -> str:
     """List all currently active MCP servers.
@@ -755,40 +1081,15 @@ async def registry_active() -> str:
     Returns:
         Formatted list of active servers with details
     """
-    await initialize_registry()
+    if not _initialized:
+        await initialize_registry()
 
     mounts = await registry.list_active_mounts()
 
     if not mounts:
         return "No active servers."
 
-    output = [f"# Active servers ({len(mounts)})\n"]
-
-    for mount in mounts:
-        output.append(f"## {mount.name}")
-        output.append(f"**ID:** `{mount.entry_id}`")
-        output.append(f"**Prefix:** `{mount.prefix}`")
-
-        if mount.container_id:
-            output.append(f"**Container:** {mount.container_id[:12]}")
-
-        if mount.environment:
-            env_keys = list(mount.environment.keys())
-            output.append(f"**Environment:** {', '.join(env_keys)}")
-
-        if mount.tools:
-            output.append(f"**Tools:** {len(mount.tools)} available")
-
-        if mount.resources:
-            output.append(f"**Resources:** {len(mount.resources)} available")
-
-        if mount.prompts:
-            output.append(f"**Prompts:** {len(mount.prompts)} available")
-
-        output.append(f"**Mounted at:** {mount.mounted_at.strftime('%Y-%m-%d %H:%M:%S')}")
-        output.append("")
-
-    return "\n".join(output)
+    return "\n".join([f"# Active servers ({len(mounts)})\n", *map(_format_mount, mounts)])
 
 
 @mcp.tool(name="mcp_registry_config_set")
@@ -807,7 +1108,8 @@ async def registry_config_set(
     Returns:
         Confirmation message
     """
-    await initialize_registry()
+    if not _initialized:
+        await initialize_registry()
 
     # Validate request
     try:
@@ -830,7 +1132,7 @@ async def registry_config_set(
 
     return f"""Configuration updated for {mount.name}
 
-**Environment variables set:** {", ".join(environment.keys())}
+**Environment variables set:** {", ".join(environment)}
 
 Note: Changes will take effect on next restart.
 To apply now, use `registry-remove` followed by `registry-add`.
@@ -855,27 +1157,18 @@ async def registry_exec(
     Returns:
         Tool execution result
     """
-    await initialize_registry()
+    if not _initialized:
+        await initialize_registry()
 
     # Parse prefix from tool name (expecting mcp_prefix_toolname format)
-    if not tool_name.startswith("mcp_"):
+    match = _EXEC_TOOL_NAME_RE.fullmatch(tool_name)
+    if match is None:
         return f"Invalid tool name format. Expected: mcp_prefix_toolname, got: {tool_name}"
 
-    parts = tool_name.split("_")
-    if len(parts) < 3:
-        return f"Invalid tool name format. Expected: mcp_prefix_toolname, got: {tool_name}"
-
-    prefix = parts[1]  # Extract prefix after "mcp_"
-    actual_tool_name = "_".join(parts[2:])  # Rest after prefix
+    prefix, actual_tool_name = match.groups()
 
     # Find active mount by prefix
-    active_mounts = await registry.list_active_mounts()
-    mount = None
-    for m in active_mounts:
-        if m.prefix == prefix:
-            mount = m
-            break
-
+    mount = await registry.get_mount_by_prefix(prefix)
     if not mount:
         return f"No active server found with prefix: {prefix}"
 
@@ -897,10 +1190,10 @@ Try removing and re-adding the server with registry_remove and registry_add.
         return f"""Tool executed successfully: {tool_name}
 
 Result:
-{result}
+{_format_tool_result(result)}
 """
     except Exception as e:
-        logger.error(f"Tool execution failed for {tool_name}: {e}", exc_info=True)
+        logger.warning(f"Tool execution failed for {tool_name}: {e}", exc_info=_debug_tracebacks())
         return f"""Tool execution failed: {tool_name}
 
 Error: {str(e)}
@@ -921,63 +1214,93 @@ async def registry_refresh(
     Returns:
         Refresh status message
     """
-    await initialize_registry()
+    if not _initialized:
+        await initialize_registry()
 
-    if source.lower() == "all":
+    source_lc = source.lower()
+    if source_lc == "all":
         sources = [SourceType.DOCKER, SourceType.MCPSERVERS]
     else:
-        try:
-            sources = [SourceType(source.lower())]
-        except ValueError:
+        source_type = _SOURCE_TYPE_MAP.get(source_lc)
+        if source_type is None:
             return f"Invalid source: {source}. Valid options: docker, mcpservers, all"
+        sources = [source_type]
+
+    # Sources refresh under independent locks, so run them concurrently
+    outcomes = await asyncio.gather(
+        *(refresh_scheduler.force_refresh(source_type) for source_type in sources),
+        return_exceptions=True,
+    )
 
     results = []
-    for source_type in sources:
-        success = await refresh_scheduler.force_refresh(source_type)
-        status = "Success" if success else "Failed"
+    for source_type, outcome in zip(sources, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.error(f"Refresh of {source_type.value} raised: {outcome}")
+            status = f"Failed: {outcome}"
+        else:
+            status = "Success" if outcome is True else "Failed"
         results.append(f"- {source_type.value}: {status}")
 
     return f"# Refresh results\n\n" + "\n".join(results)
 
 
-@mcp.tool(name="mcp_registry_status")
-async def registry_status() -> str:
-    """Get registry status and statistics.
+def _format_source_status(source_name: str, source_info: dict[str, Any]) -> str:
+    """Format one source's refresh status as a markdown block.
+
+    Args:
+        source_name: Source identifier
+        source_info: Status dict from ``Registry.get_status()``
 
     Returns:
-        Comprehensive status information
+        Markdown block terminated by a blank line
     """
-    await initialize_registry()
+    last_refresh = source_info.get("last_refresh")
+    error_message = source_info.get("error_message")
+    return (
+        f"### {source_name}\n"
+        f"**Entries:** {source_info['entry_count']}\n"
+        f"**Status:** {source_info['status']}\n"
+        + (f"**Last refresh:** {last_refresh}\n" if last_refresh else "")
+        + (f"**Error:** {error_message}\n" if error_message else "")
+    )
 
-    status = await registry.get_status()
 
-    output = [f"# Registry Status\n"]
-    output.append(f"**Total entries:** {status.total_entries}")
-    output.append(f"**Active mounts:** {status.active_mounts}")
-    output.append(f"**Cache directory:** {status.cache_dir}")
-    output.append(f"**Sources directory:** {status.sources_dir}")
+def _iter_status(status: RegistryStatus) -> Iterator[str]:
+    """Yield the lines of the registry status report one at a time.
 
-    if status.last_refresh_attempt:
-        output.append(
-            f"**Last refresh:** {status.last_refresh_attempt.strftime('%Y-%m-%d %H:%M:%S')}"
-        )
+    Args:
+        status: Current registry status snapshot
 
-    output.append("\n## Sources\n")
+    Yields:
+        Summary lines followed by one block per source
+    """
+    yield "# Registry Status\n"
+    yield f"**Total entries:** {status.total_entries}"
+    yield f"**Active mounts:** {status.active_mounts}"
+    yield f"**Cache directory:** {status.cache_dir}"
+    yield f"**Sources directory:** {status.sources_dir}"
+
+    if status.last_refresh_attempt:
+        last_refresh = status.last_refresh_attempt.isoformat(sep=" ", timespec="seconds")
+        yield f"**Last refresh:** {last_refresh}"
 
+    yield "\n## Sources\n"
     for source_name, source_info in status.sources.items():
-        output.append(f"### {source_name}")
-        output.append(f"**Entries:** {source_info['entry_count']}")
-        output.append(f"**Status:** {source_info['status']}")
+        yield _format_source_status(source_name, source_info)
 
-        if source_info.get("last_refresh"):
-            output.append(f"**Last refresh:** {source_info['last_refresh']}")
 
-        if source_info.get("error_message"):
-            output.append(f"**Error:** {source_info['error_message']}")
+@mcp.tool(name="mcp_registry_status")
+async def registry_status() -> str:
+    """Get registry status and statistics.
 
-        output.append("")
+    Returns:
+        Comprehensive status information
+    """
+    if not _initialized:
+        await initialize_registry()
 
-    return "\n".join(output)
+    status = await registry.get_status()
+    return "\n".join(_iter_status(status))
 
 
 # NOTE: Self-restart tool removed
@@ -989,6 +1312,15 @@ async def registry_status() -> str:
 
 def main() -> None:
     """Main entry point for the server."""
+    # Configure logging here rather than at import so importing the package (tests,
+    # embedding, tooling) doesn't touch the root logger.
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            handlers=[logging.StreamHandler(sys.stderr)],
+        )
+
     logger.info("Starting mcp-registry server")
 
     # Run the server
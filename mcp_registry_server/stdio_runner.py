@@ -6,13 +6,53 @@ requiring containers.
 """
 
 import asyncio
+import functools
 import logging
+import os
+import shlex
 import shutil
+import signal
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# How long a freshly spawned server must stay up before it counts as started
+STARTUP_PROBE_SECONDS = 0.1
+
+# Variables every server inherits from our environment, captured once at import;
+# changes to them afterwards (like PATH) need a restart to reach spawned servers
+_INHERITED_ENV = {
+    key: os.environ[key] for key in ("PATH", "HOME", "USER", "SHELL") if key in os.environ
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _which_cached(command: str, path: str) -> str | None:
+    """Resolve ``command`` against ``path``, memoizing the PATH walk.
+
+    Args:
+        command: Command to look up (e.g., "npx")
+        path: PATH string to search; part of the cache key so PATH changes re-resolve
+
+    Returns:
+        Absolute path to the executable, or None if not found
+    """
+    return shutil.which(command, path=path)
+
+
+def _signal_group(pgid: int, sig: signal.Signals) -> None:
+    """Send ``sig`` to every process in a server's process group.
+
+    Args:
+        pgid: Process group ID (the server's PID, as it leads its own group)
+        sig: Signal to send
+    """
+    try:
+        os.killpg(pgid, sig)
+    except ProcessLookupError:
+        pass  # The whole group has already exited
+
 
 class StdioServerRunner:
     """Manages stdio-based MCP servers as direct subprocesses.
@@ -26,8 +66,46 @@ class StdioServerRunner:
     def __init__(self):
         """Initialize the stdio server runner."""
         self._processes: dict[str, asyncio.subprocess.Process] = {}
+        # PIDs of live servers, kept current on spawn, stop and exit
+        self._running_pids: dict[str, int] = {}
+        self._exit_watchers: set[asyncio.Task] = set()
+        # Per-server tasks that keep reading stderr so a chatty server never blocks
+        self._stderr_drains: dict[str, asyncio.Task] = {}
         logger.info("StdioServerRunner initialized")
 
+    async def _drain_stderr(self, server_id: str, stream: asyncio.StreamReader) -> None:
+        """Read a server's stderr until EOF, logging it at DEBUG.
+
+        Nothing else reads stderr once a server is up; without this, a server that
+        writes more than the pipe buffer holds blocks on write and looks hung.
+
+        Args:
+            server_id: Server identifier
+            stream: The server's stderr stream
+        """
+        while chunk := await stream.read(4096):
+            if logger.isEnabledFor(logging.DEBUG):
+                text = chunk.decode(errors="replace").rstrip()
+                logger.debug(f"Stdio server {server_id} stderr: {text}")
+
+    def _watch_exit(self, server_id: str, process: asyncio.subprocess.Process) -> None:
+        """Drop ``server_id`` from the running PIDs as soon as its process exits.
+
+        Args:
+            server_id: Server identifier
+            process: The server's process
+        """
+
+        def _on_exit(task: asyncio.Task) -> None:
+            self._exit_watchers.discard(task)
+            # The id may have been stopped and reused by a newer process meanwhile
+            if self._running_pids.get(server_id) == process.pid:
+                del self._running_pids[server_id]
+
+        watcher = asyncio.create_task(process.wait())
+        self._exit_watchers.add(watcher)
+        watcher.add_done_callback(_on_exit)
+
     async def spawn_server(
         self,
         server_id: str,
@@ -50,8 +128,12 @@ class StdioServerRunner:
             FileNotFoundError: If command is not found in PATH
             RuntimeError: If server fails to start
         """
-        # Check if command exists
-        if not shutil.which(command):
+        # Prepare environment: critical inherited vars, overridden by the caller's env
+        process_env = {**_INHERITED_ENV, **(env or {})}
+
+        # Check if command exists; the resolved path is exec'd directly below
+        executable = _which_cached(command, process_env.get("PATH", os.defpath))
+        if not executable:
             raise FileNotFoundError(
                 f"Command '{command}' not found in PATH. "
                 f"Please install the required package or ensure it's in PATH."
@@ -61,41 +143,59 @@ class StdioServerRunner:
         if server_id in self._processes:
             raise RuntimeError(f"Server {server_id} is already running")
 
-        # Prepare environment
-        process_env = dict(env) if env else {}
-        # Inherit PATH and other critical env vars
-        import os
-
-        for key in ["PATH", "HOME", "USER", "SHELL"]:
-            if key in os.environ and key not in process_env:
-                process_env[key] = os.environ[key]
-
-        logger.info(f"Spawning stdio server: {command} {' '.join(args)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Spawning stdio server: {command} {' '.join(args)}")
 
         try:
-            # Spawn the process
+            # Spawn the process. Keep this free of preexec_fn: it forces CPython off
+            # its vfork fast path onto a full fork, which copies the page tables of
+            # our whole address space and slows every spawn as the registry grows.
+            # Each server leads its own process group so stopping it also reaches
+            # anything it forked (e.g. the node process behind an npx wrapper).
             process = await asyncio.create_subprocess_exec(
-                command,
+                executable,
                 *args,
                 stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 env=process_env,
+                close_fds=True,
+                process_group=0,
             )
 
-            # Wait a moment to check if process started successfully
-            await asyncio.sleep(0.5)
+            # Race the process exit against the startup probe; the event loop's child
+            # watcher (pidfd on Linux) wakes us as soon as the process dies
+            wait_task = asyncio.create_task(process.wait())
+            done, _ = await asyncio.wait({wait_task}, timeout=STARTUP_PROBE_SECONDS)
+            if wait_task not in done:
+                wait_task.cancel()
 
             # Check if process is still running
             if process.returncode is not None:
-                stderr = await process.stderr.read()
-                error_msg = stderr.decode() if stderr else "Unknown error"
+                # Bounded read: a surviving grandchild may hold stderr open forever
+                try:
+                    stderr = await asyncio.wait_for(process.stderr.read(4096), timeout=0.5)
+                except asyncio.TimeoutError:
+                    stderr = b""
+                # Kill any grandchildren it left behind, then close stdin and drain the
+                # output pipes; once every pipe reaches EOF the transport closes itself
+                _signal_group(process.pid, signal.SIGKILL)
+                try:
+                    await asyncio.wait_for(process.communicate(), timeout=0.5)
+                except asyncio.TimeoutError:
+                    logger.debug(f"Pipes of failed server {server_id} still held open")
+                error_msg = stderr.decode(errors="replace") if stderr else "Unknown error"
                 raise RuntimeError(
                     f"Server process exited immediately with code {process.returncode}: {error_msg}"
                 )
 
             # Store process reference
             self._processes[server_id] = process
+            self._running_pids[server_id] = process.pid
+            self._watch_exit(server_id, process)
+            self._stderr_drains[server_id] = asyncio.create_task(
+                self._drain_stderr(server_id, process.stderr)
+            )
             logger.info(
                 f"Stdio server {server_id} started successfully (PID: {process.pid})"
             )
@@ -122,30 +222,49 @@ class StdioServerRunner:
 
         process = self._processes[server_id]
 
+        # Already exited (crashed, or raced with shutdown): nothing to wait for, but
+        # anything it forked may still hold the group and our pipes open
+        if process.returncode is not None:
+            _signal_group(process.pid, signal.SIGKILL)
+            self._untrack(server_id)
+            return True
+
         try:
-            # Try graceful shutdown first
-            if process.returncode is None:
-                process.terminate()
-                try:
-                    await asyncio.wait_for(process.wait(), timeout=timeout)
-                    logger.info(f"Stdio server {server_id} terminated gracefully")
-                except asyncio.TimeoutError:
-                    # Force kill if graceful shutdown times out
-                    logger.warning(
-                        f"Stdio server {server_id} did not terminate, force killing"
-                    )
-                    process.kill()
-                    await process.wait()
-
-            # Remove from tracking
-            del self._processes[server_id]
+            # Try graceful shutdown first, signalling the server's whole process group
+            _signal_group(process.pid, signal.SIGTERM)
+            try:
+                await asyncio.wait_for(process.wait(), timeout=timeout)
+                logger.info(f"Stdio server {server_id} terminated gracefully")
+            except asyncio.TimeoutError:
+                # Force kill if graceful shutdown times out
+                logger.warning(f"Stdio server {server_id} did not terminate, force killing")
+                _signal_group(process.pid, signal.SIGKILL)
+                await process.wait()
+            except asyncio.CancelledError:
+                # Don't leave the group running if our caller gives up mid-shutdown
+                _signal_group(process.pid, signal.SIGKILL)
+                raise
+
+            self._untrack(server_id)
             return True
 
         except Exception as e:
             logger.error(f"Error stopping stdio server {server_id}: {e}")
             return False
 
-    async def is_running(self, server_id: str) -> bool:
+    def _untrack(self, server_id: str) -> None:
+        """Forget a stopped server; safe to call more than once.
+
+        Args:
+            server_id: Server identifier
+        """
+        self._processes.pop(server_id, None)
+        self._running_pids.pop(server_id, None)
+        drain = self._stderr_drains.pop(server_id, None)
+        if drain is not None:
+            drain.cancel()
+
+    def is_running(self, server_id: str) -> bool:
         """Check if a server is currently running.
 
         Args:
@@ -160,7 +279,7 @@ class StdioServerRunner:
         process = self._processes[server_id]
         return process.returncode is None
 
-    async def get_server_pid(self, server_id: str) -> int | None:
+    def get_server_pid(self, server_id: str) -> int | None:
         """Get the PID of a running server.
 
         Args:
@@ -179,12 +298,17 @@ class StdioServerRunner:
         """Stop all running stdio servers.
 
         This should be called during shutdown to ensure all processes are cleaned up.
+        Servers are stopped concurrently, so their grace periods overlap.
         """
         logger.info(f"Cleaning up {len(self._processes)} stdio servers")
 
         server_ids = list(self._processes.keys())
-        for server_id in server_ids:
-            await self.stop_server(server_id)
+        results = await asyncio.gather(
+            *(self.stop_server(server_id) for server_id in server_ids), return_exceptions=True
+        )
+        for server_id, result in zip(server_ids, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error stopping stdio server {server_id}: {result}")
 
         logger.info("All stdio servers cleaned up")
 
@@ -194,37 +318,51 @@ class StdioServerRunner:
         Returns:
             Dictionary mapping server_id to PID
         """
-        running = {}
-        for server_id, process in self._processes.items():
-            if process.returncode is None:
-                running[server_id] = process.pid
+        return dict(self._running_pids)
+
 
-        return running
+# Availability messages from validate_command_available, keyed by resolved executable
+_version_messages: dict[str, str] = {}
 
 
 async def validate_command_available(command: str) -> tuple[bool, str]:
     """Validate that a command is available in PATH.
 
+    The ``--version`` probe runs once per resolved executable; later checks reuse
+    its message.
+
     Args:
         command: Command to check (e.g., "npx", "python")
 
     Returns:
         Tuple of (is_available, message)
     """
-    if shutil.which(command):
+    executable = _which_cached(command, os.environ.get("PATH", os.defpath))
+    if executable:
+        cached = _version_messages.get(executable)
+        if cached is not None:
+            return (True, cached)
+
         try:
             # Try to get version for additional validation
             process = await asyncio.create_subprocess_exec(
-                command,
+                executable,
                 "--version",
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
-            stdout, stderr = await process.communicate()
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=1.0)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                raise
             version = (stdout or stderr).decode().strip().split("\n")[0]
-            return (True, f"{command} is available: {version}")
+            message = f"{command} is available: {version}"
         except Exception:
-            return (True, f"{command} is available in PATH")
+            message = f"{command} is available in PATH"
+        _version_messages[executable] = message
+        return (True, message)
     else:
         suggestions = []
         if command == "npx":
@@ -252,6 +390,7 @@ def parse_server_command(command_str: str) -> tuple[str, list[str]]:
     - "npx @modelcontextprotocol/server-filesystem /tmp"
     - "python -m my_mcp_server"
     - "node server.js --port 3000"
+    - "node 'My Server/index.js'" (quoted arguments may contain spaces)
 
     Args:
         command_str: Full command string
@@ -266,14 +405,17 @@ def parse_server_command(command_str: str) -> tuple[str, list[str]]:
         >>> parse_server_command("python -m mcp_server --verbose")
         ("python", ["-m", "mcp_server", "--verbose"])
     """
-    parts = command_str.split()
+    parts = _split_command(command_str)
     if not parts:
         raise ValueError("Command string is empty")
 
-    command = parts[0]
-    args = parts[1:] if len(parts) > 1 else []
+    return (parts[0], list(parts[1:]))
+
 
-    return (command, args)
+@functools.lru_cache(maxsize=128)
+def _split_command(command_str: str) -> tuple[str, ...]:
+    """Split a command string with shell quoting rules, memoizing recent parses."""
+    return tuple(shlex.split(command_str))
 
 
 def build_server_command(command: str, args: list[str]) -> str:
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import time
 from datetime import datetime
 from pathlib import Path
 
@@ -22,134 +23,166 @@ class RefreshScheduler:
             registry: Registry instance to update
         """
         self.registry = registry
-        self._tasks: dict[SourceType, asyncio.Task] = {}
+        self._run_task: asyncio.Task | None = None
         self._running = False
+        # Bounds how many sources refresh at once; a source's event is set when its
+        # in-flight refresh finishes, so concurrent triggers wait instead of re-running
+        self._refresh_sem = asyncio.Semaphore(2)
+        self._inflight: dict[SourceType, asyncio.Event] = {}
+        # Set to cut the periodic loops' sleep short
+        self._wake = asyncio.Event()
         self._refresh_interval_seconds = registry.refresh_interval.total_seconds()
+        # Loops check more frequently than the interval, but at least hourly
+        self._check_interval = min(self._refresh_interval_seconds / 4, 3600)
 
     async def _refresh_mcpservers(self) -> None:
         """Refresh mcpservers.org source."""
         source_type = SourceType.MCPSERVERS
 
-        async with self.registry._refresh_locks[source_type]:
-            logger.info("Starting mcpservers.org refresh")
-            status = SourceRefreshStatus(
-                source_type=source_type,
-                last_attempt=datetime.utcnow(),
-                status="refreshing",
-            )
-            await self.registry.update_source_status(status)
+        logger.info("Starting mcpservers.org refresh")
+        started = time.monotonic()
+        status = SourceRefreshStatus(
+            source_type=source_type,
+            last_attempt=datetime.utcnow(),
+            status="refreshing",
+        )
+        await self.registry.update_source_status(status)
 
-            try:
-                # Scrape mcpservers.org
-                # Use limit to prevent CPU exhaustion from parsing thousands of HTML files
-                # Disable GitHub stars fetching to reduce HTTP requests and improve performance
-                entries = await scrape_mcpservers_org(
-                    concurrency=20,
-                    limit=500,  # Reasonable limit to avoid processing 5000+ servers
-                    use_cache=True,
-                    cache_dir=str(self.registry.cache_dir / "mcpservers_html"),
-                    fetch_github_stars_flag=False,  # Skip GitHub API calls during background refresh
-                )
+        try:
+            # Scrape mcpservers.org
+            # Use limit to prevent CPU exhaustion from parsing thousands of HTML files
+            # Disable GitHub stars fetching to reduce HTTP requests and improve performance
+            entries = await scrape_mcpservers_org(
+                concurrency=20,
+                limit=500,  # Reasonable limit to avoid processing 5000+ servers
+                use_cache=True,
+                cache_dir=str(self.registry.cache_dir / "mcpservers_html"),
+                fetch_github_stars_flag=False,  # Skip GitHub API calls during background refresh
+            )
 
-                # Bulk add to registry
-                count = await self.registry.bulk_add_entries(entries)
+            # Bulk add to registry
+            count = await self.registry.bulk_add_entries(entries)
 
-                # Update status
-                status.last_refresh = datetime.utcnow()
-                status.entry_count = count
-                status.status = "ok"
-                status.error_message = None
-                await self.registry.update_source_status(status)
+            # Update status
+            status.last_refresh = datetime.utcnow()
+            status.entry_count = count
+            status.status = "ok"
+            status.error_message = None
+            await self.registry.update_source_status(status)
 
-                logger.info(f"Successfully refreshed mcpservers.org: {count} entries")
-            except Exception as e:
-                logger.error(f"Failed to refresh mcpservers.org: {e}", exc_info=True)
-                status.status = "error"
-                status.error_message = str(e)
-                await self.registry.update_source_status(status)
+            logger.info(
+                f"Successfully refreshed mcpservers.org: {count} entries "
+                f"in {time.monotonic() - started:.1f}s"
+            )
+        except Exception as e:
+            logger.error(f"Failed to refresh mcpservers.org: {e}", exc_info=True)
+            status.status = "error"
+            status.error_message = str(e)
+            await self.registry.update_source_status(status)
 
     async def _refresh_docker_registry(self) -> None:
         """Refresh Docker MCP registry source."""
         source_type = SourceType.DOCKER
 
-        async with self.registry._refresh_locks[source_type]:
-            logger.info("Starting Docker registry refresh")
-            status = SourceRefreshStatus(
-                source_type=source_type,
-                last_attempt=datetime.utcnow(),
-                status="refreshing",
-            )
-            await self.registry.update_source_status(status)
+        logger.info("Starting Docker registry refresh")
+        started = time.monotonic()
+        status = SourceRefreshStatus(
+            source_type=source_type,
+            last_attempt=datetime.utcnow(),
+            status="refreshing",
+        )
+        await self.registry.update_source_status(status)
 
-            try:
-                # Scrape Docker registry (clones/pulls git repo)
-                entries = await scrape_docker_registry(self.registry.sources_dir)
+        try:
+            # Scrape Docker registry (clones/pulls git repo)
+            entries = await scrape_docker_registry(self.registry.sources_dir)
 
-                # Bulk add to registry
-                count = await self.registry.bulk_add_entries(entries)
+            # Bulk add to registry
+            count = await self.registry.bulk_add_entries(entries)
 
-                # Update status
-                status.last_refresh = datetime.utcnow()
-                status.entry_count = count
-                status.status = "ok"
-                status.error_message = None
-                await self.registry.update_source_status(status)
+            # Update status
+            status.last_refresh = datetime.utcnow()
+            status.entry_count = count
+            status.status = "ok"
+            status.error_message = None
+            await self.registry.update_source_status(status)
 
-                logger.info(f"Successfully refreshed Docker registry: {count} entries")
-            except Exception as e:
-                logger.error(f"Failed to refresh Docker registry: {e}", exc_info=True)
-                status.status = "error"
-                status.error_message = str(e)
-                await self.registry.update_source_status(status)
+            logger.info(
+                f"Successfully refreshed Docker registry: {count} entries "
+                f"in {time.monotonic() - started:.1f}s"
+            )
+        except Exception as e:
+            logger.error(f"Failed to refresh Docker registry: {e}", exc_info=True)
+            status.status = "error"
+            status.error_message = str(e)
+            await self.registry.update_source_status(status)
 
     async def _refresh_mcp_official(self) -> None:
         """Refresh MCP Official Registry source."""
         source_type = SourceType.MCP_OFFICIAL
 
-        async with self.registry._refresh_locks[source_type]:
-            logger.info("Starting MCP Official Registry refresh")
-            status = SourceRefreshStatus(
-                source_type=source_type,
-                last_attempt=datetime.utcnow(),
-                status="refreshing",
-            )
-            await self.registry.update_source_status(status)
+        logger.info("Starting MCP Official Registry refresh")
+        started = time.monotonic()
+        status = SourceRefreshStatus(
+            source_type=source_type,
+            last_attempt=datetime.utcnow(),
+            status="refreshing",
+        )
+        await self.registry.update_source_status(status)
 
-            try:
-                # Scrape MCP Official Registry API
-                entries = await scrape_mcp_official_registry(limit=None, timeout=30.0)
+        try:
+            # Scrape MCP Official Registry API
+            entries = await scrape_mcp_official_registry(limit=None, timeout=30.0)
 
-                # Bulk add to registry
-                count = await self.registry.bulk_add_entries(entries)
+            # Bulk add to registry
+            count = await self.registry.bulk_add_entries(entries)
 
-                # Update status
-                status.last_refresh = datetime.utcnow()
-                status.entry_count = count
-                status.status = "ok"
-                status.error_message = None
-                await self.registry.update_source_status(status)
+            # Update status
+            status.last_refresh = datetime.utcnow()
+            status.entry_count = count
+            status.status = "ok"
+            status.error_message = None
+            await self.registry.update_source_status(status)
 
-                logger.info(f"Successfully refreshed MCP Official Registry: {count} entries")
-            except Exception as e:
-                logger.error(f"Failed to refresh MCP Official Registry: {e}", exc_info=True)
-                status.status = "error"
-                status.error_message = str(e)
-                await self.registry.update_source_status(status)
+            logger.info(
+                f"Successfully refreshed MCP Official Registry: {count} entries "
+                f"in {time.monotonic() - started:.1f}s"
+            )
+        except Exception as e:
+            logger.error(f"Failed to refresh MCP Official Registry: {e}", exc_info=True)
+            status.status = "error"
+            status.error_message = str(e)
+            await self.registry.update_source_status(status)
 
     async def _refresh_source(self, source_type: SourceType) -> None:
         """Refresh a specific source.
 
+        If the source is already being refreshed, waits for that refresh to finish
+        instead of starting another one.
+
         Args:
             source_type: Source to refresh
         """
-        if source_type == SourceType.MCPSERVERS:
-            await self._refresh_mcpservers()
-        elif source_type == SourceType.DOCKER:
-            await self._refresh_docker_registry()
-        elif source_type == SourceType.MCP_OFFICIAL:
-            await self._refresh_mcp_official()
-        else:
-            logger.warning(f"No refresh handler for source: {source_type}")
+        inflight = self._inflight.get(source_type)
+        if inflight is not None:
+            logger.info(f"Refresh of {source_type.value} already in progress, waiting for it")
+            await inflight.wait()
+            return
+
+        done = self._inflight[source_type] = asyncio.Event()
+        try:
+            async with self._refresh_sem:
+                if source_type == SourceType.MCPSERVERS:
+                    await self._refresh_mcpservers()
+                elif source_type == SourceType.DOCKER:
+                    await self._refresh_docker_registry()
+                elif source_type == SourceType.MCP_OFFICIAL:
+                    await self._refresh_mcp_official()
+                else:
+                    logger.warning(f"No refresh handler for source: {source_type}")
+        finally:
+            del self._inflight[source_type]
+            done.set()
 
     async def _periodic_refresh_loop(self, source_type: SourceType) -> None:
         """Periodic refresh loop for a source.
@@ -171,9 +204,12 @@ class RefreshScheduler:
                 else:
                     logger.debug(f"Skipping refresh for {source_type.value} (too recent)")
 
-                # Wait for next check (check more frequently than interval)
-                check_interval = min(self._refresh_interval_seconds / 4, 3600)
-                await asyncio.sleep(check_interval)
+                # Wait for next check, or until force_refresh wakes the loops to re-evaluate
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=self._check_interval)
+                    self._wake.clear()
+                except asyncio.TimeoutError:
+                    pass
             except asyncio.CancelledError:
                 logger.info(f"Refresh loop cancelled for {source_type.value}")
                 break
@@ -185,6 +221,19 @@ class RefreshScheduler:
                 # Wait before retrying after error
                 await asyncio.sleep(60)
 
+    async def _run(self, sources: list[SourceType]) -> None:
+        """Run the refresh loops for ``sources`` until cancelled.
+
+        Args:
+            sources: Sources to refresh periodically
+        """
+        # Each loop refreshes its source on its first pass if needed, so this is also
+        # the initial refresh burst, bounded by _refresh_sem
+        async with asyncio.TaskGroup() as tg:
+            for source_type in sources:
+                tg.create_task(self._periodic_refresh_loop(source_type))
+                logger.info(f"Started refresh task for {source_type.value}")
+
     async def start(self) -> None:
         """Start background refresh tasks for all sources."""
         if self._running:
@@ -200,16 +249,7 @@ class RefreshScheduler:
             SourceType.DOCKER,
             SourceType.MCP_OFFICIAL,
         ]
-
-        for source_type in sources_to_refresh:
-            task = asyncio.create_task(self._periodic_refresh_loop(source_type))
-            self._tasks[source_type] = task
-            logger.info(f"Started refresh task for {source_type.value}")
-
-        # Trigger initial refresh for sources that need it
-        for source_type in sources_to_refresh:
-            if await self.registry.should_refresh_source(source_type):
-                asyncio.create_task(self._refresh_source(source_type))
+        self._run_task = asyncio.create_task(self._run(sources_to_refresh))
 
     async def stop(self) -> None:
         """Stop all background refresh tasks."""
@@ -220,17 +260,15 @@ class RefreshScheduler:
         self._running = False
         logger.info("Stopping refresh scheduler")
 
-        # Cancel all tasks
-        for source_type, task in self._tasks.items():
-            if not task.done():
-                task.cancel()
-                logger.info(f"Cancelled refresh task for {source_type.value}")
-
-        # Wait for tasks to complete
-        if self._tasks:
-            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        # Cancelling the runner cancels every task in its group and waits for them
+        if self._run_task is not None:
+            self._run_task.cancel()
+            try:
+                await self._run_task
+            except asyncio.CancelledError:
+                pass
+            self._run_task = None
 
-        self._tasks.clear()
         logger.info("Refresh scheduler stopped")
 
     async def force_refresh(self, source_type: SourceType) -> bool:
@@ -249,3 +287,5 @@ class RefreshScheduler:
         except Exception as e:
             logger.error(f"Force refresh failed for {source_type.value}: {e}")
             return False
+        finally:
+            self._wake.set()
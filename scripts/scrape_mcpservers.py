@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 # /// script
-# dependencies = ["httpx", "beautifulsoup4", "lxml"]
+# dependencies = ["httpx", "lxml"]
 # requires-python = ">=3.12"
 # ///
 
@@ -18,9 +18,8 @@ Features:
 - Output formats: json (default), markdown, csv.
 
 Dependencies:
-- requests
-- beautifulsoup4
-- lxml (optional but recommended for faster parsing)
+- httpx
+- lxml (pages are parsed and walked with lxml directly)
 
 Usage with uv:
 - uv run --script playwright-mcp-test/scripts/scrape_mcpservers.py --limit 5 --output markdown
@@ -44,12 +43,18 @@ from typing import Iterable
 from urllib.parse import urljoin, urlparse
 
 import httpx
-import requests
-from bs4 import BeautifulSoup, Tag
+from lxml import etree
+from lxml import html as lxml_html
+from lxml.html import HtmlElement
 
 # Constants
 BASE_URL = "https://mcpservers.org"
 ALL_PAGE = urljoin(BASE_URL, "/all")
+USER_AGENT = "mcpservers-scraper/1.0"
+# Listing, category and sitemap pages are fetched with a longer timeout than detail pages
+LISTING_TIMEOUT = 30
+# /official?page=N pages requested together while paginating until no new links appear
+OFFICIAL_PAGE_BATCH = 8
 
 # Canonical category mapping by slug
 CATEGORY_SLUG_MAP: dict[str, str] = {
@@ -129,23 +134,51 @@ def fetch_html(url: str, timeout: int = 20) -> str:
     resp = httpx.get(
         url,
         timeout=timeout,
-        headers={"User-Agent": "mcpservers-scraper/1.0"},
+        headers={"User-Agent": USER_AGENT},
         follow_redirects=True,
     )
     resp.raise_for_status()
     return resp.text
 
 
+def parse_document(html: str) -> HtmlElement:
+    """
+    Parse an HTML page into an lxml tree rooted at <html>.
+
+    Pages are walked with lxml directly: BeautifulSoup wraps every node in a Python
+    object, which made it the dominant CPU cost of a scrape.
+    """
+    try:
+        try:
+            return lxml_html.document_fromstring(html)
+        except ValueError:
+            # lxml rejects a str that carries an XML encoding declaration
+            return lxml_html.document_fromstring(html.encode("utf-8"))
+    except etree.ParserError:
+        # Nothing parseable (e.g. an empty body); treat it as an empty page
+        return lxml_html.Element("html")
+
+
+# Server detail hrefs below the context node, for listing pages
+SERVER_HREFS_XPATH = './/a/@href[starts-with(., "/servers/")]'
+
+
+def listing_main(html: str) -> HtmlElement:
+    """Return the <main> element of a listing page, or the whole page without one."""
+    tree = parse_document(html)
+    main = tree.find(".//main")
+    return main if main is not None else tree
+
+
 def parse_all_server_links(html: str) -> list[str]:
     """
     Extract all unique server detail page URLs from the /all listing.
     """
-    soup = BeautifulSoup(html, "lxml")
+    tree = parse_document(html)
     detail_links: set[str] = set()
 
     # Typical pattern: cards linking to /servers/<org>/<name> or /servers/<slug>
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
+    for href in tree.xpath("//a/@href"):
         # Normalize href to absolute
         abs_url = urljoin(BASE_URL, href)
 
@@ -161,22 +194,85 @@ def parse_all_server_links(html: str) -> list[str]:
     return links
 
 
-def textify(el: Tag | None) -> str:
-    if not el:
+# Text nested inside these elements is not page text (as with BeautifulSoup's
+# stripped_strings, which skips script/style/template and ruby annotations)
+NON_TEXT_TAGS = frozenset({"script", "style", "template", "rt", "rp"})
+HEADING_TAGS = ("h1", "h2", "h3", "h4", "h5", "h6")
+
+
+def _iter_strings(el: HtmlElement, root: bool = True) -> Iterable[str]:
+    if root or el.tag not in NON_TEXT_TAGS:
+        if el.text:
+            yield el.text
+        for child in el:
+            if isinstance(child.tag, str):  # Skip comments and processing instructions
+                yield from _iter_strings(child, root=False)
+            if child.tail:
+                yield child.tail
+
+
+def stripped_strings(el: HtmlElement) -> Iterable[str]:
+    for text in _iter_strings(el):
+        text = text.strip()
+        if text:
+            yield text
+
+
+def textify(el: HtmlElement | None) -> str:
+    if el is None:
         return ""
-    return " ".join(el.stripped_strings)
+    return " ".join(stripped_strings(el))
+
+
+def iter_links(tree: HtmlElement) -> Iterable[tuple[HtmlElement, str]]:
+    """Yield (anchor, href) for every <a> carrying an href, in document order."""
+    for a in tree.iter("a"):
+        href = a.get("href")
+        if href is not None:
+            yield a, href
+
+
+@dataclass(slots=True)
+class PageFeatures:
+    """Nodes the extractors need, gathered in one pass over a page."""
 
+    links: list[tuple[str, str]] = field(default_factory=list)  # (text, href), every <a href>
+    pres: list[HtmlElement] = field(default_factory=list)
+    codes: list[HtmlElement] = field(default_factory=list)
+    headings: list[tuple[HtmlElement, str]] = field(default_factory=list)  # (heading, text)
 
-def collect_code_blocks(soup: BeautifulSoup) -> list[str]:
+
+def extract_dom_features(tree: HtmlElement) -> PageFeatures:
+    """
+    Walk the page once, binning anchors, code containers and headings in document
+    order, so the extractors below don't each re-traverse the whole tree.
+    """
+    features = PageFeatures()
+    for el in tree.iter("a", "pre", "code", *HEADING_TAGS):
+        tag = el.tag
+        if tag == "a":
+            href = el.get("href")
+            if href is not None:
+                features.links.append((textify(el), str(href)))
+        elif tag == "pre":
+            features.pres.append(el)
+        elif tag == "code":
+            features.codes.append(el)
+        else:
+            features.headings.append((el, textify(el)))
+    return features
+
+
+def collect_code_blocks(pres: list[HtmlElement], codes: list[HtmlElement]) -> list[str]:
     blocks: list[str] = []
     # Common code containers
-    for pre in soup.find_all("pre"):
-        code_text = pre.get_text("\n", strip=True)
+    for pre in pres:
+        code_text = "\n".join(stripped_strings(pre))
         if code_text:
             blocks.append(code_text)
-    for code in soup.find_all("code"):
+    for code in codes:
         # Skip inline tiny code if not useful; but include non-trivial
-        code_text = code.get_text(" ", strip=True)
+        code_text = " ".join(stripped_strings(code))
         if code_text and len(code_text) > 20:
             blocks.append(code_text)
     # Deduplicate while preserving order
@@ -230,6 +326,14 @@ CLIENT_KEYWORDS: dict[str, list[str]] = {
     "Zed": ["Zed", "zed", "zed.dev"],
 }
 
+# Each keyword list as one case-insensitive alternation: a single regex scan per
+# string instead of lowercasing it and testing every keyword separately
+INSTALL_CODE_RE = re.compile("|".join(map(re.escape, INSTALL_CODE_KEYWORDS)), re.I)
+CLIENT_RES: dict[str, re.Pattern[str]] = {
+    client: re.compile("|".join(map(re.escape, keys)), re.I)
+    for client, keys in CLIENT_KEYWORDS.items()
+}
+
 # Environment variable name extraction (matches JSON and shell-like forms)
 ENV_VAR_RE = re.compile(
     r'"?([A-Z0-9_]{6,})"?\s*:\s*"(?:\\.|[^"])*"|(^|\b)([A-Z0-9_]{6,})\s*=\s*["\']?[^"\']+',
@@ -290,24 +394,17 @@ def extract_env_vars_from_text(text: str) -> list[str]:
 
 
 def classify_clients(text: str) -> list[str]:
-    hits: set[str] = set()
-    low = text.lower()
-    for client, keys in CLIENT_KEYWORDS.items():
-        for k in keys:
-            if k.lower() in low:
-                hits.add(client)
-                break
-    return sorted(hits)
+    return sorted(client for client, rx in CLIENT_RES.items() if rx.search(text))
 
 
 def group_install_instructions_by_client(
-    code_blocks: list[str], soup: BeautifulSoup
+    code_blocks: list[str], links: list[tuple[str, str]]
 ) -> dict[str, list[str]]:
     by_client: dict[str, list[str]] = {}
     # Consider code blocks
     for block in code_blocks:
         # Require install keywords to avoid unrelated client mentions
-        if not any(k.lower() in block.lower() for k in INSTALL_CODE_KEYWORDS):
+        if not INSTALL_CODE_RE.search(block):
             continue
         clients = classify_clients(block)
         if not clients:
@@ -315,16 +412,14 @@ def group_install_instructions_by_client(
         for c in clients:
             by_client.setdefault(c, []).append(block)
     # Consider install-related links/text
-    for a in soup.find_all("a", href=True):
-        text = textify(a)
+    for text, href in links:
         if not text:
             continue
         # Link must indicate install intent or contain install keywords
-        href = a["href"]
         installish = (
             re.search(r"\binstall\b", text, flags=re.I)
-            or any(k.lower() in text.lower() for k in INSTALL_CODE_KEYWORDS)
-            or any(k.lower() in href.lower() for k in INSTALL_CODE_KEYWORDS)
+            or INSTALL_CODE_RE.search(text)
+            or INSTALL_CODE_RE.search(href)
         )
         if not installish:
             continue
@@ -335,23 +430,30 @@ def group_install_instructions_by_client(
     return by_client
 
 
-def parse_related_servers(soup: BeautifulSoup) -> list[dict[str, str]]:
+def iter_section(heading: HtmlElement) -> Iterable[HtmlElement]:
+    """Yield the elements following a heading, up to the next heading."""
+    for sib in heading.itersiblings():
+        if not isinstance(sib.tag, str):  # Comment or processing instruction
+            continue
+        if sib.tag in HEADING_TAGS:
+            break
+        yield sib
+
+
+def parse_related_servers(headings: list[tuple[HtmlElement, str]]) -> list[dict[str, str]]:
     rel: list[dict[str, str]] = []
     # Look for "Related Servers" section heading
-    for h in soup.find_all(re.compile(r"^h[1-6]$")):
-        if re.search(r"\bRelated Servers\b", textify(h), re.I):
+    for h, h_text in headings:
+        if re.search(r"\bRelated Servers\b", h_text, re.I):
             # Collect subsequent links until next heading
-            sib = h.next_sibling
-            while sib and not (
-                isinstance(sib, Tag) and re.match(r"^h[1-6]$", sib.name or "")
-            ):
-                if isinstance(sib, Tag):
-                    for a in sib.find_all("a", href=True):
-                        name = textify(a)
-                        href = urljoin(BASE_URL, a["href"])
-                        if name and href and href.startswith(BASE_URL):
-                            rel.append({"name": name, "url": href})
-                sib = sib.next_sibling
+            for sib in iter_section(h):
+                for a, href in iter_links(sib):
+                    if a is sib:
+                        continue
+                    name = textify(a)
+                    href = urljoin(BASE_URL, href)
+                    if name and href and href.startswith(BASE_URL):
+                        rel.append({"name": name, "url": href})
             break
     # De-dupe by url
     seen: set[str] = set()
@@ -364,7 +466,9 @@ def parse_related_servers(soup: BeautifulSoup) -> list[dict[str, str]]:
 
 
 def filter_install_instructions(
-    code_blocks: Iterable[str], soup: BeautifulSoup
+    code_blocks: Iterable[str],
+    links: list[tuple[str, str]],
+    headings: list[tuple[HtmlElement, str]],
 ) -> list[str]:
     """
     Heuristic: prefer code blocks and prominent install links/snippets that contain
@@ -375,13 +479,11 @@ def filter_install_instructions(
 
     # Code blocks filtered by keywords
     for block in code_blocks:
-        if any(k.lower() in block.lower() for k in INSTALL_CODE_KEYWORDS):
+        if INSTALL_CODE_RE.search(block):
             instructions.append(block)
 
     # Install-related links
-    for a in soup.find_all("a", href=True):
-        text = textify(a)
-        href = a["href"]
+    for text, href in links:
         if not text:
             continue
         if re.search(r"\binstall\b", text, flags=re.I) or re.search(
@@ -390,20 +492,14 @@ def filter_install_instructions(
             instructions.append(f"{text}: {urljoin(BASE_URL, href)}")
 
     # Nearby text around 'Getting started' or 'install' headings
-    for h in soup.find_all(re.compile(r"^h[1-6]$")):
-        h_text = textify(h)
+    for h, h_text in headings:
         if re.search(r"getting started|install", h_text, flags=re.I):
             # Collect subsequent sibling paragraphs until next heading
-            sib = h.next_sibling
             collected_chunk: list[str] = [h_text]
-            while sib and not (
-                isinstance(sib, Tag) and re.match(r"^h[1-6]$", sib.name or "")
-            ):
-                if isinstance(sib, Tag):
-                    para_txt = textify(sib)
-                    if para_txt:
-                        collected_chunk.append(para_txt)
-                sib = sib.next_sibling
+            for sib in iter_section(h):
+                para_txt = textify(sib)
+                if para_txt:
+                    collected_chunk.append(para_txt)
             chunk = "\n".join(collected_chunk)
             if chunk and len(chunk.strip()) > 0:
                 instructions.append(chunk)
@@ -445,25 +541,26 @@ API_KEY_NEGATIVE_PATTERNS = [
 ]
 
 
+# Each pattern list as one alternation, so the page text is scanned once per list
+API_KEY_NEGATIVE_RE = re.compile("|".join(f"(?:{p})" for p in API_KEY_NEGATIVE_PATTERNS), re.I)
+API_KEY_POSITIVE_RE = re.compile("|".join(f"(?:{p})" for p in API_KEY_POSITIVE_PATTERNS), re.I)
+
+
 def detect_api_key_requirement(full_text: str) -> tuple[bool | None, list[str]]:
     """
     Return (requires_api_key, evidence)
     True if likely requires, False if likely not required, None if ambiguous.
+    Evidence lists the distinct matched phrases in page order.
     """
     evidence: list[str] = []
 
-    for pat in API_KEY_NEGATIVE_PATTERNS:
-        m = re.search(pat, full_text, flags=re.I)
-        if m:
-            evidence.append(f"NEGATIVE: {m.group(0)}")
-            # If any strong negative pattern found, likely false
-            return False, evidence
+    m = API_KEY_NEGATIVE_RE.search(full_text)
+    if m:
+        evidence.append(f"NEGATIVE: {m.group(0)}")
+        # If any strong negative pattern found, likely false
+        return False, evidence
 
-    positives = []
-    for pat in API_KEY_POSITIVE_PATTERNS:
-        m = re.search(pat, full_text, flags=re.I)
-        if m:
-            positives.append(m.group(0))
+    positives = list(dict.fromkeys(m.group(0) for m in API_KEY_POSITIVE_RE.finditer(full_text)))
 
     if positives:
         evidence.extend([f"POSITIVE: {p}" for p in positives])
@@ -480,59 +577,59 @@ def parse_server_html(
     official_map: set[str] | None = None,
     featured_set: set[str] | None = None,
 ) -> ServerInfo:
-    soup = BeautifulSoup(html, "lxml")
+    tree = parse_document(html)
 
     # Name: first h1 in main content
     name = None
-    main = soup.find("main")
-    h1: Tag | None = None
-    if main:
-        h1 = main.find("h1")
-        if h1:
+    main = tree.find(".//main")
+    h1: HtmlElement | None = None
+    if main is not None:
+        h1 = main.find(".//h1")
+        if h1 is not None:
             name = textify(h1)
 
     if not name:
         # Fallback: title tag
-        title_tag = soup.find("title")
-        name = textify(title_tag) if title_tag else url
+        title_tag = tree.find(".//title")
+        name = textify(title_tag) if title_tag is not None else url
 
     # Short description: first meaningful paragraph after the H1, or first paragraph in main
     description: str | None = None
-    if main:
-        desc_p: Tag | None = None
-        if h1:
+    if main is not None:
+        desc_p: HtmlElement | None = None
+        if h1 is not None:
             # Walk siblings after h1 to find the first paragraph with text
-            sib = h1.next_sibling
-            while sib:
-                if isinstance(sib, Tag) and sib.name == "p":
-                    ptxt = textify(sib)
-                    if ptxt:
-                        desc_p = sib
-                        break
-                sib = sib.next_sibling
-        if not desc_p:
+            for sib in h1.itersiblings("p"):
+                if textify(sib):
+                    desc_p = sib
+                    break
+        if desc_p is None:
             # Fallback to first paragraph anywhere in main content
-            cand = main.find("p")
-            if cand and textify(cand):
+            cand = main.find(".//p")
+            if cand is not None and textify(cand):
                 desc_p = cand
-        if desc_p:
+        if desc_p is not None:
             description = textify(desc_p)
 
+    # One pass over the tree feeds every extractor below
+    features = extract_dom_features(tree)
+
     # GitHub link
     github_url = None
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
+    for _, href in features.links:
         if "github.com" in href:
             github_url = href
             break
 
     # Install instructions and clients
-    code_blocks = collect_code_blocks(soup)
-    install_instructions = filter_install_instructions(code_blocks, soup)
-    installs_by_client = group_install_instructions_by_client(code_blocks, soup)
+    code_blocks = collect_code_blocks(features.pres, features.codes)
+    install_instructions = filter_install_instructions(
+        code_blocks, features.links, features.headings
+    )
+    installs_by_client = group_install_instructions_by_client(code_blocks, features.links)
 
     # API key requirement
-    page_text = textify(main) if main else soup.get_text(" ", strip=True)
+    page_text = textify(main) if main is not None else textify(tree)
     requires_api_key, evidence = detect_api_key_requirement(page_text)
 
     # Clients supported (scan whole page text + code blocks)
@@ -544,7 +641,7 @@ def parse_server_html(
     )
 
     # Related servers section
-    related_servers = parse_related_servers(soup)
+    related_servers = parse_related_servers(features.headings)
 
     # Categories: prefer listing-derived mapping (multi-category support)
     categories: list[str] = category_map.get(url, []) if category_map else []
@@ -661,7 +758,206 @@ def merge_duplicates_by_repo(servers: list[ServerInfo]) -> list[ServerInfo]:
     return list(by_repo.values()) + standalone
 
 
+def _make_client(http2: bool, max_connections: int, max_keepalive: int) -> httpx.AsyncClient:
+    # Configure connection limits for httpx client
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive,
+    )
+    return httpx.AsyncClient(timeout=20, limits=limits, http2=http2)
+
+
+async def _get_listing(client: httpx.AsyncClient, url: str) -> httpx.Response:
+    """Fetch a listing, category or sitemap page with the shared client."""
+    return await client.get(
+        url,
+        timeout=LISTING_TIMEOUT,
+        headers={"User-Agent": USER_AGENT},
+        follow_redirects=True,
+    )
+
+
+async def _fetch_listing_cached(
+    client: httpx.AsyncClient, url: str, cache_dir: str | None, read_cache: bool
+) -> str:
+    """
+    Fetch a listing page, reading it from cache_dir when read_cache is set.
+
+    Freshly fetched pages are written back to cache_dir when one is given.
+    """
+    cpath: Path | None = None
+    if cache_dir:
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        h = hashlib.sha256(url.encode()).hexdigest()[:24]
+        cpath = Path(cache_dir) / f"{h}.html"
+        if read_cache and cpath.exists():
+            return cpath.read_text(encoding="utf-8")
+    resp = await _get_listing(client, url)
+    resp.raise_for_status()
+    if cpath:
+        try:
+            cpath.write_text(resp.text, encoding="utf-8")
+        except Exception:
+            logger.debug(f"Failed to write listing cache for {url}")
+    return resp.text
+
+
+async def _collect_category_links(
+    client: httpx.AsyncClient,
+    concurrency: int,
+    strict_official: bool,
+    category_map: dict[str, list[str]],
+    official_map: set[str],
+    featured_set: set[str],
+) -> set[str]:
+    """
+    Collect server links from the /official and category listing pages.
+
+    Pages are fetched concurrently, then folded into the maps in slug and page order,
+    so a server listed under several categories is attributed exactly as a
+    page-by-page walk would attribute it.
+    """
+    sem = asyncio.Semaphore(concurrency)
+    category_links: set[str] = set()
+
+    async def get(url: str) -> httpx.Response:
+        async with sem:
+            return await _get_listing(client, url)
+
+    # Discover category slugs dynamically from the /all page
+    try:
+        resp_all = await get(f"{BASE_URL}/all")
+        # Mark featured servers from first page listing
+        try:
+            tree_all = parse_document(resp_all.text)
+            feat_count = 0
+            for href in tree_all.xpath('//a/@href[starts-with(., "/servers/")]'):
+                u = urljoin(BASE_URL, href)
+                featured_set.add(u)
+                feat_count += 1
+            logger.info(f"Identified {feat_count} featured servers (flags only)")
+        except Exception:
+            pass
+        resp_all.raise_for_status()
+        tree_all = parse_document(resp_all.text)
+        cat_slugs: set[str] = set()
+        for href in tree_all.xpath('//a/@href[starts-with(., "/category/")]'):
+            slug = href.rstrip("/").split("/")[-1]
+            if slug:
+                cat_slugs.add(slug)
+        logger.info(
+            f"Discovered category slugs: {sorted(cat_slugs)} (official present: {'official' in cat_slugs})"
+        )
+    except Exception:
+        cat_slugs = set()
+
+    def add_official_page(resp_off: httpx.Response | BaseException) -> bool:
+        """Record one /official page; return False once pagination should stop."""
+        if isinstance(resp_off, BaseException) or resp_off.status_code >= 400:
+            return False
+        try:
+            main_off = listing_main(resp_off.text)
+        except Exception:
+            return False
+        new_links = 0
+        for href in main_off.xpath(SERVER_HREFS_XPATH):
+            u = urljoin(BASE_URL, href)
+            if u not in official_map:
+                official_map.add(u)
+                new_links += 1
+            if u not in category_links:
+                category_links.add(u)
+        # Stop early if no new official links discovered on this page
+        return new_links > 0
+
+    # Scrape dedicated /official pages (site-specific) if 'official' slug not in discovered categories
+    if "official" not in cat_slugs:
+        try:
+            max_official_pages = 1000  # remove artificial 10-page cap; paginate fully until no new links
+            total_official_before = len(official_map)
+            for first in range(1, max_official_pages + 1, OFFICIAL_PAGE_BATCH):
+                batch = range(first, min(first + OFFICIAL_PAGE_BATCH, max_official_pages + 1))
+                responses = await asyncio.gather(
+                    *(
+                        get(f"{BASE_URL}/official" + ("" if page == 1 else f"?page={page}"))
+                        for page in batch
+                    ),
+                    return_exceptions=True,
+                )
+                if not all(add_official_page(resp_off) for resp_off in responses):
+                    break
+            logger.info(
+                f"Collected {len(official_map) - total_official_before} official servers from /official pages (total={len(official_map)})"
+            )
+        except Exception:
+            logger.warning("Failed scraping /official pages for official flags")
+
+    async def fetch_category(slug: str) -> list[str]:
+        """Fetch every page of one category and return its server hrefs in page order."""
+        resp0 = await get(f"{BASE_URL}/category/{slug}")
+        resp0.raise_for_status()
+        main0 = listing_main(resp0.text)
+        # Find max page from pagination links (?page=N)
+        max_page = 1
+        for hrefp in main0.xpath('.//a/@href[contains(., "?page=")]'):
+            m = re.search(r"[?&]page=(\d+)", hrefp)
+            if m:
+                try:
+                    max_page = max(max_page, int(m.group(1)))
+                except ValueError:
+                    pass
+        # Restrict official category pagination to first 10 pages
+        if slug == "official":
+            max_page = min(max_page, 10)
+        if slug == "official" and strict_official:
+            # Limit official category pagination in strict mode
+            original_max = max_page
+            max_page = min(max_page, 10)
+            logger.info(
+                f"Strict official mode: limiting official pages from {original_max} to {max_page}"
+            )
+        hrefs = list(main0.xpath(SERVER_HREFS_XPATH))
+        # Fetch remaining pages 2..max_page together
+        responses = await asyncio.gather(
+            *(get(f"{BASE_URL}/category/{slug}?page={page}") for page in range(2, max_page + 1)),
+            return_exceptions=True,
+        )
+        for resp in responses:
+            try:
+                if isinstance(resp, BaseException):
+                    raise resp
+                resp.raise_for_status()
+                hrefs.extend(listing_main(resp.text).xpath(SERVER_HREFS_XPATH))
+            except Exception:
+                # Continue to next page on error
+                continue
+        return hrefs
+
+    slugs = sorted(cat_slugs)
+    results = await asyncio.gather(*(fetch_category(slug) for slug in slugs), return_exceptions=True)
+    # For each category, collect server links + official badges
+    for slug, hrefs in zip(slugs, results):
+        if isinstance(hrefs, BaseException):
+            # Skip this category if first page fails
+            continue
+        # Derive canonical category name from slug (ignore heading text for normalization)
+        page_category_name0 = CATEGORY_SLUG_MAP.get(slug, "Other")
+        for href in hrefs:
+            u = urljoin(BASE_URL, href)
+            if u in category_links:
+                continue
+            category_links.add(u)
+            if slug == "official":
+                official_map.add(u)
+            else:
+                category_map.setdefault(u, [])
+                if page_category_name0 not in category_map[u]:
+                    category_map[u].append(page_category_name0)
+    return category_links
+
+
 async def _scrape_detail_pages_async(
+    client: httpx.AsyncClient,
     links: list[str],
     concurrency: int,
     cache_dir: str | None,
@@ -670,9 +966,6 @@ async def _scrape_detail_pages_async(
     category_map: dict[str, str] | None,
     official_map: set[str] | None,
     featured_set: set[str] | None,
-    http2: bool,
-    max_connections: int,
-    max_keepalive: int,
 ) -> list[ServerInfo]:
     sem = asyncio.Semaphore(concurrency)
 
@@ -686,58 +979,56 @@ async def _scrape_detail_pages_async(
         h = hashlib.sha256(url.encode()).hexdigest()[:24]
         return str(Path(cache_dir) / f"{h}.html")
 
-    # Configure connection limits for httpx client
-    limits = httpx.Limits(
-        max_connections=max_connections,
-        max_keepalive_connections=max_keepalive,
-    )
-    async with httpx.AsyncClient(timeout=20, limits=limits, http2=http2) as client:
-
-        async def fetch_one(idx: int, url: str):
-            async with sem:
-                try:
-                    # Try cache (resume or general caching)
-                    cpath = _cache_path(url)
-                    if cpath and not force_refresh:
-                        try:
-                            with open(cpath, "r", encoding="utf-8") as fh:
-                                html = fh.read()
-                                if html and resume:
-                                    info = parse_server_html(
-                                        url,
-                                        html,
-                                        category_map,
-                                        official_map,
-                                        featured_set,
-                                    )
-                                    logger.info(
-                                        f"[{idx}/{len(links)}] Resumed {url} (cache)"
-                                    )
-                                    return idx, info
-                        except FileNotFoundError:
-                            pass
-                    # Fetch from network
-                    resp = await client.get(url)
-                    resp.raise_for_status()
-                    html = resp.text
-                    # Write cache
-                    if cpath:
-                        try:
-                            with open(cpath, "w", encoding="utf-8") as fh:
-                                fh.write(html)
-                        except Exception:
-                            logger.debug(f"Failed to write cache for {url}")
-                    info = parse_server_html(
-                        url, html, category_map, official_map, featured_set
-                    )
-                    logger.info(f"[{idx}/{len(links)}] Scraped {url}")
-                    return idx, info
-                except Exception as e:
-                    logger.error(f"Failed to scrape {url}: {e}", exc_info=True)
-                    return idx, None
-
-        tasks = [fetch_one(i, u) for i, u in enumerate(links, start=1)]
-        results = await asyncio.gather(*tasks)
+    async def fetch_one(idx: int, url: str):
+        async with sem:
+            try:
+                # Try cache (resume or general caching)
+                cpath = _cache_path(url)
+                # Disk I/O and parsing run in worker threads so cache hits and
+                # parsing of one page overlap with network fetches of others
+                if cpath and not force_refresh:
+                    try:
+                        html = await asyncio.to_thread(
+                            Path(cpath).read_text, encoding="utf-8"
+                        )
+                        if html and resume:
+                            info = await asyncio.to_thread(
+                                parse_server_html,
+                                url,
+                                html,
+                                category_map,
+                                official_map,
+                                featured_set,
+                            )
+                            logger.info(
+                                f"[{idx}/{len(links)}] Resumed {url} (cache)"
+                            )
+                            return idx, info
+                    except FileNotFoundError:
+                        pass
+                # Fetch from network
+                resp = await client.get(url)
+                resp.raise_for_status()
+                html = resp.text
+                # Write cache
+                if cpath:
+                    try:
+                        await asyncio.to_thread(
+                            Path(cpath).write_text, html, encoding="utf-8"
+                        )
+                    except Exception:
+                        logger.debug(f"Failed to write cache for {url}")
+                info = await asyncio.to_thread(
+                    parse_server_html, url, html, category_map, official_map, featured_set
+                )
+                logger.info(f"[{idx}/{len(links)}] Scraped {url}")
+                return idx, info
+            except Exception as e:
+                logger.error(f"Failed to scrape {url}: {e}", exc_info=True)
+                return idx, None
+
+    tasks = [fetch_one(i, u) for i, u in enumerate(links, start=1)]
+    results = await asyncio.gather(*tasks)
     # Preserve order and drop None
     ordered: list[ServerInfo] = []
     for _, info in sorted(results, key=lambda t: t[0]):
@@ -746,6 +1037,30 @@ async def _scrape_detail_pages_async(
     return ordered
 
 
+def _write_meta_maps(
+    meta_dir_path: pathlib.Path,
+    category_map: dict[str, list[str]],
+    official_map: set[str],
+    featured_set: set[str],
+) -> None:
+    (meta_dir_path / "category_map.json").write_text(
+        json.dumps(
+            {k: v for k, v in category_map.items()},
+            ensure_ascii=False,
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+    (meta_dir_path / "official_map.json").write_text(
+        json.dumps(sorted(list(official_map)), ensure_ascii=False, indent=2),
+        encoding="utf-8",
+    )
+    (meta_dir_path / "featured_set.json").write_text(
+        json.dumps(sorted(list(featured_set)), ensure_ascii=False, indent=2),
+        encoding="utf-8",
+    )
+
+
 def scrape_all_servers(
     limit: int | None = None,
     concurrency: int = 20,
@@ -761,12 +1076,10 @@ def scrape_all_servers(
     max_keepalive: int = 32,
     strict_official: bool = False,
 ) -> list[ServerInfo]:
-    links: list[str]
     # Pre-pass: build category and official maps from category listing pages
     category_map: dict[str, list[str]] = {}
     official_map: set[str] = set()
     featured_set: set[str] = set()
-    category_links: set[str] = set()
     # Use separate meta cache dir for maps (category/official/featured flags)
     meta_dir_path: pathlib.Path | None = None
     if meta_cache_dir:
@@ -806,325 +1119,70 @@ def scrape_all_servers(
             logger.debug("Failed to load meta cache maps")
         # Always rebuild official_map fresh (persisted values may be stale or overly broad)
         official_map.clear()
-    if use_categories:
-        # Discover category slugs dynamically from the /all page
-        try:
-            resp_all = httpx.get(
-                f"{BASE_URL}/all",
-                timeout=30,
-                headers={"User-Agent": "mcpservers-scraper/1.0"},
-                follow_redirects=True,
-            )
-            # Mark featured servers from first page listing
-            try:
-                soup_feat = BeautifulSoup(resp_all.text, "lxml")
-                feat_count = 0
-                for a in soup_feat.select('a[href^="/servers/"]'):
-                    href = a.get("href", "")
-                    if not href:
-                        continue
-                    u = urljoin(BASE_URL, href)
-                    featured_set.add(u)
-                    feat_count += 1
-                logger.info(f"Identified {feat_count} featured servers (flags only)")
-            except Exception:
-                pass
-            resp_all.raise_for_status()
-            soup_all = BeautifulSoup(resp_all.text, "lxml")
-            cat_slugs: set[str] = set()
-            for a in soup_all.select('a[href^="/category/"]'):
-                href = a.get("href", "")
-                if not href:
-                    continue
-                slug = href.rstrip("/").split("/")[-1]
-                if slug:
-                    cat_slugs.add(slug)
-            logger.info(
-                f"Discovered category slugs: {sorted(cat_slugs)} (official present: {'official' in cat_slugs})"
-            )
-        except Exception:
-            cat_slugs = set()
-        # Scrape dedicated /official pages (site-specific) if 'official' slug not in discovered categories
-        if "official" not in cat_slugs:
-            try:
-                max_official_pages = 1000  # remove artificial 10-page cap; paginate fully until no new links
-                total_official_before = len(official_map)
-                for page in range(1, max_official_pages + 1):
-                    off_url = f"{BASE_URL}/official" + (
-                        "" if page == 1 else f"?page={page}"
-                    )
-                    try:
-                        resp_off = httpx.get(
-                            off_url,
-                            timeout=30,
-                            headers={"User-Agent": "mcpservers-scraper/1.0"},
-                            follow_redirects=True,
-                        )
-                        if resp_off.status_code >= 400:
-                            break
-                        soup_off = BeautifulSoup(resp_off.text, "lxml")
-                        main_off = soup_off.find("main") or soup_off
-                        new_links = 0
-                        for a in main_off.select('a[href^="/servers/"]'):
-                            href = a.get("href", "")
-                            if not href:
-                                continue
-                            u = urljoin(BASE_URL, href)
-                            if u not in official_map:
-                                official_map.add(u)
-                                new_links += 1
-                            if u not in category_links:
-                                category_links.add(u)
-                        if new_links == 0:
-                            # Stop early if no new official links discovered on this page
-                            break
-                    except Exception:
-                        break
-                logger.info(
-                    f"Collected {len(official_map) - total_official_before} official servers from /official pages (total={len(official_map)})"
+
+    async def discover_and_scrape() -> list[ServerInfo]:
+        # One client serves the listing pre-pass and the detail pages, so both share its
+        # connection pool and the pre-pass no longer fetches one page at a time.
+        async with _make_client(http2, max_connections, max_keepalive) as client:
+            links: list[str]
+            if use_categories:
+                # Featured already flagged earlier; do not add to categories
+                category_links = await _collect_category_links(
+                    client,
+                    concurrency,
+                    strict_official,
+                    category_map,
+                    official_map,
+                    featured_set,
                 )
-            except Exception:
-                logger.warning("Failed scraping /official pages for official flags")
-        # For each category, paginate and collect server links + official badges
-        for slug in sorted(cat_slugs):
-            # Log discovered slugs for debugging
-            logger.info(f"Discovered category slugs: {sorted(cat_slugs)}")
-            # Determine max pagination page from first page, then iterate deterministically
-            try:
-                first_url = f"{BASE_URL}/category/{slug}"
-                resp0 = httpx.get(
-                    first_url,
-                    timeout=30,
-                    headers={"User-Agent": "mcpservers-scraper/1.0"},
-                    follow_redirects=True,
+                links = sorted(category_links)
+            elif use_sitemap:
+                # Discover server links via sitemap.xml
+                sm_url = sitemap_url or f"{BASE_URL}/sitemap.xml"
+                sitemap_text = await _fetch_listing_cached(
+                    client, sm_url, cache_dir, resume and not force_refresh
                 )
-                resp0.raise_for_status()
-                soup0 = BeautifulSoup(resp0.text, "lxml")
-                main0 = soup0.find("main") or soup0
-                # Derive canonical category name from slug (ignore heading text for normalization)
-                canonical_name = CATEGORY_SLUG_MAP.get(slug, "Other")
-                page_category_name0 = canonical_name
-                # Find max page from pagination links (?page=N)
-                max_page = 1
-                for p in main0.select('a[href*="?page="]'):
-                    hrefp = p.get("href", "")
-                    m = re.search(r"[?&]page=(\d+)", hrefp)
-                    if m:
-                        try:
-                            max_page = max(max_page, int(m.group(1)))
-                        except ValueError:
-                            pass
-                # Restrict official category pagination to first 10 pages
-                if slug == "official":
-                    max_page = min(max_page, 10)
-                if slug == "official" and strict_official:
-                    # Limit official category pagination in strict mode
-                    original_max = max_page
-                    max_page = min(max_page, 10)
-                    logger.info(
-                        f"Strict official mode: limiting official pages from {original_max} to {max_page}"
-                    )
-                # Process page 1 now
-                for a in main0.select('a[href^="/servers/"]'):
-                    href = a.get("href", "")
-                    if not href:
-                        continue
-                    u = urljoin(BASE_URL, href)
-                    if u in category_links:
-                        continue
-                    category_links.add(u)
-                    # Nearest container for badge detection
-                    container = a.find_parent(["li", "article", "div"]) or a
-                    if slug == "official":
-                        official_map.add(u)
-                    else:
-                        category_map.setdefault(u, [])
-                        if page_category_name0 not in category_map[u]:
-                            category_map[u].append(page_category_name0)
-                # Iterate remaining pages 2..max_page
-                for page in range(2, max_page + 1):
-                    cat_url = f"{BASE_URL}/category/{slug}?page={page}"
-                    try:
-                        resp = httpx.get(
-                            cat_url,
-                            timeout=30,
-                            headers={"User-Agent": "mcpservers-scraper/1.0"},
-                            follow_redirects=True,
-                        )
-                        resp.raise_for_status()
-                        soup = BeautifulSoup(resp.text, "lxml")
-                        main_el = soup.find("main") or soup
-                        # Category name should match first page h1
-                        for a in main_el.select('a[href^="/servers/"]'):
-                            href = a.get("href", "")
-                            if not href:
-                                continue
-                            u = urljoin(BASE_URL, href)
-                            if u in category_links:
-                                continue
-                            category_links.add(u)
-                            container = a.find_parent(["li", "article", "div"]) or a
-                            if slug == "official":
-                                official_map.add(u)
-                            else:
-                                category_map.setdefault(u, [])
-                                if page_category_name0 not in category_map[u]:
-                                    category_map[u].append(page_category_name0)
-                    except Exception:
-                        # Continue to next page on error
-                        continue
-            except Exception:
-                # Skip this category if first page fails
-                continue
-
-    if use_categories:
-        # Featured already flagged earlier; do not add to categories
-        links = sorted(category_links)
-    elif use_sitemap:
-        # Discover server links via sitemap.xml
-        sm_url = sitemap_url or f"{BASE_URL}/sitemap.xml"
-        sitemap_text: str
-
-        if cache_dir and resume and not force_refresh:
-            # Attempt to read cached sitemap
-            import hashlib
-            # from pathlib import Path  # removed to avoid creating local Path
-
-            Path(cache_dir).mkdir(parents=True, exist_ok=True)
-            sh = hashlib.sha256(sm_url.encode()).hexdigest()[:24]
-            spath = Path(cache_dir) / f"{sh}.html"
-            if spath.exists():
-                sitemap_text = spath.read_text(encoding="utf-8")
-            else:
-                resp = httpx.get(
-                    sm_url,
-                    timeout=30,
-                    headers={"User-Agent": "mcpservers-scraper/1.0"},
-                    follow_redirects=True,
+                # Parse URLs from sitemap content and filter server detail pages
+                candidates = re.findall(r"https?://[^\s<>]+", sitemap_text)
+                links = sorted(
+                    {u for u in candidates if u.startswith(BASE_URL) and "/servers/" in u}
                 )
-                resp.raise_for_status()
-                sitemap_text = resp.text
-                spath.write_text(sitemap_text, encoding="utf-8")
-        else:
-            resp = httpx.get(
-                sm_url,
-                timeout=30,
-                headers={"User-Agent": "mcpservers-scraper/1.0"},
-                follow_redirects=True,
-            )
-            resp.raise_for_status()
-            sitemap_text = resp.text
-            if cache_dir:
-                import hashlib
-                # from pathlib import Path  # removed to rely on module-level Path
-
-                Path(cache_dir).mkdir(parents=True, exist_ok=True)
-                sh = hashlib.sha256(sm_url.encode()).hexdigest()[:24]
-                spath = Path(cache_dir) / f"{sh}.html"
-                try:
-                    spath.write_text(sitemap_text, encoding="utf-8")
-                except Exception:
-                    logger.debug("Failed to write sitemap cache")
-
-        # Parse URLs from sitemap content and filter server detail pages
-        candidates = re.findall(r"https?://[^\s<>]+", sitemap_text)
-        links = sorted(
-            {u for u in candidates if u.startswith(BASE_URL) and "/servers/" in u}
-        )
-        logger.info(f"Discovered {len(links)} server pages via sitemap")
-    else:
-        # Cache listing page
-        listing_html: str
-        if cache_dir and resume and not force_refresh:
-            # Attempt to read cached listing
-            import hashlib
-            # from pathlib import Path  # removed to prevent local shadowing
-
-            Path(cache_dir).mkdir(parents=True, exist_ok=True)
-            lh = hashlib.sha256(ALL_PAGE.encode()).hexdigest()[:24]
-            lpath = Path(cache_dir) / f"{lh}.html"
-            if lpath.exists():
-                listing_html = lpath.read_text(encoding="utf-8")
+                logger.info(f"Discovered {len(links)} server pages via sitemap")
             else:
-                listing_html = fetch_html(ALL_PAGE)
-                lpath.write_text(listing_html, encoding="utf-8")
-        else:
-            listing_html = fetch_html(ALL_PAGE)
-            if cache_dir:
-                import hashlib
+                listing_html = await _fetch_listing_cached(
+                    client, ALL_PAGE, cache_dir, resume and not force_refresh
+                )
+                links = parse_all_server_links(listing_html)
+                # Official detection is sourced from category pages only in this mode.
 
-                Path(cache_dir).mkdir(parents=True, exist_ok=True)
-                lh = hashlib.sha256(ALL_PAGE.encode()).hexdigest()[:24]
-                lpath = Path(cache_dir) / f"{lh}.html"
+            if limit is not None:
+                links = links[:limit]
+            # Persist updated maps before scraping details (so a failed run still leaves maps)
+            if meta_dir_path:
                 try:
-                    lpath.write_text(listing_html, encoding="utf-8")
+                    _write_meta_maps(meta_dir_path, category_map, official_map, featured_set)
                 except Exception:
-                    logger.debug("Failed to write listing cache")
-
-        links = parse_all_server_links(listing_html)
-        # Official detection is sourced from category pages only in this mode.
-        pass
-
-    if limit is not None:
-        links = links[:limit]
-    # Persist updated maps before scraping details (so a failed run still leaves maps)
-    if meta_dir_path:
-        try:
-            (meta_dir_path / "category_map.json").write_text(
-                json.dumps(
-                    {k: v for k, v in category_map.items()},
-                    ensure_ascii=False,
-                    indent=2,
-                ),
-                encoding="utf-8",
-            )
-            (meta_dir_path / "official_map.json").write_text(
-                json.dumps(sorted(list(official_map)), ensure_ascii=False, indent=2),
-                encoding="utf-8",
-            )
-            (meta_dir_path / "featured_set.json").write_text(
-                json.dumps(sorted(list(featured_set)), ensure_ascii=False, indent=2),
-                encoding="utf-8",
+                    logger.debug("Failed to persist meta maps before detail scrape")
+            return await _scrape_detail_pages_async(
+                client,
+                links,
+                concurrency,
+                cache_dir,
+                resume,
+                force_refresh,
+                category_map,
+                official_map,
+                featured_set,
             )
-        except Exception:
-            logger.debug("Failed to persist meta maps before detail scrape")
-    servers = asyncio.run(
-        _scrape_detail_pages_async(
-            links,
-            concurrency,
-            cache_dir,
-            resume,
-            force_refresh,
-            category_map,
-            official_map,
-            featured_set,
-            http2,
-            max_connections,
-            max_keepalive,
-        )
-    )
+
+    servers = asyncio.run(discover_and_scrape())
     logger.info(
         f"Final official flag count: {sum(1 for s in servers if s.official)} (strict_official={strict_official})"
     )
     # Persist again after successful scrape (may include newly discovered servers)
     if meta_dir_path:
         try:
-            (meta_dir_path / "category_map.json").write_text(
-                json.dumps(
-                    {k: v for k, v in category_map.items()},
-                    ensure_ascii=False,
-                    indent=2,
-                ),
-                encoding="utf-8",
-            )
-            (meta_dir_path / "official_map.json").write_text(
-                json.dumps(sorted(list(official_map)), ensure_ascii=False, indent=2),
-                encoding="utf-8",
-            )
-            (meta_dir_path / "featured_set.json").write_text(
-                json.dumps(sorted(list(featured_set)), ensure_ascii=False, indent=2),
-                encoding="utf-8",
-            )
+            _write_meta_maps(meta_dir_path, category_map, official_map, featured_set)
             logger.info(
                 f"Meta caches persisted: {len(category_map)} category entries, "
                 f"{len(official_map)} official, {len(featured_set)} featured flags"
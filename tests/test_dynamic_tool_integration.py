@@ -327,3 +327,74 @@ class TestDynamicToolIntegration:
 
         with pytest.raises(ValueError, match="Execution failed"):
             await func()
+
+    @pytest.mark.asyncio
+    async def test_register_and_unregister_tools(self):
+        """Test batch registration of discovered tools with the FastMCP server."""
+        from mcp_registry_server import server
+
+        async def executor(tool_name: str, arguments: dict[str, Any]) -> str:
+            return f"{tool_name}:{arguments['text']}"
+
+        tools = [
+            {
+                "name": "echo",
+                "description": "Echo text",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {"text": {"type": "string"}},
+                    "required": ["text"],
+                },
+            },
+            {"name": "broken", "inputSchema": "not-a-schema"},
+        ]
+
+        names = server._register_tools(server._build_dynamic_tools(tools, "batch", executor))
+        try:
+            assert names == {"mcp_batch_echo"}
+            registered = await server.mcp.get_tools()
+            assert "mcp_batch_echo" in registered
+
+            result = await server.mcp._tool_manager.call_tool("mcp_batch_echo", {"text": "hi"})
+            assert result.content[0].text == "echo:hi"
+        finally:
+            server._unregister_tools(names)
+
+        assert "mcp_batch_echo" not in await server.mcp.get_tools()
+        # Names that are already gone are skipped rather than raised
+        server._unregister_tools(names | {"mcp_batch_missing"})
+
+    @pytest.mark.asyncio
+    async def test_rebuilt_tools_reuse_cache_with_new_executor(self):
+        """Test that identical schemas reuse the built tool but call the latest executor."""
+        from mcp_registry_server import server
+
+        tool = {
+            "name": "ping",
+            "description": "Ping",
+            "inputSchema": {"type": "object", "properties": {"text": {"type": "string"}}},
+        }
+
+        async def first(tool_name: str, arguments: dict[str, Any]) -> str:
+            return "first"
+
+        async def second(tool_name: str, arguments: dict[str, Any]) -> str:
+            return "second"
+
+        [tool_a] = server._build_dynamic_tools([tool], "cache", first)
+        hits = server._validate_cached.cache_info().hits
+        [tool_b] = server._build_dynamic_tools([dict(tool)], "cache", second)
+        assert server._validate_cached.cache_info().hits == hits + 1
+
+        assert tool_a is tool_b
+        result = await tool_b.run({"text": "x"})
+        assert result.content[0].text == "second"
+
+    def test_format_tool_result(self):
+        """Test that structured tool results are rendered as compact JSON."""
+        from mcp_registry_server.server import _format_tool_result
+
+        assert _format_tool_result("plain text") == "plain text"
+        assert _format_tool_result({"content": [], "isError": False}) == (
+            '{"content":[],"isError":false}'
+        )
@@ -0,0 +1,173 @@
+"""Tests for the simplified MCP client."""
+
+import asyncio
+import sys
+
+import pytest
+
+from mcp_registry_server.mcp_client import MCPClient, MCPClientManager
+
+# Minimal stdio "server": answers `initialize` immediately, then buffers the next three
+# requests and answers them in reverse order, preceded by an unsolicited notification.
+FAKE_SERVER = r"""
+import json, sys
+
+def send(msg):
+    sys.stdout.write(json.dumps(msg) + "\n")
+    sys.stdout.flush()
+
+pending = []
+for line in sys.stdin:
+    msg = json.loads(line)
+    if "id" not in msg:
+        continue
+    if msg["method"] == "initialize":
+        send({"jsonrpc": "2.0", "id": msg["id"], "result": {"protocolVersion": "2024-11-05"}})
+        continue
+    pending.append(msg)
+    if len(pending) == 3:
+        send({"jsonrpc": "2.0", "method": "notifications/message", "params": {}})
+        for req in reversed(pending):
+            key = req["method"].split("/")[0]
+            send({"jsonrpc": "2.0", "id": req["id"], "result": {key: [{"name": key}]}})
+        pending.clear()
+"""
+
+
+async def _spawn_fake_server() -> asyncio.subprocess.Process:
+    return await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-c",
+        FAKE_SERVER,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+    )
+
+
+class TestMCPClient:
+    """Test MCP client request/response handling."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_matched_by_id(self):
+        """Test that concurrent requests each receive their own response."""
+        process = await _spawn_fake_server()
+        client = MCPClient(process)
+
+        try:
+            await client.initialize()
+            tools, resources, prompts = await asyncio.wait_for(
+                asyncio.gather(
+                    client.list_tools(), client.list_resources(), client.list_prompts()
+                ),
+                timeout=10.0,
+            )
+
+            assert tools == [{"name": "tools"}]
+            assert resources == [{"name": "resources"}]
+            assert prompts == [{"name": "prompts"}]
+            assert client._pending == {}
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_closed_connection_fails_request(self):
+        """Test that a server exiting fails the pending request."""
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-c",
+            "import sys; sys.stdin.readline()",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+        )
+        client = MCPClient(process)
+
+        try:
+            with pytest.raises(RuntimeError, match="closed connection"):
+                await client._send_request("tools/list")
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_discover_capabilities(self):
+        """Test that server discovery fans out the three list requests."""
+        from mcp_registry_server.server import _discover_capabilities
+
+        process = await _spawn_fake_server()
+        client = MCPClient(process)
+
+        try:
+            await client.initialize()
+            tools, resources, prompts = await _discover_capabilities(client, timeout=10.0)
+
+            assert tools == [{"name": "tools"}]
+            assert resources == [{"name": "resources"}]
+            assert prompts == [{"name": "prompts"}]
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_discover_capabilities_unwraps_failure(self):
+        """Test that a discovery failure is raised directly, not as an ExceptionGroup."""
+        from mcp_registry_server.server import _discover_capabilities
+
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-c",
+            "import sys; sys.stdin.readline()",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+        )
+        client = MCPClient(process)
+
+        try:
+            with pytest.raises(RuntimeError, match="closed connection"):
+                await _discover_capabilities(client, timeout=10.0)
+            assert client._pending == {}
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_call_tool_concurrency_is_bounded(self):
+        """Test that tool calls beyond the limit wait for a free slot."""
+        client = MCPClient(None, max_concurrent_calls=2)
+        client._initialized = True
+        in_flight = 0
+        peak = 0
+
+        async def fake_send_request(method, params=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"content": [{"type": "text", "text": params["name"]}]}
+
+        client._send_request = fake_send_request
+        results = await asyncio.gather(*(client.call_tool(f"t{i}", {}) for i in range(5)))
+
+        assert results == [f"t{i}" for i in range(5)]
+        assert peak == 2
+
+
+class TestMCPClientManager:
+    """Test MCP client bookkeeping."""
+
+    @pytest.mark.asyncio
+    async def test_get_client_drops_exited_process(self):
+        """Test that a client whose server exited is no longer handed out."""
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-c",
+            "pass",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+        )
+        manager = MCPClientManager()
+        client = MCPClient(process)
+        manager.register_client("dead", client, process)
+
+        await process.wait()
+
+        assert manager.get_client("dead") is None
+        assert manager.get_client("missing") is None
+        assert "dead" not in manager._clients
@@ -22,8 +22,7 @@ class TestToolListChangedNotifications:
         with patch("mcp_registry_server.server.initialize_registry", new_callable=AsyncMock):
             with patch("mcp_registry_server.server.registry") as mock_registry:
                 # Setup mock to return None (server not active)
-                mock_registry.get_active_mount = AsyncMock(return_value=None)
-                mock_registry.get_entry = AsyncMock(return_value=None)
+                mock_registry.get_entry_and_mount = AsyncMock(return_value=(None, None))
 
                 # Call the underlying function (not the FunctionTool wrapper)
                 # expect it to fail because entry doesn't exist
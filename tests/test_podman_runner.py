@@ -0,0 +1,106 @@
+"""Tests for the Podman runner."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from mcp_registry_server.podman_runner import PodmanRunner
+
+PINNED_IMAGE = "docker.io/mcp/postgres@sha256:" + "0" * 64
+
+
+class FakeProcess:
+    """Stand-in for an asyncio subprocess that exits with a fixed code."""
+
+    def __init__(self, returncode: int):
+        self.returncode = returncode
+
+    async def communicate(self) -> tuple[bytes, bytes]:
+        return b"", b""
+
+    async def wait(self) -> int:
+        return self.returncode
+
+
+@pytest.fixture
+def runner():
+    """Create a runner without requiring podman on the host."""
+    with patch.object(PodmanRunner, "_verify_podman_installed"):
+        return PodmanRunner()
+
+
+def _fake_podman(calls: list[tuple[str, ...]], image_present: bool):
+    async def create_subprocess_exec(*args, **kwargs):
+        calls.append(args[1:])
+        if args[1:3] == ("image", "exists"):
+            return FakeProcess(0 if image_present else 1)
+        return FakeProcess(0)
+
+    return create_subprocess_exec
+
+
+class TestPullImage:
+    """Test image pull skipping."""
+
+    @pytest.mark.asyncio
+    async def test_tagged_image_is_pulled_every_time(self, runner):
+        """Test that floating tags are re-pulled so they pick up updates."""
+        calls = []
+        with patch("asyncio.create_subprocess_exec", _fake_podman(calls, image_present=True)):
+            assert await runner.pull_image("docker.io/mcp/postgres:latest")
+            assert await runner.pull_image("docker.io/mcp/postgres:latest")
+
+        assert calls == [("pull", "docker.io/mcp/postgres:latest")] * 2
+
+    @pytest.mark.asyncio
+    async def test_present_pinned_image_is_not_pulled(self, runner):
+        """Test that a digest-pinned image already in local storage is reused."""
+        calls = []
+        with patch("asyncio.create_subprocess_exec", _fake_podman(calls, image_present=True)):
+            assert await runner.pull_image(PINNED_IMAGE)
+
+        assert calls == [("image", "exists", PINNED_IMAGE)]
+
+    @pytest.mark.asyncio
+    async def test_missing_pinned_image_is_pulled(self, runner):
+        """Test that a digest-pinned image removed from storage is pulled again."""
+        calls = []
+        with patch("asyncio.create_subprocess_exec", _fake_podman(calls, image_present=False)):
+            assert await runner.pull_image(PINNED_IMAGE)
+
+        assert calls == [("image", "exists", PINNED_IMAGE), ("pull", PINNED_IMAGE)]
+
+
+class TestCleanupAll:
+    """Test container teardown."""
+
+    @pytest.mark.asyncio
+    async def test_stops_containers_concurrently_with_kill_fallback(self, runner):
+        """Test that containers stop in parallel and failed stops fall back to kill."""
+        runner._running_containers = {f"c{i}": None for i in range(4)}
+        in_flight = 0
+        peak = 0
+        killed = []
+
+        async def stop_container(container_id, timeout=10):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return container_id != "c0"
+
+        async def kill_container(container_id):
+            killed.append(container_id)
+            return True
+
+        with (
+            patch.object(runner, "stop_container", side_effect=stop_container),
+            patch.object(runner, "kill_container", side_effect=kill_container),
+        ):
+            cleaned = await runner.cleanup_all()
+
+        assert cleaned == 4
+        assert peak == 4
+        assert killed == ["c0"]
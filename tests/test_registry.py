@@ -207,6 +207,19 @@ async def test_search_combined_filters(registry, sample_entries):
     assert all("Communication" in r.categories for r in results)
 
 
+@pytest.mark.asyncio
+async def test_search_exact_entry_id(registry, sample_entries):
+    """Test that an exact entry ID returns just that entry, subject to filters."""
+    await registry.bulk_add_entries(sample_entries)
+
+    results = await registry.search(SearchQuery(query="mcpservers/slack", limit=10))
+    assert [r.id for r in results] == ["mcpservers/slack"]
+
+    query = SearchQuery(query="mcpservers/slack", official_only=True, limit=10)
+    results = await registry.search(query)
+    assert all(r.id != "mcpservers/slack" for r in results)
+
+
 @pytest.mark.asyncio
 async def test_list_all(registry, sample_entries):
     """Test listing all entries."""
@@ -217,6 +230,33 @@ async def test_list_all(registry, sample_entries):
     assert len(all_entries) == len(sample_entries)
 
 
+@pytest.mark.asyncio
+async def test_list_page(registry, sample_entries):
+    """Test paginated listing reports the unpaginated total."""
+    await registry.bulk_add_entries(sample_entries)
+
+    page, total = await registry.list_page(limit=1)
+    assert len(page) == 1
+    assert total == len(sample_entries)
+
+    source_type = sample_entries[0].source
+    expected = [e for e in sample_entries if e.source == source_type]
+    page, total = await registry.list_page(limit=100, source_type=source_type)
+    assert [e.id for e in page] == [e.id for e in expected]
+    assert total == len(expected)
+
+
+@pytest.mark.asyncio
+async def test_list_negative_limit_returns_empty_page(registry, sample_entries):
+    """Test that a negative limit yields no entries instead of raising."""
+    await registry.bulk_add_entries(sample_entries)
+
+    assert await registry.list_all(limit=-1) == []
+    assert await registry.list_page(limit=-1) == ([], len(sample_entries))
+    page, total = await registry.list_page(limit=-1, source_type=sample_entries[0].source)
+    assert page == []
+    assert total > 0
+
 @pytest.mark.asyncio
 async def test_persistence(tmp_path, sample_entries):
     """Test that entries persist across registry instances."""
@@ -237,6 +277,29 @@ async def test_persistence(tmp_path, sample_entries):
         assert retrieved.name == entry.name
 
 
+@pytest.mark.asyncio
+async def test_persistence_skips_invalid_entries(tmp_path, sample_entries):
+    """Test that one invalid cached entry doesn't prevent loading the rest."""
+    import json
+
+    cache_dir = tmp_path / "cache"
+    sources_dir = tmp_path / "sources"
+
+    registry1 = Registry(cache_dir=cache_dir, sources_dir=sources_dir)
+    await registry1.bulk_add_entries(sample_entries)
+
+    cache_file = cache_dir / "registry_entries.json"
+    data = json.loads(cache_file.read_text())
+    data["entries"].append({"id": "broken/entry", "source": "not-a-source"})
+    cache_file.write_text(json.dumps(data))
+
+    registry2 = Registry(cache_dir=cache_dir, sources_dir=sources_dir)
+
+    assert await registry2.get_entry("broken/entry") is None
+    for entry in sample_entries:
+        assert await registry2.get_entry(entry.id) is not None
+
+
 @pytest.mark.asyncio
 async def test_active_mount_persistence(tmp_path, sample_entries):
     """Test that active mounts persist across registry instances."""
@@ -293,6 +356,49 @@ async def test_update_mount_environment(registry, sample_entries):
     assert "DATABASE_URL" in updated.environment
 
 
+@pytest.mark.asyncio
+async def test_get_entry_and_mount(registry, sample_entries):
+    """Test fetching an entry and its mount together."""
+    from mcp_registry_server.models import ActiveMount
+
+    await registry.bulk_add_entries(sample_entries)
+
+    entry, mount = await registry.get_entry_and_mount(sample_entries[0].id)
+    assert entry is not None
+    assert mount is None
+
+    await registry.add_active_mount(
+        ActiveMount(entry_id=entry.id, name=entry.name, prefix="postgres")
+    )
+    entry, mount = await registry.get_entry_and_mount(sample_entries[0].id)
+    assert entry.id == sample_entries[0].id
+    assert mount is not None and mount.prefix == "postgres"
+
+    assert await registry.get_entry_and_mount("missing") == (None, None)
+
+
+@pytest.mark.asyncio
+async def test_get_mount_by_prefix(registry, sample_entries):
+    """Test looking up active mounts by tool prefix."""
+    from mcp_registry_server.models import ActiveMount
+
+    await registry.bulk_add_entries(sample_entries)
+
+    first = ActiveMount(entry_id=sample_entries[0].id, name="first", prefix="shared")
+    second = ActiveMount(entry_id=sample_entries[1].id, name="second", prefix="shared")
+    await registry.add_active_mount(first)
+    await registry.add_active_mount(second)
+
+    assert await registry.get_mount_by_prefix("shared") is second
+    assert await registry.get_mount_by_prefix("missing") is None
+
+    await registry.remove_active_mount(second.entry_id)
+    assert await registry.get_mount_by_prefix("shared") is first
+
+    await registry.remove_active_mount(first.entry_id)
+    assert await registry.get_mount_by_prefix("shared") is None
+
+
 @pytest.mark.asyncio
 async def test_remove_active_mount(registry, sample_entries):
     """Test removing an active mount."""
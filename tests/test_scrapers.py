@@ -1,9 +1,22 @@
 """Tests for registry scrapers."""
 
+import asyncio
+import time
 from dataclasses import dataclass, field
 
+import httpx
 import pytest
-from mcp_registry_server.models import LaunchMethod, SourceType
+from mcp_registry_server.models import LaunchMethod, RegistryEntry, SourceType
+from mcp_registry_server.scrapers import github_utils, mcpservers_scraper
+from mcp_registry_server.scrapers.github_utils import (
+    GitHubStarsStore,
+    fetch_github_stars,
+    populate_github_stars,
+)
+from mcp_registry_server.scrapers.mcp_official_registry import (
+    _extract_tags_from_description,
+    _normalize_server,
+)
 from mcp_registry_server.scrapers.mcpservers_scraper import _normalize_server_info
 
 
@@ -128,3 +141,243 @@ class TestMCPServersScraper:
 
         entry2 = _normalize_server_info(server_without_key)
         assert entry2.requires_api_key is False
+
+    def test_scrape_semaphore_is_per_event_loop(self):
+        """Scrapes admitted from a second event loop get their own semaphore."""
+
+        async def contend() -> asyncio.BoundedSemaphore:
+            sem = mcpservers_scraper._scrape_sem()
+
+            async def hold():
+                async with sem:
+                    await asyncio.sleep(0)
+
+            await asyncio.gather(hold(), hold())
+            return sem
+
+        assert asyncio.run(contend()) is not asyncio.run(contend())
+
+
+class TestGitHubStarsStore:
+    """Tests for the persistent GitHub stars snapshot."""
+
+    @staticmethod
+    def _entry(repo_url: str) -> RegistryEntry:
+        return RegistryEntry(
+            id="docker/test",
+            name="Test",
+            description="Test entry",
+            source=SourceType.DOCKER,
+            repo_url=repo_url,
+        )
+
+    def test_roundtrip_and_expiry(self, tmp_path):
+        """Fresh rows are loaded; expired rows only expose their ETag."""
+        store = GitHubStarsStore(db_path=tmp_path / "stars.sqlite", ttl_seconds=60)
+        now = time.time()
+        store.save(
+            [
+                ("owner/fresh", 10, '"a"', now),
+                ("owner/stale", 20, '"b"', now - 120),
+            ]
+        )
+
+        assert store.load_fresh() == {"owner/fresh": 10}
+        assert store.load_etags()["owner/stale"] == (20, '"b"')
+
+    async def test_populate_skips_http_for_fresh_rows(self, tmp_path):
+        """Warm starts serve fresh rows without any GitHub request."""
+        store = GitHubStarsStore(db_path=tmp_path / "stars.sqlite")
+        store.save([("owner/repo", 42, None, time.time())])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise AssertionError(f"unexpected request: {request.url}")
+
+        entry = self._entry("https://github.com/owner/repo")
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            await populate_github_stars([entry], client, store)
+
+        assert entry.raw_metadata["github_stars"] == 42
+
+    async def test_populate_revalidates_with_etag(self, tmp_path):
+        """Expired rows send If-None-Match and reuse the cached count on 304."""
+        store = GitHubStarsStore(db_path=tmp_path / "stars.sqlite", ttl_seconds=60)
+        store.save([("owner/repo", 7, '"etag-1"', time.time() - 120)])
+        seen_headers = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_headers.append(request.headers.get("If-None-Match"))
+            return httpx.Response(304)
+
+        entry = self._entry("https://github.com/owner/repo")
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            await populate_github_stars([entry], client, store)
+
+        assert seen_headers == ['"etag-1"']
+        assert entry.raw_metadata["github_stars"] == 7
+        assert store.load_fresh() == {"owner/repo": 7}
+
+
+    async def test_populate_fetches_when_cache_dir_unwritable(self, tmp_path, monkeypatch):
+        """An unusable cache directory falls back to fetching stars from GitHub."""
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        monkeypatch.setattr(github_utils, "DEFAULT_STARS_DB", blocker / "stars.sqlite")
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"stargazers_count": 5})
+
+        entry = self._entry("https://github.com/owner/repo")
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            await populate_github_stars([entry], client)
+
+        assert entry.raw_metadata["github_stars"] == 5
+
+class TestMCPOfficialRegistryScraper:
+    """Tests for MCP Official Registry normalization."""
+
+    @staticmethod
+    def _server_data(**server_overrides) -> dict:
+        server = {
+            "$schema": "https://example.com/server.schema.json",
+            "name": "io.github.user/weather",
+            "description": "Weather API for forecasts",
+            "version": "1.2.0",
+            "repository": {"url": "https://github.com/user/weather", "source": "github"},
+            "packages": [{"registryType": "oci", "identifier": "docker.io/user/weather"}],
+            "remotes": [],
+            **server_overrides,
+        }
+        return {
+            "server": server,
+            "_meta": {
+                "io.modelcontextprotocol.registry/official": {
+                    "status": "active",
+                    "isLatest": True,
+                    "publishedAt": "2025-01-01T00:00:00Z",
+                    "updatedAt": "2025-01-02T00:00:00Z",
+                    "serverId": "srv-1",
+                    "versionId": "ver-1",
+                }
+            },
+        }
+
+    def test_normalize_full_record(self):
+        """All projected fields land on the entry."""
+        entry = _normalize_server(self._server_data())
+
+        assert entry.id == "mcp-official-io-github-user-weather"
+        assert entry.launch_method == LaunchMethod.PODMAN
+        assert entry.container_image == "docker.io/user/weather"
+        assert entry.repo_url == "https://github.com/user/weather"
+        assert entry.raw_metadata["version"] == "1.2.0"
+        assert entry.raw_metadata["server_id"] == "srv-1"
+        assert entry.raw_metadata["schema"] == "https://example.com/server.schema.json"
+
+    def test_normalize_missing_optional_keys(self):
+        """Records without packages/remotes/$schema fall back to defaults."""
+        data = self._server_data()
+        for key in ("packages", "remotes", "$schema", "version"):
+            del data["server"][key]
+        del data["_meta"]["io.modelcontextprotocol.registry/official"]["versionId"]
+
+        entry = _normalize_server(data)
+
+        assert entry.launch_method == LaunchMethod.UNKNOWN
+        assert entry.raw_metadata["version"] == ""
+        assert entry.raw_metadata["schema"] is None
+        assert entry.raw_metadata["version_id"] is None
+
+    def test_normalize_skips_inactive_and_old_versions(self):
+        """Inactive or non-latest records are dropped."""
+        inactive = self._server_data()
+        inactive["_meta"]["io.modelcontextprotocol.registry/official"]["status"] = "deleted"
+        old = self._server_data()
+        del old["_meta"]["io.modelcontextprotocol.registry/official"]["isLatest"]
+
+        assert _normalize_server(inactive) is None
+        assert _normalize_server(old) is None
+
+    def test_extract_tags_returns_fresh_list(self):
+        """Memoized tag extraction must not leak the cached value to callers."""
+        tags = _extract_tags_from_description("GitHub API search for Docker images")
+        assert tags == ["github", "api", "search", "docker"]
+
+        tags.append("mutated")
+        assert _extract_tags_from_description("GitHub API search for Docker images") == [
+            "github",
+            "api",
+            "search",
+            "docker",
+        ]
+
+
+class TestGitHubRateLimit:
+    """Tests for the shared GitHub API limiter."""
+
+    async def test_exhausted_quota_skips_requests(self, monkeypatch):
+        """Once GitHub reports zero remaining calls, later calls are not sent."""
+        monkeypatch.setattr(github_utils, "_rate_limit_reset_at", 0.0)
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url)
+            return httpx.Response(
+                200,
+                json={"stargazers_count": 5},
+                headers={
+                    "X-RateLimit-Remaining": "0",
+                    "X-RateLimit-Reset": str(int(time.time()) + 3600),
+                },
+            )
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            first = await fetch_github_stars("https://github.com/owner/one", client)
+            second = await fetch_github_stars("https://github.com/owner/two", client)
+
+        assert first == 5
+        assert second is None
+        assert len(calls) == 1
+
+    async def test_anonymous_burst_is_paced(self, monkeypatch):
+        """Without a token, calls beyond the anonymous budget wait for the bucket to refill."""
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.setattr(github_utils, "_rate_limit_reset_at", 0.0)
+        monkeypatch.setattr(github_utils, "_gh_limiters", github_utils.weakref.WeakKeyDictionary())
+        monkeypatch.setattr(github_utils, "_GH_ANON_RATE", 2)
+        monkeypatch.setattr(github_utils, "_GH_RATE_PERIOD_SECONDS", 0.4)
+        seen_auth = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_auth.append(request.headers.get("Authorization"))
+            return httpx.Response(200, json={"stargazers_count": 1})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            started = time.monotonic()
+            for name in ("a", "b", "c"):
+                await fetch_github_stars(f"https://github.com/owner/{name}", client)
+            elapsed = time.monotonic() - started
+
+        assert elapsed >= 0.15
+        assert seen_auth == [None, None, None]
+
+    async def test_token_is_sent_and_raises_budget(self, monkeypatch):
+        """With GITHUB_TOKEN set, calls authenticate and use the authenticated budget."""
+        monkeypatch.setenv("GITHUB_TOKEN", "secret")
+        monkeypatch.setattr(github_utils, "_rate_limit_reset_at", 0.0)
+        monkeypatch.setattr(github_utils, "_gh_limiters", github_utils.weakref.WeakKeyDictionary())
+        monkeypatch.setattr(github_utils, "_GH_ANON_RATE", 1)
+        seen_auth = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_auth.append(request.headers.get("Authorization"))
+            return httpx.Response(200, json={"stargazers_count": 1})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            started = time.monotonic()
+            for name in ("a", "b", "c"):
+                await fetch_github_stars(f"https://github.com/owner/{name}", client)
+            elapsed = time.monotonic() - started
+
+        assert elapsed < 1.0
+        assert seen_auth == ["Bearer secret"] * 3
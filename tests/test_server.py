@@ -0,0 +1,126 @@
+"""Tests for server tool entry points."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from mcp_registry_server import server
+
+
+class TestRegistryAdd:
+    """Test registry_add activation handling."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_adds_of_same_entry_are_serialized(self):
+        """Test that two registry_add calls for one entry never overlap."""
+        active = 0
+        max_active = 0
+
+        async def slow_lookup(entry_id):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return None, None
+
+        with patch("mcp_registry_server.server._initialized", True):
+            with patch("mcp_registry_server.server.registry") as mock_registry:
+                mock_registry.get_entry_and_mount = AsyncMock(side_effect=slow_lookup)
+
+                results = await asyncio.gather(
+                    server.registry_add.fn(entry_id="same-entry", prefix=None, ctx=None),
+                    server.registry_add.fn(entry_id="same-entry", prefix=None, ctx=None),
+                    server.registry_add.fn(entry_id="other-entry", prefix=None, ctx=None),
+                )
+
+        assert results[0] == "Entry not found: same-entry"
+        assert max_active == 2  # Only the unrelated entry ran alongside
+        assert mock_registry.get_entry_and_mount.await_count == 3
+        assert "same-entry" not in server._add_locks
+
+
+class TestRegistryExec:
+    """Test registry_exec tool name handling."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("tool_name", ["read_file", "mcp_fs", "mcp_fs_", "mcp__read"])
+    async def test_rejects_malformed_tool_names(self, tool_name):
+        """Test that names not shaped like mcp_prefix_toolname are rejected."""
+        with patch("mcp_registry_server.server._initialized", True):
+            result = await server.registry_exec.fn(tool_name=tool_name, arguments={})
+
+        assert result.startswith("Invalid tool name format")
+
+    @pytest.mark.asyncio
+    async def test_splits_prefix_from_tool_name(self):
+        """Test that the prefix ends at the first underscore after mcp_."""
+        with patch("mcp_registry_server.server._initialized", True):
+            with patch("mcp_registry_server.server.registry") as mock_registry:
+                mock_registry.get_mount_by_prefix = AsyncMock(return_value=None)
+                result = await server.registry_exec.fn(tool_name="mcp_fs_read_file", arguments={})
+
+        mock_registry.get_mount_by_prefix.assert_awaited_once_with("fs")
+        assert result == "No active server found with prefix: fs"
+
+
+class TestRegistryRefresh:
+    """Test registry_refresh result reporting."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_all_reports_each_source(self):
+        """Test that every source is refreshed and a raised error is reported."""
+
+        async def force_refresh(source_type):
+            if source_type == server.SourceType.MCPSERVERS:
+                raise RuntimeError("scrape failed")
+            return True
+
+        with patch("mcp_registry_server.server._initialized", True):
+            with patch("mcp_registry_server.server.refresh_scheduler") as mock_scheduler:
+                mock_scheduler.force_refresh = AsyncMock(side_effect=force_refresh)
+                result = await server.registry_refresh.fn(source="all")
+
+        assert "- docker: Success" in result
+        assert "- mcpservers: Failed: scrape failed" in result
+        assert mock_scheduler.force_refresh.await_count == 2
+
+
+class TestShutdownRegistry:
+    """Test registry shutdown."""
+
+    @pytest.mark.asyncio
+    async def test_shutdown_holds_init_lock_until_cleanup_finishes(self):
+        """Test that teardown runs under the init lock and clears globals last."""
+        lock_held = []
+
+        async def stop():
+            lock_held.append(server._init_lock.locked())
+            assert server._initialized
+
+        scheduler = MagicMock(stop=AsyncMock(side_effect=stop))
+        clients = MagicMock(close_all=AsyncMock())
+        podman = MagicMock(cleanup_all=AsyncMock())
+        stdio = MagicMock(cleanup_all=AsyncMock())
+
+        with patch.multiple(
+            server,
+            _initialized=True,
+            registry=MagicMock(),
+            refresh_scheduler=scheduler,
+            mcp_client_manager=clients,
+            podman_runner=podman,
+            stdio_runner=stdio,
+        ):
+            await server.shutdown_registry()
+
+            assert not server._initialized
+            assert server.registry is None
+            assert server.podman_runner is None
+            assert server.stdio_runner is None
+
+        assert lock_held == [True]
+        clients.close_all.assert_awaited_once()
+        podman.cleanup_all.assert_awaited_once()
+        stdio.cleanup_all.assert_awaited_once()
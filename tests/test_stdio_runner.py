@@ -1,12 +1,15 @@
 """Tests for stdio server runner."""
 
 import asyncio
+import signal
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from mcp_registry_server.stdio_runner import (
     StdioServerRunner,
+    _which_cached,
     build_server_command,
     parse_server_command,
     validate_command_available,
@@ -34,6 +37,12 @@ class TestParseServerCommand:
         assert command == "python"
         assert args == ["-m", "my_server", "--verbose", "--port", "3000"]
 
+    def test_quoted_args(self):
+        """Test that quoted arguments containing spaces stay whole."""
+        command, args = parse_server_command('node "My Server/index.js" --name \'a b\'')
+        assert command == "node"
+        assert args == ["My Server/index.js", "--name", "a b"]
+
     def test_empty_command(self):
         """Test parsing empty command raises error."""
         with pytest.raises(ValueError, match="Command string is empty"):
@@ -74,6 +83,19 @@ class TestValidateCommandAvailable:
         assert is_available is True
         assert "python" in message.lower()
 
+    @pytest.mark.asyncio
+    async def test_version_probe_runs_once(self):
+        """Test that the --version subprocess is only spawned on the first check."""
+        first = await validate_command_available("python")
+
+        with patch(
+            "mcp_registry_server.stdio_runner.asyncio.create_subprocess_exec"
+        ) as mock_exec:
+            second = await validate_command_available("python")
+
+        assert second == first
+        mock_exec.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_nonexistent_command(self):
         """Test that nonexistent command is not available."""
@@ -84,6 +106,23 @@ class TestValidateCommandAvailable:
         assert "not found" in message.lower()
 
 
+class TestWhichCached:
+    """Test memoized command resolution."""
+
+    def test_resolves_and_caches(self, tmp_path):
+        """Test that lookups are cached per (command, PATH) pair."""
+        script = tmp_path / "fake-mcp-server"
+        script.write_text("#!/bin/sh\n")
+        script.chmod(0o755)
+        path = str(tmp_path)
+        _which_cached.cache_clear()
+
+        assert _which_cached("fake-mcp-server", path) == str(script)
+        assert _which_cached("fake-mcp-server", path) == str(script)
+        assert _which_cached.cache_info().hits == 1
+        assert _which_cached("fake-mcp-server", path + "-other") is None
+
+
 class TestStdioServerRunner:
     """Test stdio server runner."""
 
@@ -110,7 +149,7 @@ class TestStdioServerRunner:
             assert process.pid is not None
 
             # Verify it's running
-            assert await runner.is_running("test-sleep")
+            assert runner.is_running("test-sleep")
 
         finally:
             await runner.cleanup_all()
@@ -128,6 +167,34 @@ class TestStdioServerRunner:
                 env=None,
             )
 
+    @pytest.mark.asyncio
+    async def test_spawn_immediate_exit_raises(self):
+        """Test that a process dying during startup is reported as a failure."""
+        runner = StdioServerRunner()
+
+        with pytest.raises(RuntimeError, match="exited immediately with code 3"):
+            await runner.spawn_server(
+                server_id="test-exit", command="sh", args=["-c", "exit 3"], env=None
+            )
+
+        assert "test-exit" not in runner._processes
+
+    @pytest.mark.asyncio
+    async def test_spawn_failure_with_inherited_stderr_does_not_hang(self):
+        """Test that a grandchild holding stderr open can't block failure reporting."""
+        runner = StdioServerRunner()
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await asyncio.wait_for(
+                runner.spawn_server(
+                    server_id="test-orphan",
+                    command="sh",
+                    args=["-c", "echo boom >&2; sleep 5 & exit 1"],
+                    env=None,
+                ),
+                timeout=3.0,
+            )
+
     @pytest.mark.asyncio
     async def test_spawn_duplicate_server_id(self):
         """Test spawning with duplicate server_id raises error."""
@@ -158,18 +225,130 @@ class TestStdioServerRunner:
             )
 
             # Verify it's running
-            assert await runner.is_running("test-stop")
+            assert runner.is_running("test-stop")
 
             # Stop the server
             stopped = await runner.stop_server("test-stop")
             assert stopped is True
 
             # Verify it's no longer running
-            assert not await runner.is_running("test-stop")
+            assert not runner.is_running("test-stop")
+
+        finally:
+            await runner.cleanup_all()
+
+    @pytest.mark.asyncio
+    async def test_stop_server_reaches_grandchildren(self):
+        """Test that stopping a server also terminates processes it forked."""
+        runner = StdioServerRunner()
+
+        try:
+            _, process = await runner.spawn_server(
+                server_id="test-tree",
+                command="sh",
+                args=["-c", "sleep 60 & echo $!; exec sleep 60"],
+                env=None,
+            )
+            grandchild_pid = int(await asyncio.wait_for(process.stdout.readline(), timeout=5.0))
+
+            assert await runner.stop_server("test-tree") is True
+
+            status_file = Path(f"/proc/{grandchild_pid}/status")
+            for _ in range(50):
+                if not status_file.exists() or "State:\tZ" in status_file.read_text():
+                    break
+                await asyncio.sleep(0.05)
+            else:
+                pytest.fail("grandchild process survived stop_server")
+        finally:
+            await runner.cleanup_all()
+
+    @pytest.mark.asyncio
+    async def test_chatty_stderr_does_not_block_server(self):
+        """Test that stderr is drained so a server writing lots of it keeps running."""
+        runner = StdioServerRunner()
+        chatty = "import sys; sys.stderr.write('x' * 1_000_000); sys.stderr.flush(); print('done')"
+
+        try:
+            _, process = await runner.spawn_server(
+                server_id="test-chatty", command="python", args=["-c", chatty], env=None
+            )
+            line = await asyncio.wait_for(process.stdout.readline(), timeout=5.0)
+            assert line == b"done\n"
+        finally:
+            await runner.cleanup_all()
+
+        assert runner._stderr_drains == {}
+
+    @pytest.mark.asyncio
+    async def test_stop_already_exited_server(self):
+        """Test that stopping a server that already exited only kills its leftover group."""
+        runner = StdioServerRunner()
+        _, process = await runner.spawn_server(
+            server_id="test-gone", command="sleep", args=["0.2"], env=None
+        )
+        await asyncio.wait_for(process.wait(), timeout=5.0)
+
+        with patch("mcp_registry_server.stdio_runner._signal_group") as mock_signal:
+            assert await runner.stop_server("test-gone") is True
+
+        mock_signal.assert_called_once_with(process.pid, signal.SIGKILL)
+        assert "test-gone" not in runner._processes
+
+    @pytest.mark.asyncio
+    async def test_stop_exited_server_kills_orphaned_grandchild(self):
+        """Test that a wrapper exiting first doesn't leave its forked child running."""
+        runner = StdioServerRunner()
 
+        try:
+            _, process = await runner.spawn_server(
+                server_id="test-orphan",
+                command="sh",
+                args=["-c", "sleep 60 & echo $!; sleep 0.3; exit 0"],
+                env=None,
+            )
+            grandchild_pid = int(await asyncio.wait_for(process.stdout.readline(), timeout=5.0))
+            # The grandchild holds the pipes open, so poll the exit status instead of wait()
+            for _ in range(100):
+                if process.returncode is not None:
+                    break
+                await asyncio.sleep(0.05)
+            assert process.returncode == 0
+
+            assert await runner.stop_server("test-orphan") is True
+
+            status_file = Path(f"/proc/{grandchild_pid}/status")
+            for _ in range(50):
+                if not status_file.exists() or "State:\tZ" in status_file.read_text():
+                    break
+                await asyncio.sleep(0.05)
+            else:
+                pytest.fail("grandchild process survived stop_server")
+            assert runner.list_running() == {}
         finally:
             await runner.cleanup_all()
 
+    @pytest.mark.asyncio
+    async def test_cancelled_stop_still_kills_server(self):
+        """Test that cancelling stop_server mid-grace-period force kills the server."""
+        runner = StdioServerRunner()
+        _, process = await runner.spawn_server(
+            server_id="test-stubborn",
+            command="sh",
+            args=["-c", "trap '' TERM; while :; do sleep 0.1; done"],
+            env=None,
+        )
+
+        stop = asyncio.create_task(runner.stop_server("test-stubborn", timeout=30.0))
+        await asyncio.sleep(0.1)
+        stop.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await stop
+
+        await asyncio.wait_for(process.wait(), timeout=5.0)
+        assert process.returncode == -9
+        await runner.cleanup_all()
+
     @pytest.mark.asyncio
     async def test_stop_nonexistent_server(self):
         """Test stopping nonexistent server returns False."""
@@ -185,7 +364,7 @@ class TestStdioServerRunner:
 
         try:
             # Should return False before spawning
-            assert not await runner.is_running("test-running")
+            assert not runner.is_running("test-running")
 
             # Spawn a server
             await runner.spawn_server(
@@ -193,13 +372,13 @@ class TestStdioServerRunner:
             )
 
             # Should return True after spawning
-            assert await runner.is_running("test-running")
+            assert runner.is_running("test-running")
 
             # Stop the server
             await runner.stop_server("test-running")
 
             # Should return False after stopping
-            assert not await runner.is_running("test-running")
+            assert not runner.is_running("test-running")
 
         finally:
             await runner.cleanup_all()
@@ -211,7 +390,7 @@ class TestStdioServerRunner:
 
         try:
             # Should return None before spawning
-            assert await runner.get_server_pid("test-pid") is None
+            assert runner.get_server_pid("test-pid") is None
 
             # Spawn a server
             server_id, process = await runner.spawn_server(
@@ -219,7 +398,7 @@ class TestStdioServerRunner:
             )
 
             # Should return the PID
-            pid = await runner.get_server_pid("test-pid")
+            pid = runner.get_server_pid("test-pid")
             assert pid == process.pid
             assert pid is not None
 
@@ -227,7 +406,7 @@ class TestStdioServerRunner:
             await runner.stop_server("test-pid")
 
             # Should return None after stopping
-            assert await runner.get_server_pid("test-pid") is None
+            assert runner.get_server_pid("test-pid") is None
 
         finally:
             await runner.cleanup_all()
@@ -270,6 +449,24 @@ class TestStdioServerRunner:
         finally:
             await runner.cleanup_all()
 
+    @pytest.mark.asyncio
+    async def test_list_running_drops_exited_server(self):
+        """Test that a server exiting on its own disappears from the listing."""
+        runner = StdioServerRunner()
+
+        try:
+            _, process = await runner.spawn_server(
+                server_id="test-short", command="sleep", args=["0.3"], env=None
+            )
+            assert runner.list_running() == {"test-short": process.pid}
+
+            await asyncio.wait_for(asyncio.gather(*runner._exit_watchers), timeout=5.0)
+            await asyncio.sleep(0)
+
+            assert runner.list_running() == {}
+        finally:
+            await runner.cleanup_all()
+
     @pytest.mark.asyncio
     async def test_cleanup_all(self):
         """Test cleaning up all servers."""
@@ -307,7 +504,32 @@ class TestStdioServerRunner:
             # Verify it started successfully
             assert server_id == "test-env"
             assert process.pid is not None
-            assert await runner.is_running("test-env")
+            assert runner.is_running("test-env")
 
         finally:
             await runner.cleanup_all()
+
+    @pytest.mark.asyncio
+    async def test_cleanup_all_stops_servers_concurrently(self):
+        """Test that grace periods of stubborn servers overlap during cleanup."""
+        runner = StdioServerRunner()
+        ignore_term = ["-c", "trap '' TERM; while :; do sleep 0.1; done"]
+
+        for i in range(3):
+            await runner.spawn_server(
+                server_id=f"stubborn-{i}", command="sh", args=ignore_term, env=None
+            )
+
+        original_stop = runner.stop_server
+
+        async def quick_stop(server_id):
+            return await original_stop(server_id, timeout=0.5)
+
+        runner.stop_server = quick_stop
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await runner.cleanup_all()
+        elapsed = loop.time() - started
+
+        assert runner._processes == {}
+        assert elapsed < 1.4  # Serial shutdown would take at least 1.5s
@@ -0,0 +1,96 @@
+"""Tests for the background refresh scheduler."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from mcp_registry_server.models import SourceType
+from mcp_registry_server.registry import Registry
+from mcp_registry_server.tasks import RefreshScheduler
+
+
+@pytest.fixture
+async def scheduler(tmp_path):
+    """Create a refresh scheduler over a temporary registry."""
+    registry = Registry(
+        cache_dir=tmp_path / "cache",
+        sources_dir=tmp_path / "sources",
+        refresh_interval_hours=1,
+    )
+    return RefreshScheduler(registry)
+
+
+class TestRefreshSource:
+    """Test refresh dispatch and deduplication."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_of_one_source_run_once(self, scheduler):
+        """Test that a second trigger waits for the in-flight refresh."""
+        calls = 0
+
+        async def slow_scrape(sources_dir):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return []
+
+        with patch("mcp_registry_server.tasks.scrape_docker_registry", side_effect=slow_scrape):
+            await asyncio.gather(
+                scheduler._refresh_source(SourceType.DOCKER),
+                scheduler._refresh_source(SourceType.DOCKER),
+            )
+
+        assert calls == 1
+        assert scheduler._inflight == {}
+        assert scheduler.registry._source_status[SourceType.DOCKER].status == "ok"
+
+
+class TestSchedulerLifecycle:
+    """Test starting and stopping the scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_all_refresh_tasks(self, scheduler):
+        """Test that stop tears down the loops and any in-flight refresh."""
+        started = asyncio.Event()
+
+        async def hanging_refresh(source_type):
+            started.set()
+            await asyncio.sleep(3600)
+
+        with patch.object(scheduler, "_refresh_source", side_effect=hanging_refresh):
+            await scheduler.start()
+            await asyncio.wait_for(started.wait(), timeout=1.0)
+            run_task = scheduler._run_task
+            await asyncio.wait_for(scheduler.stop(), timeout=1.0)
+
+        assert run_task.done()
+        assert scheduler._run_task is None
+        assert not scheduler._running
+
+    @pytest.mark.asyncio
+    async def test_force_refresh_wakes_periodic_loop(self, scheduler):
+        """Test that force_refresh cuts a long loop sleep short."""
+        checks = 0
+
+        async def should_refresh(source_type):
+            nonlocal checks
+            checks += 1
+            return False
+
+        scheduler._running = True
+        scheduler._check_interval = 3600
+        with (
+            patch.object(scheduler.registry, "should_refresh_source", side_effect=should_refresh),
+            patch.object(scheduler, "_refresh_source"),
+        ):
+            loop_task = asyncio.create_task(scheduler._periodic_refresh_loop(SourceType.DOCKER))
+            await asyncio.sleep(0.01)
+            assert checks == 1
+
+            await scheduler.force_refresh(SourceType.DOCKER)
+            await asyncio.sleep(0.01)
+            assert checks == 2
+
+            loop_task.cancel()
+            await asyncio.gather(loop_task, return_exceptions=True)